@@ -1,8 +1,9 @@
-from core.api.paginators import BasePaginator
+from core.api.paginators import BaseCursorPaginator
 
 
-class CommentsPaginator(BasePaginator):
+class CommentsCursorPaginator(BaseCursorPaginator):
     """
-    By default, we use the same pagination settings for posts and comments
+    Comments are paginated in (created_at, id) order
+    using (post, created_at, id) index
     """
     pass
@@ -112,6 +112,56 @@ class Tests(APITestCase):
             2
         )
 
+    def test_get_post_comments_cursor(self) -> None:
+        """
+        Tests post comments keyset pagination
+        :return:
+        """
+
+        Comment.objects.bulk_create(
+            Comment(
+                post=self.post,
+                text="Comment {}".format(index),
+                author=self.standard_user
+            )
+            for index in range(20)
+        )
+        url = reverse(
+            "blog:api_post_comments",
+            kwargs={
+                Post.Field.slug: self.post.slug
+            }
+        )
+
+        # Post, comments with authors
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        self.assertEqual(
+            response.status_code,
+            HTTP_200_OK
+        )
+        # No total count, opaque cursors
+        self.assertNotIn("count", response.data)
+        self.assertEqual(
+            response.data.get("results")[0],
+            {
+                Postable.Field.author: self.standard_user.email,
+                Postable.Field.text: "First comment text"
+            }
+        )
+
+        texts = []
+        while url:
+            response = self.client.get(url)
+            texts += [
+                comment.get(Postable.Field.text)
+                for comment in response.data.get("results")
+            ]
+            url = response.data.get("next")
+        self.assertEqual(len(texts), 22)
+        self.assertEqual(len(set(texts)), 22)
+
     def test_comment_non_auth_user(self) -> None:
         """
         Tests non existing post comment create routine
@@ -10,15 +10,14 @@ from rest_framework.status import (
 )
 
 from .....constants import (
-    COMMENTS_ORDERING,
     ERROR_KEY,
     ERROR_MSG_NO_POST_SLUG,
     ERROR_MSG_NO_POST,
     ERROR_MSG_MULTIPLE_POSTS
 )
-from .....models import Post, Comment
+from .....models import Comment, Post, Postable
 
-from .paginators import CommentsPaginator
+from .paginators import CommentsCursorPaginator
 from .permissions import CommentPermissions
 from .serializers import GetComments, PostComment
 from .validators import CommentValidator
@@ -27,11 +26,12 @@ from .validators import CommentValidator
 class Comments(ListCreateAPIView):
     """
     Manages post comments listing and new comment creation
+    (comments are listed using keyset pagination to keep
+    posts with thousands of comments fast)
     """
 
-    queryset = Comment.objects.all()
-    order_by = COMMENTS_ORDERING
-    pagination_class = CommentsPaginator
+    queryset = Comment.objects.select_related(Postable.Field.author)
+    pagination_class = CommentsCursorPaginator
     permission_classes = [CommentPermissions]
 
     def get_serializer_class(self):
@@ -160,9 +160,8 @@ class Comments(ListCreateAPIView):
                 }
             )
 
-        queryset = post.comments.all().order_by(
-            COMMENTS_ORDERING
-        )
+        # Cursor paginator orders comments by (created_at, id)
+        queryset = self.get_queryset().filter(post=post)
 
         # Should we use pagination?
         page = self.paginate_queryset(queryset)
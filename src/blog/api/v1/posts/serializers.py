@@ -1,7 +1,8 @@
 from rest_framework.serializers import (
-    ModelSerializer, SerializerMethodField
+    CharField, FloatField, ModelSerializer, SerializerMethodField
 )
 
+from ....managers import PostManager
 from ....models import Post, Postable
 
 
@@ -40,6 +41,22 @@ class GetListSerializer(GetRelatedFields):
             ]
 
 
+class SearchResultsSerializer(GetListSerializer):
+    """
+    Manages search results serialization: list data
+    in common with relevance and highlighted snippet
+    """
+
+    rank = FloatField(read_only=True)
+    snippet = CharField(read_only=True)
+
+    class Meta(GetListSerializer.Meta):
+        fields = GetListSerializer.Meta.fields + [
+            PostManager.RANK,
+            PostManager.SNIPPET
+        ]
+
+
 class GetDetailsSerializer(GetRelatedFields):
     """
     Manages blog object details serialization
@@ -140,6 +140,33 @@ class Posts(BaseTest):
                 response.data.get("results")[0]
                 )
 
+    def test_posts_list_queries(self) -> None:
+        for index in range(100):
+            post = Post.objects.create(
+                title="Post {}".format(index),
+                author=self.standard_user,
+                excerpt="Post {} excerpt".format(index),
+                text="Post {} text".format(index),
+                slug="post-{}".format(index),
+                status=self.active_status
+            )
+            post.tags.add(self.first_tag, self.second_tag)
+
+        # Page count, posts with authors and statuses, tags
+        with self.assertNumQueries(3):
+            response = self.client.get(
+                reverse("blog:api_posts", query={"page_size": 100})
+            )
+
+        self.assertEqual(
+            len(response.data.get("results")),
+            100
+        )
+        self.assertEqual(
+            response.data.get("results")[0].get(Post.Field.tags),
+            [self.first_tag.name, self.second_tag.name]
+        )
+
     def test_search_posts(self) -> None:
         response = self.client.get(
             reverse(
@@ -167,6 +194,40 @@ class Posts(BaseTest):
             "First post excerpt",
             response.data.get("results")[0].get("excerpt")
         )
+        self.assertGreater(response.data.get("results")[0].get("rank"), 0)
+        self.assertIn(
+            "<mark>",
+            response.data.get("results")[0].get("snippet")
+        )
+
+    def test_search_posts_partial_query(self) -> None:
+        response = self.client.get(
+            reverse(
+                "blog:api_search",
+                query={
+                    "q": "Firs"
+                }
+            ),
+        )
+
+        self.assertEqual(
+            response.status_code,
+            HTTP_200_OK
+        )
+        self.assertEqual(
+            len(response.data.get("results")),
+            1
+        )
+
+    def test_search_posts_no_query(self) -> None:
+        response = self.client.get(
+            reverse("blog:api_search"),
+        )
+
+        self.assertEqual(
+            response.status_code,
+            HTTP_422_UNPROCESSABLE_ENTITY
+        )
 
     def test_post_details(self) -> None:
         response = self.client.get(
@@ -1,6 +1,9 @@
 from typing import List
+from pydantic import Field
 from pyngo import QueryDictModel
 
+from ....constants import POSTS_SEARCH_MAX_LENGTH
+
 
 class PostValidator(QueryDictModel):
     """
@@ -12,3 +15,11 @@ class PostValidator(QueryDictModel):
     excerpt: str
     text: str
     tags: List[int]
+
+
+class SearchPostsValidator(QueryDictModel):
+    """
+    Pydantic model for posts search parameters validation
+    """
+
+    q: str = Field(min_length=1, max_length=POSTS_SEARCH_MAX_LENGTH)
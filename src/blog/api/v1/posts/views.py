@@ -1,6 +1,7 @@
 import PIL
 from PIL import Image
 from pydantic import ValidationError
+from pyngo import drf_error_details
 
 from django.db.models import QuerySet
 
@@ -36,9 +37,10 @@ from .permissions import PostPermissions
 from .serializers import (
     GetListSerializer,
     GetDetailsSerializer,
-    PostSerializer
+    PostSerializer,
+    SearchResultsSerializer
 )
-from .validators import PostValidator
+from .validators import PostValidator, SearchPostsValidator
 
 
 class Posts(ListCreateAPIView):
@@ -120,16 +122,50 @@ class Posts(ListCreateAPIView):
 
 class Search(ListAPIView):
     """
-    Manages post search routine
+    Manages post search routine (results are ranked by relevance)
     """
-    serializer_class = GetListSerializer
+    serializer_class = SearchResultsSerializer
     permission_classes = [PostPermissions]
     pagination_class = PostsPaginator
 
-    def get_queryset(self):
-        query = self.request.GET.get("q")
+    def get_queryset(self) -> QuerySet:
+        return Post.objects.search_posts(self.search_params.q)
+
+    def paginate_queryset(self, queryset: QuerySet) -> list | None:
+        posts = super().paginate_queryset(queryset)
+        # Snippets are made for serialized page only
+        if posts is not None:
+            posts = Post.objects.add_snippets(posts, self.search_params.q)
+        return posts
+
+    def list(
+            self,
+            request: Request,
+            *args: list,
+            **kwargs: dict
+    ) -> Response:
+        """
+        Posts search routine
+        :param request:
+        :param args:
+        :param kwargs:
+        :return:
+        """
+
+        # First, validate search parameters using pydantic class
+        try:
+            self.search_params = SearchPostsValidator.model_validate(
+                request.query_params
+            )
+        except ValidationError as error:
+            return Response(
+                status=HTTP_422_UNPROCESSABLE_ENTITY,
+                data={
+                    ERROR_KEY: drf_error_details(error)
+                }
+            )
 
-        return Post.objects.search_posts(query)
+        return super().list(request, *args, **kwargs)
 
 
 class PostDetails(RetrieveUpdateDestroyAPIView):
@@ -137,7 +173,7 @@ class PostDetails(RetrieveUpdateDestroyAPIView):
     Manages single post instance lifecycle
     """
 
-    queryset = Post.objects.all()
+    queryset = Post.objects.with_related()
     lookup_field = Post.Field.slug
     lookup_url_kwarg = Post.Field.slug
     serializer_class = GetDetailsSerializer
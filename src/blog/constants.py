@@ -4,7 +4,22 @@ from core.models import BaseModel
 
 ACTIVE_POST_STATUS = "Published"
 POSTS_ORDERING = "-{}".format(BaseModel.Field.created_at)
-COMMENTS_ORDERING = "{}".format(BaseModel.Field.created_at)
+# Number of newest comments shown on post page (and loaded by "load more")
+COMMENTS_NEWEST_COUNT = 10
+
+# Posts full-text search settings
+POSTS_SEARCH_CONFIG = "english"
+# Shorter queries (and ones without full-text matches)
+# are looked up by trigram similarity of titles and excerpts
+POSTS_SEARCH_MIN_LENGTH = 4
+POSTS_SEARCH_MAX_LENGTH = 256
+POSTS_SEARCH_HEADLINE_OPTIONS = {
+    "start_sel": "<mark>",
+    "stop_sel": "</mark>",
+    "max_words": 35,
+    "min_words": 15,
+    "max_fragments": 2
+}
 
 ERROR_KEY = "errors"
 ERROR_MSG_NO_INITIAL_STATUS = _("Initial status not found")
@@ -1,9 +1,21 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from html import unescape
+
+from django.contrib.postgres.search import (
+    SearchHeadline, SearchQuery, SearchRank, TrigramWordSimilarity
+)
 from django.db.models import (
-    Manager, QuerySet, Q
+    F, Func, Manager, QuerySet, Q, TextField, Value
 )
+from django.db.models.functions import Greatest
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
 
 from .constants import (
-    ACTIVE_POST_STATUS, POSTS_ORDERING
+    ACTIVE_POST_STATUS, COMMENTS_NEWEST_COUNT, POSTS_ORDERING,
+    POSTS_SEARCH_CONFIG, POSTS_SEARCH_MIN_LENGTH,
+    POSTS_SEARCH_HEADLINE_OPTIONS
 )
 
 
@@ -12,26 +24,239 @@ class PostManager(Manager):
 
     """
 
-    def get_active_posts(self) -> QuerySet:
+    # Search results annotations
+    RANK = "rank"
+    SNIPPET = "snippet"
+
+    def with_related(self) -> QuerySet:
         """
+        Returns posts along with author, status and tags
+        loaded using fixed number of queries per page
+        (shared by API and HTML lists, details and search)
+        :return:
+        """
+        return super().get_queryset().select_related(
+            "author", "status"
+        ).prefetch_related(
+            "tags"
+        )
 
+    def get_active_posts(self) -> QuerySet:
+        """
+        Returns published posts, newest first
         :return:
         """
-        return super().get_queryset().filter(
+        return self.with_related().filter(
             status__name=ACTIVE_POST_STATUS
         ).order_by(
             POSTS_ORDERING
         )
 
-    def search_posts(self, query) -> QuerySet:
-        return super().get_queryset().filter(
-            Q(title__icontains=query)
-            |
-            Q(excerpt=query)
+    def search_posts(self, query: str | None) -> QuerySet:
+        """
+        Returns active posts matching query ordered by relevance
+        (rank): full-text matches or (only if there are none of them)
+        trigram ones. Snippets are added to shown page only
+        (see add_snippets)
+        :param query:
+        :return:
+        """
+
+        query = (query or "").strip()
+        if not query:
+            return self.none()
+
+        if len(query) >= POSTS_SEARCH_MIN_LENGTH:
+            posts = self.full_text_search(query)
+            if posts.exists():
+                return posts
+
+        return self.trigram_search(query)
+
+    def add_snippets(self, posts: list, query: str | None) -> list:
+        """
+        Annotates found posts (e.g. results page) with highlighted
+        text snippets escaped for HTML output: those are made
+        for full-text matches among them using single query
+        :param posts:
+        :param query:
+        :return:
+        """
+
+        posts = list(posts)
+        query = (query or "").strip()
+
+        snippets = dict()
+        if posts and len(query) >= POSTS_SEARCH_MIN_LENGTH:
+            search_query = self.get_search_query(query)
+            snippets = dict(
+                super().get_queryset().filter(
+                    pk__in=[post.pk for post in posts],
+                    search_vector=search_query
+                ).annotate(
+                    **{
+                        # Snippet is made of plain text (markup dropped)
+                        self.SNIPPET: SearchHeadline(
+                            Func(
+                                F("text"),
+                                Value("<[^>]*>"),
+                                Value(" "),
+                                Value("g"),
+                                function="REGEXP_REPLACE",
+                                output_field=TextField()
+                            ),
+                            search_query,
+                            config=POSTS_SEARCH_CONFIG,
+                            **POSTS_SEARCH_HEADLINE_OPTIONS
+                        )
+                    }
+                ).values_list(
+                    "pk", self.SNIPPET
+                )
+            )
+
+        for post in posts:
+            setattr(
+                post,
+                self.SNIPPET,
+                # Nothing to highlight for partial words
+                self.get_safe_snippet(snippets[post.pk])
+                if post.pk in snippets else ""
+            )
+        return posts
+
+    @staticmethod
+    def get_safe_snippet(snippet: str) -> str:
+        """
+        Returns text snippet escaped for HTML output
+        except for matches highlighting marks
+        :param snippet:
+        :return:
+        """
+
+        safe_snippet = escape(unescape(snippet))
+        for mark in (
+                POSTS_SEARCH_HEADLINE_OPTIONS["start_sel"],
+                POSTS_SEARCH_HEADLINE_OPTIONS["stop_sel"]
+        ):
+            safe_snippet = safe_snippet.replace(escape(mark), mark)
+        return mark_safe(safe_snippet)
+
+    @staticmethod
+    def get_search_query(query: str) -> SearchQuery:
+        return SearchQuery(
+            query, config=POSTS_SEARCH_CONFIG, search_type="websearch"
+        )
+
+    def full_text_search(self, query: str) -> QuerySet:
+        """
+        Looks query up in stored weighted search vectors (GIN index)
+        :param query:
+        :return:
+        """
+
+        search_query = self.get_search_query(query)
+        return self.get_active_posts().filter(
+            search_vector=search_query
+        ).annotate(
+            **{
+                self.RANK: SearchRank(F("search_vector"), search_query)
+            }
+        ).order_by(
+            "-{}".format(self.RANK), POSTS_ORDERING
+        )
+
+    def trigram_search(self, query: str) -> QuerySet:
+        """
+        Looks short or partial query up in titles and excerpts
+        by trigram word similarity (GIN trigram indexes)
+        :param query:
+        :return:
+        """
+
+        return self.get_active_posts().filter(
+            Q(title__trigram_word_similar=query)
             |
-            Q(text__icontains=query)
-        ).filter(
-            Q(status__name=ACTIVE_POST_STATUS)
+            Q(excerpt__trigram_word_similar=query)
+        ).annotate(
+            **{
+                self.RANK: Greatest(
+                    TrigramWordSimilarity(query, "title"),
+                    TrigramWordSimilarity(query, "excerpt")
+                )
+            }
         ).order_by(
-            POSTS_ORDERING
+            "-{}".format(self.RANK), POSTS_ORDERING
+        )
+
+
+class CommentManager(Manager):
+    """
+    Post comments management fine-tune class
+    """
+
+    @staticmethod
+    def encode_cursor(comment) -> str:
+        """
+        Returns opaque cursor built from comment (created_at, id)
+        position in comments list
+        :param comment:
+        :return:
+        """
+        return urlsafe_b64encode(
+            "{}|{}".format(
+                comment.created_at.isoformat(), comment.id
+            ).encode()
+        ).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, int]:
+        """
+        Returns (created_at, id) position encoded in cursor
+        (raises ValueError for malformed ones)
+        :param cursor:
+        :return:
+        """
+        created_at, comment_id = urlsafe_b64decode(
+            cursor.encode()
+        ).decode().split("|")
+        return datetime.fromisoformat(created_at), int(comment_id)
+
+    def get_newest(
+            self,
+            post_id: int,
+            before: str | None = None,
+            count: int = COMMENTS_NEWEST_COUNT
+    ) -> tuple[list, str | None]:
+        """
+        Returns newest post comments (along with their authors)
+        older than "before" position and cursor of the last returned
+        comment if there are more (keyset pagination over
+        (post, created_at, id) index, no OFFSET scans)
+        :param post_id:
+        :param before: cursor of the last comment already shown
+        :param count:
+        :return:
+        """
+
+        comments = self.select_related(
+            "author"
+        ).filter(
+            post_id=post_id
+        )
+
+        if before:
+            created_at, comment_id = self.decode_cursor(before)
+            comments = comments.filter(
+                Q(created_at__lt=created_at)
+                |
+                Q(created_at=created_at, id__lt=comment_id)
+            )
+
+        # One extra comment tells if there are more of them
+        comments = list(
+            comments.order_by("-created_at", "-id")[:count + 1]
         )
+        if len(comments) > count:
+            return comments[:count], self.encode_cursor(comments[count - 1])
+        return comments, None
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0008_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+        migrations.AddField(
+            model_name='status',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+        migrations.AddField(
+            model_name='tag',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+    ]
@@ -1,18 +1,25 @@
 from typing import Any
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db.models import (
     ForeignKey, PROTECT, CASCADE, ManyToManyField,
-    CharField, TextField, SlugField, ImageField
+    CharField, TextField, SlugField, ImageField, Index,
+    GeneratedField
 )
 from django.urls import reverse
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
-from core.models import BaseModel, Reference, BaseStatus
-from core.utils.images import convert_image, create_thumbnails
+from core.models import (
+    BaseModel, Reference, BaseStatus, StatusTransitionsMixin
+)
+from core.references import reference_cache
+from core.utils.images import process_image
 
-from .managers import PostManager
+from .constants import POSTS_SEARCH_CONFIG
+from .managers import CommentManager, PostManager
 
 APP_NAME = "blog"
 
@@ -63,14 +70,37 @@ class Status(BaseStatus):
 
 
 def get_default_status():
-    return Status.objects.get(is_initial=True)
+    return reference_cache.get(Status, is_initial=True)
 
 
-class Post(Postable):
+class Post(StatusTransitionsMixin, Postable):
     """
     Blog post class
     """
 
+    class Meta:
+        indexes = [
+            # Published posts are listed newest first
+            Index(
+                fields=["status", "-created_at"],
+                name="post_status_created_idx"
+            ),
+            # Full-text search over stored document
+            GinIndex(
+                fields=["search_vector"],
+                name="post_search_vector_idx"
+            ),
+            # Trigram fallback for short and partial queries
+            GinIndex(
+                OpClass("title", name="gin_trgm_ops"),
+                name="post_title_trgm_idx"
+            ),
+            GinIndex(
+                OpClass("excerpt", name="gin_trgm_ops"),
+                name="post_excerpt_trgm_idx"
+            )
+        ]
+
     class Field:
         title: str = "title"
         excerpt: str = "excerpt"
@@ -78,6 +108,7 @@ class Post(Postable):
         cover: str = "cover"
         slug: str = "slug"
         status: str = "status"
+        search_vector: str = "search_vector"
 
     title: CharField = CharField(
         null=False,
@@ -123,11 +154,31 @@ class Post(Postable):
         verbose_name=_("Status")
     )
 
+    # Weighted search document kept up to date by database itself
+    search_vector: GeneratedField = GeneratedField(
+        expression=(
+            SearchVector(
+                "title", weight="A", config=POSTS_SEARCH_CONFIG
+            )
+            + SearchVector(
+                "excerpt", weight="B", config=POSTS_SEARCH_CONFIG
+            )
+            + SearchVector(
+                "text", weight="C", config=POSTS_SEARCH_CONFIG
+            )
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True
+    )
+
     objects = PostManager()
 
     def __str__(self) -> str:
         return "{}".format(self.title)
 
+    def clean(self) -> None:
+        self.clean_status_transition()
+
     def save(self, *args: list, **kwargs: dict) -> None:
         """
         Performs additional object data manipulations
@@ -142,22 +193,17 @@ class Post(Postable):
         # Save original to database and obtain it's storage name
         super().save(*args, **kwargs)
 
-        if self.cover:
-            # Build image previews if necessary
-            if settings.IMAGE_SIZES:
-                for size in settings.IMAGE_SIZES:
-                    create_thumbnails.delay(
-                        self.cover.path,
-                        size[0],
-                        size[1],
-                        settings.IMAGE_FORMAT
-                    )
-            # Convert image format if necessary
-            if settings.IMAGE_CONVERT_ORIGINAL:
-                convert_image.delay(
-                    self.cover.path,
-                    settings.IMAGE_FORMAT
-                )
+        if self.cover and (
+                settings.IMAGE_SIZES or settings.IMAGE_CONVERT_ORIGINAL
+        ):
+            # Build image previews and convert image format (if
+            # necessary) decoding original only once
+            process_image.delay(
+                self.cover.path,
+                sorted(settings.IMAGE_SIZES),
+                settings.IMAGE_FORMAT,
+                settings.IMAGE_CONVERT_ORIGINAL
+            )
 
     def get_absolute_url(self) -> str:
         return reverse("blog:post_details", args=[self.slug])
@@ -190,6 +236,15 @@ class Comment(Postable):
     Post comment class
     """
 
+    class Meta:
+        indexes = [
+            # Post comments are listed (and paginated) by creation time
+            Index(
+                fields=["post", "created_at", "id"],
+                name="comment_post_created_idx"
+            )
+        ]
+
     class Field:
         post: str = "post"
 
@@ -199,3 +254,5 @@ class Comment(Postable):
         on_delete=CASCADE,
         related_name="comments"
     )
+
+    objects = CommentManager()
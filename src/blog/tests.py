@@ -5,14 +5,17 @@ from shutil import rmtree
 from PIL import Image
 
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db.models import QuerySet
 from django.test import TestCase, override_settings
 from django.urls import reverse
 
 from tests.data import TEST_DIR
 from tests.objects import create_good_user
 
-from .constants import ACTIVE_POST_STATUS
+from .constants import ACTIVE_POST_STATUS, COMMENTS_NEWEST_COUNT
+from .managers import PostManager
 from .models import Tag, Status, Post, Comment
 
 
@@ -100,6 +103,17 @@ class PostTests(BaseTest):
             text="Comment content"
         )
 
+    def test_post_status_transitions(self) -> None:
+        post = Post.objects.get(slug=self.draft_post.slug)
+
+        # Statuses without transitions keep posts where they are
+        post.status = self.active_status
+        with self.assertRaises(ValidationError):
+            post.clean()
+
+        self.draft_status.next_statuses.add(self.active_status)
+        post.clean()
+
     def test_posts_list(self) -> None:
         response = self.client.get(reverse("blog:posts"))
         self.assertEqual(response.status_code, 200)
@@ -122,6 +136,169 @@ class PostTests(BaseTest):
         self.assertContains(response, "Active post excerpt")
         self.assertTemplateUsed(response, "blog/posts.html")
 
+    def test_search_posts_ranking(self) -> None:
+        # Title matches outrank body matches
+        title_post = Post.objects.create(
+            title="Harbour views",
+            excerpt="Rooms facing the sea",
+            author=self.author,
+            text="Some content",
+            status=self.active_status
+        )
+        text_post = Post.objects.create(
+            title="Weekend offer",
+            excerpt="Discounts for long stays",
+            author=self.author,
+            text="Our guests love the harbour at night",
+            status=self.active_status
+        )
+
+        posts = Post.objects.add_snippets(
+            Post.objects.search_posts("harbour"), "harbour"
+        )
+        self.assertEqual(posts, [title_post, text_post])
+        self.assertGreater(posts[0].rank, posts[1].rank)
+        self.assertIn("<mark>harbour</mark>", posts[1].snippet)
+
+        # Stemmed words match as well
+        self.assertIn(text_post, Post.objects.search_posts("loving guest"))
+
+        # Draft posts are never found
+        self.assertNotIn(
+            self.draft_post, Post.objects.search_posts("draft post")
+        )
+
+    def test_search_posts_trigram_fallback(self) -> None:
+        # Short and partial words are looked up by similarity
+        posts = Post.objects.search_posts("Activ")
+        self.assertIsInstance(posts, QuerySet)
+        self.assertEqual(list(posts), [self.active_post])
+        self.assertEqual(list(Post.objects.search_posts("zzz")), [])
+        self.assertEqual(list(Post.objects.search_posts("  ")), [])
+
+    def test_search_posts_snippet_markup(self) -> None:
+        Post.objects.create(
+            title="Weekend offer",
+            excerpt="Discounts for long stays",
+            author=self.author,
+            text=(
+                "<p class='sea'>Our <b>harbour</b> &amp; "
+                "<img src=x onerror=alert(1)> &lt;script&gt;</p>"
+            ),
+            status=self.active_status
+        )
+
+        # Ranked posts are found without snippets...
+        posts = Post.objects.search_posts("harbour")
+        self.assertIsInstance(posts, QuerySet)
+        posts = list(posts)
+        self.assertFalse(hasattr(posts[0], PostManager.SNIPPET))
+
+        # ...which are made for shown page only at once
+        with self.assertNumQueries(1):
+            snippet = Post.objects.add_snippets(posts, "harbour")[0].snippet
+
+        # Post markup is dropped, text is escaped, matches are marked
+        self.assertIn("<mark>harbour</mark>", snippet)
+        self.assertIn("&amp;", snippet)
+        self.assertIn("&lt;script", snippet)
+        self.assertNotIn("<script", snippet)
+        self.assertNotIn("<b>", snippet)
+        self.assertNotIn("onerror", snippet)
+
+        response = self.client.get(
+            reverse("blog:search", query={"q": "harbour"})
+        )
+        self.assertContains(response, "<mark>harbour</mark>")
+        self.assertNotContains(response, "<script>")
+
+    def test_search_posts_pagination(self) -> None:
+        for index in range(12):
+            Post.objects.create(
+                title="Summer news {}".format(index),
+                excerpt="Summer excerpt",
+                author=self.author,
+                text="Summer content",
+                slug="summer-news-{}".format(index),
+                status=self.active_status
+            )
+
+        response = self.client.get(
+            reverse("blog:search", query={"q": "summer"})
+        )
+        self.assertEqual(len(response.context["posts"]), 10)
+        self.assertContains(response, "?q=summer&amp;page=2")
+
+        response = self.client.get(
+            reverse("blog:search", query={"q": "summer", "page": 2})
+        )
+        self.assertEqual(len(response.context["posts"]), 2)
+
+    def test_post_pages_queries(self) -> None:
+        for index in range(100):
+            post = Post.objects.create(
+                title="Post {}".format(index),
+                excerpt="Post {} excerpt".format(index),
+                author=self.author,
+                text="Post {} content".format(index),
+                slug="post-{}".format(index),
+                status=self.active_status
+            )
+            post.tags.set([self.tag])
+
+        # Page count, posts with authors and statuses, tags
+        with self.assertNumQueries(3):
+            self.client.get(reverse("blog:posts"))
+
+        # Post with author and status, tags, comments with authors
+        with self.assertNumQueries(3):
+            self.client.get(self.active_post.get_absolute_url())
+
+    def test_post_comments_load_more(self) -> None:
+        for index in range(COMMENTS_NEWEST_COUNT + 2):
+            Comment.objects.create(
+                post=self.active_post,
+                author=self.author,
+                text="Newer comment {}".format(index)
+            )
+
+        # Post page shows newest comments only
+        response = self.client.get(self.active_post.get_absolute_url())
+        comments = response.context["comments"]
+        self.assertEqual(len(comments), COMMENTS_NEWEST_COUNT)
+        self.assertEqual(
+            comments[0].text,
+            "Newer comment {}".format(COMMENTS_NEWEST_COUNT + 1)
+        )
+        self.assertNotContains(response, "Comment content")
+        self.assertContains(response, "Load more")
+
+        # "Load more" brings the rest of them
+        response = self.client.get(
+            reverse(
+                "blog:post_comments",
+                args=[self.active_post.slug],
+                query={"before": response.context["comments_cursor"]}
+            )
+        )
+        self.assertEqual(
+            [comment.text for comment in response.context["comments"]],
+            ["Newer comment 1", "Newer comment 0", "Comment content"]
+        )
+        self.assertIsNone(response.context["comments_cursor"])
+        self.assertNotContains(response, "Load more")
+
+        # Malformed cursors are rejected
+        for cursor in ("not-a-cursor", self.comment.public_id):
+            response = self.client.get(
+                reverse(
+                    "blog:post_comments",
+                    args=[self.active_post.slug],
+                    query={"before": cursor}
+                )
+            )
+            self.assertEqual(response.status_code, 404)
+
     def test_unknown_post_details(self) -> None:
         no_response = self.client.get("/blog/no-post")
         self.assertEqual(no_response.status_code, 404)
@@ -1,6 +1,6 @@
 from django.urls import path, include
 
-from .views import Posts, Search, PostDetails
+from .views import Posts, Search, PostDetails, PostComments
 
 app_name = "blog"
 
@@ -9,6 +9,10 @@ urlpatterns = [
     path("api/", include("blog.api.urls")),
     # search results
     path("search", Search.as_view(), name="search"),
+    # older post comments ("load more")
+    path(
+        "<slug:slug>/comments", PostComments.as_view(), name="post_comments"
+    ),
     # single post
     path("<slug:slug>", PostDetails.as_view(), name="post_details"),
     # all posts
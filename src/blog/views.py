@@ -7,9 +7,9 @@ from django.urls import reverse
 from django.views.generic.list import ListView
 from django.views.generic import View
 
-from .constants import POSTS_ORDERING
+from .constants import POSTS_ORDERING, POSTS_SEARCH_MAX_LENGTH
 from .forms import CommentForm
-from .models import Post
+from .models import Comment, Post
 
 
 class Posts(ListView):
@@ -29,26 +29,49 @@ class Posts(ListView):
 
 class Search(ListView):
     """
-    Posts search routine
+    Posts search routine (results are ranked by relevance)
     """
 
     template_name = "blog/posts.html"
     context_object_name = "posts"
+    paginate_by = 10
 
     def get_queryset(self):
-        query = self.request.GET.get("q")
+        self.query = self.request.GET.get("q", "")[:POSTS_SEARCH_MAX_LENGTH]
+
+        return Post.objects.search_posts(self.query)
 
-        return Post.objects.search_posts(query)
+    def paginate_queryset(self, queryset, page_size: int) -> tuple:
+        paginator, page, posts, is_paginated = super().paginate_queryset(
+            queryset, page_size
+        )
+        # Snippets are made for shown page only
+        page.object_list = Post.objects.add_snippets(posts, self.query)
+        return paginator, page, page.object_list, is_paginated
+
+    def get_context_data(self, **kwargs: dict) -> dict:
+        context = super().get_context_data(**kwargs)
+        # Keep search query for pagination links
+        context["query"] = self.request.GET.get("q", "")
+        return context
 
 
 class PostDetails(View):
     """
-    Single post details view with comments and commenting form
+    Single post details view with newest comments and commenting form
     """
 
     model = Post
     template_name = "blog/post_details.html"
 
+    @staticmethod
+    def get_comments_context(post: Post) -> dict:
+        comments, cursor = Comment.objects.get_newest(post.id)
+        return {
+            "comments": comments,
+            "comments_cursor": cursor
+        }
+
     def get(self, request: HttpRequest, slug: str) -> HttpResponse:
         """
         Displays selected post detail in common with comment form
@@ -58,22 +81,25 @@ class PostDetails(View):
         """
 
         try:
-            context: dict = {
-                "post": self.model.objects.get(
-                    slug=slug
-                ),
-                "comment_form": CommentForm()
-            }
-            return render(
-                request,
-                self.template_name,
-                context
+            post = self.model.objects.with_related().get(
+                slug=slug
             )
         except Post.DoesNotExist:
             raise Http404(
                 "The post doesn't exist"
             )
 
+        context: dict = {
+            "post": post,
+            "comment_form": CommentForm(),
+            **self.get_comments_context(post)
+        }
+        return render(
+            request,
+            self.template_name,
+            context
+        )
+
     def post(self, request: HttpRequest, slug: str) -> HttpResponse:
         """
         Processing new post comment
@@ -104,7 +130,47 @@ class PostDetails(View):
         # if form isn't valid - reload post page with form errors included
         context = {
             "post": current_post,
-            "comment_form": comment_form
+            "comment_form": comment_form,
+            **self.get_comments_context(current_post)
+        }
+        return render(
+            request,
+            self.template_name,
+            context
+        )
+
+
+class PostComments(View):
+    """
+    Older post comments ("load more" fragment of post details page)
+    """
+
+    template_name = "blog/includes/comments_page.html"
+
+    def get(self, request: HttpRequest, slug: str) -> HttpResponse:
+        """
+        Displays next portion of post comments older than
+        the one passed as "before" parameter
+        :param request:
+        :param slug:
+        :return:
+        """
+
+        try:
+            post = Post.objects.only(Post.Field.slug).get(slug=slug)
+            comments, cursor = Comment.objects.get_newest(
+                post.id,
+                before=request.GET.get("before")
+            )
+        except (Post.DoesNotExist, ValueError):
+            raise Http404(
+                "The post comments don't exist"
+            )
+
+        context: dict = {
+            "post": post,
+            "comments": comments,
+            "comments_cursor": cursor
         }
         return render(
             request,
@@ -16,6 +16,8 @@ DJANGO_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    # Full-text and trigram search support
+    "django.contrib.postgres",
 ]
 THIRD_PARTY_APPS = [
     # allauth lib support
@@ -163,6 +165,8 @@ IMAGE_SIZES = {
     IMAGE_SIZE_SMALL,
     IMAGE_SIZE_MEDIUM
 }
+# Converted original needs full size decoding of every upload
+# (thumbnails alone are made from reduced scale JPEG data)
 IMAGE_CONVERT_ORIGINAL = True
 IMAGE_KEEP_ORIGINAL = False
 
@@ -173,3 +177,24 @@ CURRENCIES = [
     "CNY"
 ]
 BASE_CURRENCY = "EUR"
+
+# Shared availability bitmap (set path to enable, e.g. on tmpfs)
+AVAILABILITY_BITMAP_PATH = None
+AVAILABILITY_BITMAP_HORIZON = 400
+AVAILABILITY_BITMAP_SLOTS = 100000
+
+# Rendered calendar months cache lifetime (seconds)
+CALENDAR_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Memoized public ids (FF3-encrypted object ids) per process
+PUBLIC_ID_CACHE_SIZE = 100000
+# Temporary: rows without stored public ids (created before they were
+# stored) are served by ids encrypted on read, enable until
+# backfill_public_ids is run
+PUBLIC_ID_FALLBACK = False
+
+# Reference objects (types, statuses) per-process cache lifetime (seconds)
+REFERENCE_CACHE_TIMEOUT = 60 * 5
+
+# Stay quotes cache lifetime (seconds)
+QUOTE_CACHE_TIMEOUT = 60 * 60 * 24
@@ -16,7 +16,7 @@ from rest_framework.generics import (
 )
 
 from core.models import BaseModel
-from core.api.paginators import BasePaginator
+from core.api.paginators import BasePaginator, CursorPaginationMixin
 
 from ....constants import ERROR_KEY
 from ....models import UserMessage, ContactType
@@ -26,7 +26,7 @@ from .serializers import UserMessageSerializer
 from .validators import UserMessageValidator
 
 
-class UserMessages(ListCreateAPIView):
+class UserMessages(CursorPaginationMixin, ListCreateAPIView):
     """
     Manages user messages listing and creation
     """
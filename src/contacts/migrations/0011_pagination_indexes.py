@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts', '0010_auto_20251003_1731'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usermessage',
+            index=models.Index(fields=['created_at', 'id'], name='usermessage_created_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts', '0011_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+        migrations.AddField(
+            model_name='companyaddress',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+        migrations.AddField(
+            model_name='companycontact',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+        migrations.AddField(
+            model_name='contacttype',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+        migrations.AddField(
+            model_name='usermessage',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+    ]
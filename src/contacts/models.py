@@ -1,6 +1,6 @@
 from django.db.models import (
     CharField, TextField, BooleanField,
-    ForeignKey, CASCADE, PROTECT
+    ForeignKey, CASCADE, PROTECT, Index
 )
 from django.utils.translation import gettext_lazy as _
 
@@ -172,6 +172,13 @@ class UserMessage(BaseModel):
 
     class Meta:
         verbose_name_plural = _("User messages")
+        indexes = [
+            # Keyset pagination position
+            Index(
+                fields=["created_at", "id"],
+                name="usermessage_created_idx"
+            )
+        ]
 
     class Field:
         author: str = "author"
@@ -1,4 +1,6 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+from core.models import BaseModel
 
 
 class BasePaginator(PageNumberPagination):
@@ -9,3 +11,39 @@ class BasePaginator(PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 100
+
+
+class BaseCursorPaginator(CursorPagination):
+    """
+    Base cursor (keyset) pagination management class:
+    no COUNT(*) and no OFFSET scans, pages are addressed
+    by opaque cursors built from (created_at, id) position
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = (BaseModel.Field.created_at, BaseModel.Field.id)
+
+
+class CursorPaginationMixin:
+    """
+    Makes cursor pagination available for list endpoint as opt-in mode
+    (?pagination=cursor), page number pagination is used by default
+    """
+
+    PAGINATION_MODE_PARAM = "pagination"
+    CURSOR_PAGINATION_MODE = "cursor"
+
+    cursor_pagination_class = BaseCursorPaginator
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            if self.request.query_params.get(
+                self.PAGINATION_MODE_PARAM
+            ) == self.CURSOR_PAGINATION_MODE:
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = super().paginator
+        return self._paginator
@@ -7,6 +7,12 @@ MSG_DB_NOT_AVAILABLE = _(
 MSG_INITIAL_STATUS_PREDECESSORS = _(
     "An initial status cannot have predecessors"
 )
+MSG_STATUS_TRANSITION_NOT_ALLOWED = _(
+    "Status cannot be changed from {} to {}"
+)
+INFO_MSG_PUBLIC_IDS_BACKFILLED = _("{}: {} public ids stored")
+MSG_PUBLIC_IDS_BENCHMARK = _("{}: {:.2f} us per call")
+MSG_IMAGES_BENCHMARK = _("{}: {:.1f} ms per image, {:.2f} images/s")
 MSG_WRONG_MONTH_FORMAT = _(
     "<h2>Cannot interpret calendar month format (YYYYMM is needed)</h2>"
 )
@@ -0,0 +1,75 @@
+from django.apps import apps
+from django.core.management import BaseCommand
+from django.db.models import Case, CharField, Value, When
+
+from ...constants import INFO_MSG_PUBLIC_IDS_BACKFILLED
+from ...models import BaseModel
+from ...utils.public_ids import encode_public_id
+
+
+class Command(BaseCommand):
+    """
+    Stores missing public ids (rows inserted in bulk or before
+    public ids were materialized) table by table in batches
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows updated by single statement"
+        )
+
+    def handle(self, *args, **options):
+        """
+        Command entry point
+        :param args:
+        :param options:
+        :return:
+        """
+
+        batch_size = options["batch_size"]
+        # One-off encryption shouldn't evict hot memoized ids
+        encode = encode_public_id.__wrapped__
+
+        for model in apps.get_models():
+            if not issubclass(model, BaseModel) or model._meta.proxy:
+                continue
+
+            stored, last_id = 0, 0
+            while True:
+                # Keyset pagination: every batch starts after the last one
+                ids = list(
+                    model._base_manager.filter(
+                        public_id__isnull=True,
+                        id__gt=last_id
+                    ).order_by(
+                        BaseModel.Field.id
+                    ).values_list(
+                        BaseModel.Field.id, flat=True
+                    )[:batch_size]
+                )
+                if not ids:
+                    break
+
+                stored += model._base_manager.filter(
+                    id__in=ids,
+                    public_id__isnull=True
+                ).update(
+                    public_id=Case(
+                        *(
+                            When(id=object_id, then=Value(encode(object_id)))
+                            for object_id in ids
+                        ),
+                        output_field=CharField()
+                    )
+                )
+                last_id = ids[-1]
+
+            if stored:
+                self.stdout.write(
+                    INFO_MSG_PUBLIC_IDS_BACKFILLED.format(
+                        model._meta.label, stored
+                    )
+                )
@@ -0,0 +1,157 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import timeit
+from PIL import Image
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.test import override_settings
+
+from ...constants import MSG_IMAGES_BENCHMARK
+from ...utils.images import (
+    get_crop_box, get_thumbnail_path, process_image, save_image
+)
+
+
+def create_thumbnail_per_task(
+        image_path: str,
+        width: int,
+        height: int,
+        image_format: str
+) -> None:
+    """
+    Reference (pre-process_image) thumbnail task: full size decoding,
+    cropping and resampling for every single thumbnail
+    :param image_path:
+    :param width:
+    :param height:
+    :param image_format:
+    :return:
+    """
+
+    with Image.open(image_path) as image:
+        thumbnail_image = image.crop(
+            get_crop_box(image.size, width, height)
+        ).resize(
+            (width, height),
+            Image.Resampling.LANCZOS
+        )
+        save_image(
+            thumbnail_image,
+            get_thumbnail_path(image_path, width, height, image_format),
+            image_format
+        )
+
+
+def convert_image_per_task(image_path: str, image_format: str) -> None:
+    """
+    Reference (pre-process_image) conversion task: one more
+    full size decoding of the original
+    :param image_path:
+    :param image_format:
+    :return:
+    """
+
+    file_name, _ = os.path.splitext(image_path)
+    with Image.open(image_path) as image:
+        save_image(
+            image,
+            settings.MEDIA_ROOT.joinpath(
+                "{}.{}".format(file_name, image_format)
+            ),
+            image_format
+        )
+
+
+class Command(BaseCommand):
+    """
+    Measures uploaded images processing throughput: task per
+    variant (original decoded for every one of them, as done
+    before process_image) vs single task decoding original once
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--megapixels",
+            type=int,
+            default=24,
+            help="Test image size (3:2 JPEG)"
+        )
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=1,
+            help="Number of images to process"
+        )
+
+    def report(self, title: str, seconds: float, count: int) -> None:
+        self.stdout.write(
+            MSG_IMAGES_BENCHMARK.format(
+                title, seconds / count * 1000, count / seconds
+            )
+        )
+
+    def handle(self, *args, **options):
+        """
+        Command entry point
+        :param args:
+        :param options:
+        :return:
+        """
+
+        count = options["count"]
+        height = int((options["megapixels"] * 1000000 / 1.5) ** 0.5)
+        sizes = sorted(settings.IMAGE_SIZES)
+        image_format = settings.IMAGE_FORMAT
+
+        # Results are stored next to test image in temporary folder
+        with TemporaryDirectory() as folder, override_settings(
+            MEDIA_ROOT=Path(folder)
+        ):
+            image_path = os.path.join(folder, "benchmark.jpg")
+            # Upscaled noise looks (for codecs) more or less like a photo
+            Image.effect_noise(
+                (int(height * 1.5) // 8, height // 8), 64
+            ).resize(
+                (int(height * 1.5), height), Image.Resampling.BICUBIC
+            ).convert("RGB").save(image_path, quality=90)
+
+            def thumbnail_tasks() -> None:
+                for width, height in sizes:
+                    create_thumbnail_per_task(
+                        image_path, width, height, image_format
+                    )
+
+            def variant_tasks() -> None:
+                thumbnail_tasks()
+                convert_image_per_task(image_path, image_format)
+
+            self.report(
+                "Thumbnails, task per size",
+                timeit(thumbnail_tasks, number=count),
+                count
+            )
+            self.report(
+                "Thumbnails, single task",
+                timeit(
+                    lambda: process_image(image_path, sizes, image_format),
+                    number=count
+                ),
+                count
+            )
+            self.report(
+                "Thumbnails and original, task per variant",
+                timeit(variant_tasks, number=count),
+                count
+            )
+            self.report(
+                "Thumbnails and original, single task",
+                timeit(
+                    lambda: process_image(
+                        image_path, sizes, image_format, True
+                    ),
+                    number=count
+                ),
+                count
+            )
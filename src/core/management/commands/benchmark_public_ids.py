@@ -0,0 +1,84 @@
+from timeit import timeit
+
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from ...constants import MSG_PUBLIC_IDS_BENCHMARK
+from ...utils.public_ids import (
+    decode_public_id, encode_public_id, encode_public_ids
+)
+
+
+class Command(BaseCommand):
+    """
+    Measures per-call cost of public ids encoding and decoding:
+    bare FF3 cipher vs memoized helpers (cold and warm cache)
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=10000,
+            help="Number of distinct ids to process"
+        )
+
+    def report(self, title: str, seconds: float, count: int) -> None:
+        self.stdout.write(
+            MSG_PUBLIC_IDS_BENCHMARK.format(
+                title, seconds / count * 1000000
+            )
+        )
+
+    def handle(self, *args, **options):
+        """
+        Command entry point
+        :param args:
+        :param options:
+        :return:
+        """
+
+        count = options["count"]
+        cipher = settings.FF3_CIPHER
+        ids = range(1, count + 1)
+        plain_ids = [
+            str(object_id).zfill(settings.FF3_LENGTH) for object_id in ids
+        ]
+        public_ids = [cipher.encrypt(plain_id) for plain_id in plain_ids]
+
+        # Every call pays for the whole encryption
+        self.report(
+            "FF3 encrypt",
+            timeit(lambda: list(map(cipher.encrypt, plain_ids)), number=1),
+            count
+        )
+        self.report(
+            "FF3 decrypt",
+            timeit(lambda: list(map(cipher.decrypt, public_ids)), number=1),
+            count
+        )
+
+        # Memoized helpers (warm numbers are valid while count
+        # does not exceed PUBLIC_ID_CACHE_SIZE)
+        encode_public_id.cache_clear()
+        decode_public_id.cache_clear()
+        self.report(
+            "Batch encode (cold)",
+            timeit(lambda: encode_public_ids(ids), number=1),
+            count
+        )
+        self.report(
+            "Memoized encode (warm)",
+            timeit(lambda: list(map(encode_public_id, ids)), number=10),
+            count * 10
+        )
+        self.report(
+            "Memoized decode (cold)",
+            timeit(lambda: list(map(decode_public_id, public_ids)), number=1),
+            count
+        )
+        self.report(
+            "Memoized decode (warm)",
+            timeit(lambda: list(map(decode_public_id, public_ids)), number=10),
+            count * 10
+        )
@@ -9,7 +9,11 @@ from django.db.models import (
 )
 from django.utils.translation import gettext_lazy as _
 
-from .constants import MSG_INITIAL_STATUS_PREDECESSORS
+from .constants import (
+    MSG_INITIAL_STATUS_PREDECESSORS, MSG_STATUS_TRANSITION_NOT_ALLOWED
+)
+from .transitions import transition_graph
+from .utils.public_ids import encode_public_id
 
 
 class BaseModel(Model):
@@ -45,18 +49,15 @@ class BaseModel(Model):
         verbose_name=_("UUID")
     )
 
-    def _get_public_id(self) -> str:
-        """
-        Calculates public_id based on model instance id
-        :return:
-        """
-        return settings.FF3_CIPHER.encrypt(
-            str(self.id).zfill(
-                settings.FF3_LENGTH
-            )
-        )
-
-    public_id = property(_get_public_id)
+    # FF3-encrypted id, stored to be looked up and exported as is
+    public_id: CharField = CharField(
+        null=True,
+        blank=True,
+        unique=True,
+        editable=False,
+        max_length=64,
+        verbose_name=_("Public ID")
+    )
 
     created_at: DateTimeField = DateTimeField(
         auto_now_add=True,
@@ -69,6 +70,31 @@ class BaseModel(Model):
         verbose_name=_("Updated at")
     )
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Rows created before public ids were stored get them
+        # calculated until backfill_public_ids is run
+        if settings.PUBLIC_ID_FALLBACK and instance.__dict__.get(
+            BaseModel.Field.public_id, ""
+        ) is None:
+            instance.public_id = encode_public_id(instance.id)
+        return instance
+
+    def save(self, *args: list, **kwargs: dict) -> None:
+        super().save(*args, **kwargs)
+
+        # Public id is calculated from primary key, so new rows get it
+        # right after insertion (in the database insert was made to)
+        if self.public_id is None:
+            self.public_id = encode_public_id(self.id)
+            type(self)._base_manager.using(self._state.db).filter(
+                pk=self.pk,
+                public_id__isnull=True
+            ).update(
+                public_id=self.public_id
+            )
+
 
 class Reference(BaseModel):
     """
@@ -150,6 +176,66 @@ class BaseStatus(Reference):
                 MSG_INITIAL_STATUS_PREDECESSORS
             )
 
+    def can_change_to(self, status: "BaseStatus") -> bool:
+        return transition_graph.is_allowed(
+            type(self), self.id, status.id
+        )
+
+
+class StatusTransitionsMixin:
+    """
+    Tracks status loaded from database to validate its changes
+    against status transitions graph (model must have
+    "status" foreign key to BaseStatus subclass)
+    """
+
+    STATUS_FIELD = "status"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.track_status()
+        return instance
+
+    def track_status(self) -> None:
+        self._loaded_status_id = getattr(
+            self, "{}_id".format(self.STATUS_FIELD)
+        )
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs) -> None:
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        # Deferred fields loading must keep the status being changed
+        if fields is None or {
+            self.STATUS_FIELD, "{}_id".format(self.STATUS_FIELD)
+        } & set(fields):
+            self.track_status()
+
+    def save(self, *args: list, **kwargs: dict) -> None:
+        super().save(*args, **kwargs)
+        # Further changes start from the saved status
+        self.track_status()
+
+    def clean_status_transition(self) -> None:
+        """
+        Rejects status changes not allowed by transitions graph
+        :return:
+        """
+
+        from_status_id = getattr(self, "_loaded_status_id", None)
+        to_status_id = getattr(self, "{}_id".format(self.STATUS_FIELD))
+        if from_status_id is None or to_status_id is None:
+            return
+
+        status_model = self._meta.get_field(self.STATUS_FIELD).related_model
+        if not transition_graph.is_allowed(
+            status_model, from_status_id, to_status_id
+        ):
+            message = MSG_STATUS_TRANSITION_NOT_ALLOWED.format(
+                transition_graph.get_name(status_model, from_status_id),
+                transition_graph.get_name(status_model, to_status_id)
+            )
+            raise ValidationError({self.STATUS_FIELD: message})
+
 
 class ContactType(Reference):
     """
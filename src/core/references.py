@@ -0,0 +1,117 @@
+from time import monotonic
+from typing import Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Model
+
+
+class ReferenceCache:
+    """
+    Per-process cache of rarely changed reference objects
+    (object types, statuses etc.) found by their fields values.
+    Model entries are dropped on any change of its instances within
+    the process (see core.signals) and expire after
+    REFERENCE_CACHE_TIMEOUT seconds to pick up other processes changes
+    """
+
+    def __init__(self):
+        # Model - (lookup - (expiration time, instance)) mapping
+        self._entries: dict[type, dict[tuple, tuple[float, Model]]] = dict()
+        # Model - invalidations counter to skip outdated stores
+        self._generations: dict[type, int] = dict()
+
+    @staticmethod
+    def get_key(lookup: dict) -> tuple:
+        return tuple(sorted(lookup.items()))
+
+    def _get_cached(self, model: type, key: tuple) -> Optional[Model]:
+        entry = self._entries.get(model, dict()).get(key)
+        if entry and entry[0] > monotonic():
+            return entry[1]
+
+    def _store(self, model: type, key: tuple, instance: Model) -> None:
+        """
+        Caches instance once current transaction is committed
+        (rolled back rows must never be served)
+        :param model:
+        :param key:
+        :param instance:
+        :return:
+        """
+        generation = self._generations.get(model, 0)
+
+        def store():
+            if self._generations.get(model, 0) == generation:
+                self._entries.setdefault(model, dict())[key] = (
+                    monotonic() + settings.REFERENCE_CACHE_TIMEOUT,
+                    instance
+                )
+
+        transaction.on_commit(store)
+
+    def get(self, model: type, **lookup) -> Model:
+        """
+        Returns cached reference object or loads it
+        (raising model DoesNotExist if there is no one)
+        :param model:
+        :param lookup:
+        :return:
+        """
+        key = self.get_key(lookup)
+        instance = self._get_cached(model, key)
+        if instance is None:
+            instance = model._default_manager.get(**lookup)
+            self._store(model, key, instance)
+        return instance
+
+    def get_or_create(
+            self, model: type, defaults: Optional[dict] = None, **lookup
+    ) -> Model:
+        """
+        Returns cached reference object, loads or creates it
+        :param model:
+        :param defaults:
+        :param lookup:
+        :return:
+        """
+        key = self.get_key(lookup)
+        instance = self._get_cached(model, key)
+        if instance is None:
+            instance, _ = model._default_manager.get_or_create(
+                defaults=defaults, **lookup
+            )
+            self._store(model, key, instance)
+        return instance
+
+    def get_id(self, model: type, **lookup) -> Optional[int]:
+        """
+        Returns cached reference object id or reads id column alone
+        (None if there is no object)
+        :param model:
+        :param lookup:
+        :return:
+        """
+        key = (model._meta.pk.name, *self.get_key(lookup))
+        object_id = self._get_cached(model, key)
+        if object_id is None:
+            object_id = model._default_manager.filter(
+                **lookup
+            ).values_list(
+                model._meta.pk.name, flat=True
+            ).first()
+            if object_id is not None:
+                self._store(model, key, object_id)
+        return object_id
+
+    def invalidate(self, model: type) -> None:
+        self._generations[model] = self._generations.get(model, 0) + 1
+        self._entries.pop(model, None)
+
+    def clear(self) -> None:
+        for model in list(self._entries):
+            self.invalidate(model)
+
+
+# Per-process cache shared by all the requests served
+reference_cache = ReferenceCache()
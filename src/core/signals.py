@@ -0,0 +1,24 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Reference, BaseStatus
+from .references import reference_cache
+from .transitions import transition_graph
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def reference_changed_receiver(sender, **kwargs):
+    # Drop cached objects of changed reference model
+    if issubclass(sender, Reference):
+        reference_cache.invalidate(sender)
+    # Status renaming or removal changes transitions graph as well
+    if issubclass(sender, BaseStatus):
+        transition_graph.invalidate(sender)
+
+
+@receiver(m2m_changed)
+def status_transitions_changed_receiver(sender, instance, **kwargs):
+    # Recompile transitions graph on next status or previous status change
+    if isinstance(instance, BaseStatus):
+        transition_graph.invalidate(type(instance))
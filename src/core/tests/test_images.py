@@ -0,0 +1,74 @@
+import os
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+from PIL import Image
+from PIL.JpegImagePlugin import JpegImageFile
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from ..utils.images import process_image
+
+SIZES = [(408, 272), (916, 544)]
+
+
+class ImagesTest(SimpleTestCase):
+    """
+    Test uploaded images processing
+    """
+
+    def setUp(self) -> None:
+        folder = TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.folder = Path(folder.name)
+        self.image_path = str(self.folder / "photo.jpg")
+        Image.new(
+            "RGB", size=(3000, 1500), color=(155, 0, 0)
+        ).save(self.image_path)
+
+    def test_process_image(self) -> None:
+        with override_settings(MEDIA_ROOT=self.folder):
+            process_image(self.image_path, SIZES, "webp", True)
+
+        for width, height in SIZES:
+            with Image.open(
+                self.folder / "photo_{}x{}.webp".format(width, height)
+            ) as thumbnail:
+                self.assertEqual(thumbnail.size, (width, height))
+        with Image.open(self.folder / "photo.webp") as original:
+            self.assertEqual(original.size, (3000, 1500))
+
+    def test_process_image_thumbnails_only(self) -> None:
+        decoded_sizes = list()
+        draft = JpegImageFile.draft
+
+        def record_draft(image, *args):
+            result = draft(image, *args)
+            decoded_sizes.append(image.size)
+            return result
+
+        # JPEG is decoded downscaled, thumbnails are not
+        with override_settings(MEDIA_ROOT=self.folder):
+            with patch.object(JpegImageFile, "draft", record_draft):
+                process_image(self.image_path, SIZES, "jpeg")
+
+        # Largest thumbnail needs 1/3 of original, so 1/2 DCT scale
+        self.assertEqual(decoded_sizes, [(1500, 750)])
+
+        for width, height in SIZES:
+            with Image.open(
+                self.folder / "photo_{}x{}.jpeg".format(width, height)
+            ) as thumbnail:
+                self.assertEqual(thumbnail.format, "JPEG")
+                self.assertEqual(thumbnail.size, (width, height))
+        # Original is not converted
+        self.assertFalse(os.path.exists(self.folder / "photo.jpeg"))
+
+    def test_benchmark_command(self) -> None:
+        output = StringIO()
+        call_command(
+            "benchmark_images", megapixels=1, count=1, stdout=output
+        )
+        self.assertIn("Thumbnails, single task", output.getvalue())
@@ -0,0 +1,129 @@
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db.models import Q
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from ..models import ContactType
+from ..utils.public_ids import (
+    decode_public_id, encode_public_id, encode_public_ids,
+    get_public_id_filter
+)
+
+
+class PublicIdsTest(SimpleTestCase):
+    """
+    Test memoized public ids encoding
+    """
+
+    def setUp(self) -> None:
+        encode_public_id.cache_clear()
+        decode_public_id.cache_clear()
+
+    def test_encode_decode(self) -> None:
+        public_id = encode_public_id(42)
+        self.assertEqual(
+            public_id,
+            settings.FF3_CIPHER.encrypt("42".zfill(settings.FF3_LENGTH))
+        )
+        self.assertEqual(decode_public_id(public_id), 42)
+
+        # Repeated calls are served from cache
+        encode_public_id(42)
+        decode_public_id(public_id)
+        self.assertEqual(encode_public_id.cache_info().hits, 1)
+        self.assertEqual(decode_public_id.cache_info().hits, 1)
+
+    def test_decode_wrong_public_id(self) -> None:
+        with self.assertRaises(ValueError):
+            decode_public_id("not-an-id")
+
+    def test_encode_batch(self) -> None:
+        public_ids = encode_public_ids([1, 2, 2, 3])
+        self.assertEqual(sorted(public_ids), [1, 2, 3])
+        self.assertEqual(encode_public_id.cache_info().misses, 3)
+
+        self.assertEqual(encode_public_id(2), public_ids[2])
+        self.assertEqual(encode_public_id.cache_info().hits, 1)
+
+    def test_benchmark_command(self) -> None:
+        output = StringIO()
+        call_command("benchmark_public_ids", count=10, stdout=output)
+        self.assertIn("Memoized decode (warm)", output.getvalue())
+
+
+class StoredPublicIdsTest(TestCase):
+    """
+    Test public ids stored in database
+    """
+
+    def test_public_id_stored_on_insert(self) -> None:
+        contact_type = ContactType.objects.create(name="Telegram")
+        self.assertEqual(
+            contact_type.public_id, encode_public_id(contact_type.id)
+        )
+        self.assertEqual(
+            ContactType.objects.get(
+                public_id=contact_type.public_id
+            ).id,
+            contact_type.id
+        )
+
+    @override_settings(PUBLIC_ID_FALLBACK=True)
+    def test_public_id_lookup_before_backfill(self) -> None:
+        stored = ContactType.objects.create(name="Telegram")
+        ContactType.objects.bulk_create(
+            ContactType(name="Type{}".format(index)) for index in range(2)
+        )
+        bulk_created = ContactType.objects.get(name="Type0")
+
+        # Rows without stored public ids are found by decoded ones
+        self.assertEqual(
+            ContactType.objects.get(
+                get_public_id_filter(bulk_created.public_id)
+            ).id,
+            bulk_created.id
+        )
+        self.assertEqual(
+            sorted(
+                ContactType.objects.filter(
+                    get_public_id_filter(
+                        stored.public_id, bulk_created.public_id, "not-an-id"
+                    )
+                ).values_list("id", flat=True)
+            ),
+            sorted([stored.id, bulk_created.id])
+        )
+
+        # Once backfilled only stored public ids are looked up
+        with self.settings(PUBLIC_ID_FALLBACK=False):
+            self.assertEqual(
+                get_public_id_filter(stored.public_id),
+                Q(public_id__in=(stored.public_id,))
+            )
+            self.assertIsNone(
+                ContactType.objects.get(name="Type0").public_id
+            )
+
+    @override_settings(PUBLIC_ID_FALLBACK=True)
+    def test_backfill_command(self) -> None:
+        ContactType.objects.bulk_create(
+            ContactType(name="Type{}".format(index)) for index in range(3)
+        )
+        # Not yet stored ids are calculated on load
+        contact_type = ContactType.objects.get(name="Type0")
+        self.assertIsNotNone(contact_type.public_id)
+
+        output = StringIO()
+        call_command("backfill_public_ids", batch_size=2, stdout=output)
+        self.assertIn("3 public ids stored", output.getvalue())
+        self.assertFalse(
+            ContactType.objects.filter(public_id__isnull=True).exists()
+        )
+        self.assertEqual(
+            ContactType.objects.get(
+                public_id=contact_type.public_id
+            ).id,
+            contact_type.id
+        )
@@ -0,0 +1,69 @@
+from django.test import TestCase
+
+from ..models import ContactType
+from ..references import reference_cache
+
+
+class ReferenceCacheTest(TestCase):
+    """
+    Test per-process reference objects cache
+    """
+
+    def tearDown(self) -> None:
+        # Cached rows are rolled back along with the test
+        reference_cache.clear()
+
+    def test_get_cached(self) -> None:
+        contact_type = ContactType.objects.create(name="Email")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(
+                reference_cache.get(ContactType, name="Email"),
+                contact_type
+            )
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                reference_cache.get(ContactType, name="Email"),
+                contact_type
+            )
+
+    def test_uncommitted_not_cached(self) -> None:
+        ContactType.objects.create(name="Email")
+
+        # Transaction is still open, so the object could vanish
+        reference_cache.get(ContactType, name="Email")
+        with self.assertNumQueries(1):
+            reference_cache.get(ContactType, name="Email")
+
+    def test_get_or_create(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            contact_type = reference_cache.get_or_create(
+                ContactType,
+                defaults={ContactType.Field.description: "Phone number"},
+                name="Phone"
+            )
+        self.assertEqual(contact_type.description, "Phone number")
+
+        with self.assertNumQueries(0):
+            reference_cache.get_or_create(ContactType, name="Phone")
+
+    def test_invalidation(self) -> None:
+        contact_type = ContactType.objects.create(name="Email")
+        with self.captureOnCommitCallbacks(execute=True):
+            reference_cache.get(ContactType, name="Email")
+
+        # Any change drops cached objects of the model
+        contact_type.description = "Email address"
+        contact_type.save()
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                reference_cache.get(ContactType, name="Email").description,
+                "Email address"
+            )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            reference_cache.get(ContactType, name="Email")
+        contact_type.delete()
+        with self.assertRaises(ContactType.DoesNotExist):
+            reference_cache.get(ContactType, name="Email")
@@ -0,0 +1,118 @@
+from time import monotonic
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+
+class CompiledGraph(NamedTuple):
+    """
+    Status names and allowed transitions (status id - next status ids)
+    """
+
+    names: dict[int, str]
+    successors: dict[int, frozenset[int]]
+
+
+class TransitionGraph:
+    """
+    Per-process compiled status transition graphs of BaseStatus
+    subclasses. Every graph is loaded with a few queries on first use,
+    dropped on any status or transitions change within the process
+    (see core.signals) and expires after REFERENCE_CACHE_TIMEOUT
+    seconds to pick up other processes changes, so transition checks
+    need no queries most of the time
+    """
+
+    def __init__(self):
+        # Model - (expiration time, graph) mapping
+        self._graphs: dict[type, tuple[float, CompiledGraph]] = dict()
+        # Model - invalidations counter to skip outdated stores
+        self._generations: dict[type, int] = dict()
+
+    @staticmethod
+    def compile(model: type) -> CompiledGraph:
+        """
+        Builds adjacency table: B follows A if B is one of A next
+        statuses or A is one of B previous statuses
+        :param model:
+        :return:
+        """
+        names = dict(model._default_manager.values_list("id", "name"))
+        successors = {status_id: set() for status_id in names}
+        for field_name, reverse in (
+            ("next_statuses", False),
+            ("previous_statuses", True)
+        ):
+            field = model._meta.get_field(field_name)
+            through = field.remote_field.through
+            for source, target in through._default_manager.values_list(
+                field.m2m_field_name(), field.m2m_reverse_field_name()
+            ):
+                if reverse:
+                    source, target = target, source
+                successors.setdefault(source, set()).add(target)
+
+        return CompiledGraph(
+            names,
+            {
+                status_id: frozenset(next_ids)
+                for status_id, next_ids in successors.items()
+            }
+        )
+
+    def get_graph(self, model: type) -> CompiledGraph:
+        """
+        Returns compiled graph, it's kept once current transaction
+        is committed (rolled back statuses must never be served)
+        :param model:
+        :return:
+        """
+        entry = self._graphs.get(model)
+        if entry and entry[0] > monotonic():
+            return entry[1]
+
+        graph = self.compile(model)
+        generation = self._generations.get(model, 0)
+
+        def store():
+            if self._generations.get(model, 0) == generation:
+                self._graphs[model] = (
+                    monotonic() + settings.REFERENCE_CACHE_TIMEOUT, graph
+                )
+
+        transaction.on_commit(store)
+        return graph
+
+    def get_successors(self, model: type, status_id: int) -> frozenset[int]:
+        return self.get_graph(model).successors.get(status_id, frozenset())
+
+    def get_name(self, model: type, status_id: int) -> Optional[str]:
+        return self.get_graph(model).names.get(status_id)
+
+    def is_allowed(
+            self, model: type, from_status_id: int, to_status_id: int
+    ) -> bool:
+        """
+        Checks if status can be changed (keeping it is always allowed)
+        :param model:
+        :param from_status_id:
+        :param to_status_id:
+        :return:
+        """
+        return (
+            from_status_id == to_status_id
+            or to_status_id in self.get_successors(model, from_status_id)
+        )
+
+    def invalidate(self, model: type) -> None:
+        self._generations[model] = self._generations.get(model, 0) + 1
+        self._graphs.pop(model, None)
+
+    def clear(self) -> None:
+        for model in list(self._graphs):
+            self.invalidate(model)
+
+
+# Per-process graphs shared by all the requests served
+transition_graph = TransitionGraph()
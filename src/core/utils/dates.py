@@ -1,5 +1,6 @@
 from calendar import HTMLCalendar
 from datetime import date, timedelta
+from typing import Iterable
 
 
 def daterange_generator(start_date: date, end_date: date):
@@ -12,12 +13,20 @@ def daterange_generator(start_date: date, end_date: date):
         yield start_date + timedelta(counter)
 
 
+def format_dates(dates: Iterable[date]) -> str:
+    """Joins dates into comma separated YYYY-MM-DD list."""
+    return ", ".join(
+        current_date.strftime("%Y-%m-%d")
+        for current_date in dates
+    )
+
+
 class AvailabilityCalendar(HTMLCalendar):
 
     CLASS_BUSY = "busy"
     CLASS_FREE = "free"
 
-    CLASSIC_HTML = '<table border="0" cellpadding="0" cellspacing="0" class="month">'  # noqa: E501
+    CLASSIC_HTML = '<table border="0" cellpadding="0" cellspacing="0" class="{}">'  # noqa: E501
     BOOTSTRAP_HTML = '<table class="table table-bordered table-calendar">'
 
     def __init__(self, availability_data, use_bootstrap, *args, **kwargs):
@@ -63,8 +72,11 @@ class AvailabilityCalendar(HTMLCalendar):
         """
         v = []
         a = v.append
-        a('<table border="0" cellpadding="0" cellspacing="0" class="%s">' % (
-            self.cssclass_month))
+        # Table header is chosen upfront instead of patching ready HTML
+        if self.use_bootstrap:
+            a(self.BOOTSTRAP_HTML)
+        else:
+            a(self.CLASSIC_HTML.format(self.cssclass_month))
         a('\n')
         a(self.formatmonthname(theyear, themonth, withyear=withyear))
         a('\n')
@@ -75,10 +87,4 @@ class AvailabilityCalendar(HTMLCalendar):
             a('\n')
         a('</table>')
         a('\n')
-        calendar_code = ''.join(v)
-        if self.use_bootstrap:
-            return calendar_code.replace(
-                self.CLASSIC_HTML,
-                self.BOOTSTRAP_HTML
-                )
-        return calendar_code
+        return ''.join(v)
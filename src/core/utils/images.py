@@ -1,59 +1,262 @@
 import logging
 import os
+from typing import Iterable
 from PIL import Image, ImageEnhance
 
 from django.conf import settings
 
 from celery import shared_task
 
+# Decoded image is box-reduced by integer factor before resampling
+# while it stays at least that many times larger than thumbnails
+REDUCING_GAP = 3.0
 
-@shared_task
-def convert_image(
+
+def get_thumbnail_name(
+        file_name: str,
+        width: int,
+        height: int,
+        image_format: str
+) -> str:
+    """
+    Returns thumbnail file (or storage) name for original image one
+    :param file_name:
+    :param width:
+    :param height:
+    :param image_format:
+    :return:
+    """
+
+    file_name, _ = os.path.splitext(file_name)
+    return "{}_{}x{}.{}".format(
+        file_name,
+        str(width),
+        str(height),
+        image_format
+    )
+
+
+def get_thumbnail_path(
+        image_path: str,
+        width: int,
+        height: int,
+        image_format: str
+) -> str:
+    """
+    Returns thumbnail file path for original image
+    :param image_path:
+    :param width:
+    :param height:
+    :param image_format:
+    :return:
+    """
+
+    return settings.MEDIA_ROOT.joinpath(
+        get_thumbnail_name(image_path, width, height, image_format)
+    )
+
+
+def get_crop_box(size: tuple, width: int, height: int) -> tuple:
+    """
+    Returns central part of image with requested proportions
+    :param size: original image width and height
+    :param width:
+    :param height:
+    :return:
+    """
+
+    image_ratio = size[0] / size[1]
+    resize_ratio = width / height
+
+    # Check original image proportions vs needed
+    if image_ratio > resize_ratio:
+        # Need to crop left and right edges
+        resize_factor = height / size[1]
+        cropped_width = width / resize_factor
+        edge = int((size[0] - cropped_width) / 2)
+        return edge, 0, size[0] - edge, size[1]
+
+    # Need to crop from top and bottom
+    resize_factor = width / size[0]
+    cropped_height = height / resize_factor
+    edge = int((size[1] - cropped_height) / 2)
+    return 0, edge, size[0], size[1] - edge
+
+
+def get_thumbnails_scale(size: tuple, sizes: list) -> float:
+    """
+    Returns the largest scale image is displayed with
+    in thumbnails (after cropping to their proportions)
+    :param size: original image width and height
+    :param sizes: thumbnails (width, height) pairs
+    :return:
+    """
+
+    return max(
+        max(width / size[0], height / size[1])
+        for width, height in sizes
+    )
+
+
+def save_image(
+        image: Image.Image,
+        outfile: str,
+        image_format: str
+) -> None:
+    """
+    Sharpens image and saves it with project quality settings
+    :param image:
+    :param outfile:
+    :param image_format:
+    :return:
+    """
+
+    # Apply filters
+    enhancer = ImageEnhance.Sharpness(image)
+    processed_image = enhancer.enhance(2)
+
+    # And save result
+    processed_image.save(
+        outfile,
+        format=image_format,
+        quality=settings.IMAGE_QUALITY,
+        dpi=(settings.IMAGE_DPI, settings.IMAGE_DPI),
+        progressive=True
+    )
+
+
+def save_thumbnail(
+        image: Image.Image,
         image_path: str,
+        width: int,
+        height: int,
         image_format: str
 ) -> None:
     """
-    Performs image convertion to predefined format
+    Crops and resizes already decoded image to requested
+    width and height and saves result next to the original
+    :param image:
+    :param image_path:
+    :param width:
+    :param height:
+    :param image_format:
+    :return:
+    """
+
+    # Cropping is done by resampling (no intermediate copy)
+    thumbnail_image = image.resize(
+        (width, height),
+        Image.Resampling.LANCZOS,
+        box=get_crop_box(image.size, width, height),
+        reducing_gap=REDUCING_GAP
+    )
+    save_image(
+        thumbnail_image,
+        get_thumbnail_path(image_path, width, height, image_format),
+        image_format
+    )
+
+
+@shared_task
+def process_image(
+        image_path: str,
+        sizes: Iterable,
+        image_format: str,
+        convert_original: bool = False
+) -> None:
+    """
+    Decodes image once and creates all the requested thumbnails
+    (and converted original if necessary) from decoded data.
+    Reduced scale JPEG decoding is used for thumbnails only uploads:
+    converted original needs full size data, which thumbnails are
+    box-reduced from then (cheaper than decoding image once more)
+    :param image_path:
+    :param sizes: (width, height) pairs
+    :param image_format: result format (original one if empty)
+    :param convert_original:
+    :return:
     """
 
     if not image_path:
         raise ValueError("No image path provided")
 
-    if not image_format:
-        raise ValueError("No image format provided")
+    sizes = [(int(width), int(height)) for width, height in sizes]
 
     try:
-        file_name, _ = os.path.splitext(image_path)
         with Image.open(image_path) as image:
-            # Apply filters
-            enhancer = ImageEnhance.Sharpness(image)
-            processed_image = enhancer.enhance(2)
-
-            # Define result file name
-            outfile = settings.MEDIA_ROOT.joinpath(
-                "{}.{}".format(
-                    file_name,
-                    image_format
+            image_format = image_format if image_format else image.format
+
+            # Without full size result JPEG is decoded at the lowest
+            # DCT scale (1/2 ... 1/8) still covering every thumbnail
+            if sizes and not convert_original:
+                scale = get_thumbnails_scale(image.size, sizes)
+                image.draft(
+                    image.mode,
+                    (
+                        int(image.size[0] * scale) + 1,
+                        int(image.size[1] * scale) + 1
+                    )
                 )
-            )
+            image.load()
 
-            # And save result
-            processed_image.save(
-                outfile,
-                format=image_format,
-                quality=settings.IMAGE_QUALITY,
-                dpi=(settings.IMAGE_DPI, settings.IMAGE_DPI),
-                progressive=True
-            )
+            if sizes:
+                # All the thumbnails are resampled from single
+                # (box-reduced) copy of decoded image
+                factor = int(
+                    1 / (
+                        get_thumbnails_scale(image.size, sizes)
+                        * REDUCING_GAP
+                    )
+                )
+                thumbnails_source = (
+                    image.reduce(factor) if factor > 1 else image
+                )
+                # Largest thumbnails first
+                for width, height in sorted(sizes, reverse=True):
+                    save_thumbnail(
+                        thumbnails_source,
+                        image_path,
+                        width,
+                        height,
+                        image_format
+                    )
+
+            if convert_original:
+                file_name, _ = os.path.splitext(image_path)
+                save_image(
+                    image,
+                    settings.MEDIA_ROOT.joinpath(
+                        "{}.{}".format(
+                            file_name,
+                            image_format
+                        )
+                    ),
+                    image_format
+                )
     except OSError as error:
         logging.error(
-            "Cannot convert photo {}: {}".format(
+            "Cannot process photo {}: {}".format(
                 image_path,
                 error
             )
         )
 
 
+@shared_task
+def convert_image(
+        image_path: str,
+        image_format: str
+) -> None:
+    """
+    Performs image convertion to predefined format
+    """
+
+    if not image_format:
+        raise ValueError("No image format provided")
+
+    process_image(image_path, [], image_format, convert_original=True)
+
+
 @shared_task
 def create_thumbnails(
         image_path: str,
@@ -65,62 +268,4 @@ def create_thumbnails(
     Performs image resize to predefined width and height
     """
 
-    try:
-        file_name, file_extension = os.path.splitext(image_path)
-        with Image.open(image_path) as image:
-            # Obtain image original format and dimensions
-            image_format = img_format if img_format else image.format
-            image_ratio = image.size[0] / image.size[1]
-            resize_ratio = width / height
-
-            # Check original image proportions vs needed
-            if image_ratio > resize_ratio:
-                # Need to crop left and right edges
-                resize_factor = height / image.size[1]
-                cropped_width = width / resize_factor
-                edge = int((image.size[0] - cropped_width) / 2)
-                cropped_image = image.crop(
-                    (edge, 0, image.size[0] - edge, image.size[1])
-                )
-            else:
-                # Need to crop from top and bottom
-                resize_factor = width / image.size[0]
-                cropped_height = height / resize_factor
-                edge = int((image.size[1] - cropped_height) / 2)
-                cropped_image = image.crop(
-                    (0, edge, image.size[0], image.size[1] - edge)
-                )
-
-            # Create thumbnail for requested width and height
-            thumbnail_image = cropped_image.resize(
-                (width, height),
-                Image.Resampling.LANCZOS
-            )
-            # Save it into images folder
-            outfile = settings.MEDIA_ROOT.joinpath(
-                "{}_{}x{}.{}".format(
-                    file_name,
-                    str(width),
-                    str(height),
-                    image_format
-                )
-            )
-            # Apply filters
-            enhancer = ImageEnhance.Sharpness(thumbnail_image)
-            thumbnail_image = enhancer.enhance(2)
-
-            # And save result
-            thumbnail_image.save(
-                outfile,
-                format=image_format,
-                quality=settings.IMAGE_QUALITY,
-                dpi=(settings.IMAGE_DPI, settings.IMAGE_DPI),
-                progressive=True
-            )
-    except OSError as error:
-        logging.error(
-            "Cannot resize photo {}: {}".format(
-                image_path,
-                error
-            )
-        )
+    process_image(image_path, [(width, height)], img_format)
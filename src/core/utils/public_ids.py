@@ -0,0 +1,67 @@
+from functools import lru_cache
+from typing import Iterable
+
+from django.conf import settings
+from django.db.models import Q
+
+
+@lru_cache(maxsize=settings.PUBLIC_ID_CACHE_SIZE)
+def encode_public_id(object_id: int) -> str:
+    """
+    Returns FF3-encrypted (zero-padded) object id,
+    recently used ones are served without encryption
+    :param object_id:
+    :return:
+    """
+    return settings.FF3_CIPHER.encrypt(
+        str(object_id).zfill(
+            settings.FF3_LENGTH
+        )
+    )
+
+
+@lru_cache(maxsize=settings.PUBLIC_ID_CACHE_SIZE)
+def decode_public_id(public_id: str) -> int:
+    """
+    Returns object id for public id (raises ValueError
+    for strings that could not be produced by the cipher)
+    :param public_id:
+    :return:
+    """
+    return int(settings.FF3_CIPHER.decrypt(public_id))
+
+
+def encode_public_ids(object_ids: Iterable[int]) -> dict[int, str]:
+    """
+    Encodes every unique id of a batch (e.g. serialized page) once,
+    so further public_id reads of the batch objects are cache hits
+    :param object_ids:
+    :return:
+    """
+    return {
+        object_id: encode_public_id(object_id)
+        for object_id in set(object_ids)
+    }
+
+
+def get_public_id_filter(*public_ids: str) -> Q:
+    """
+    Returns filter matching objects by stored public ids (and, while
+    PUBLIC_ID_FALLBACK is on, rows without them by primary keys
+    decoded from public ids)
+    :param public_ids:
+    :return:
+    """
+    public_id_filter = Q(public_id__in=public_ids)
+    if not settings.PUBLIC_ID_FALLBACK:
+        return public_id_filter
+
+    object_ids = list()
+    for public_id in public_ids:
+        try:
+            object_ids.append(decode_public_id(public_id))
+        except ValueError:
+            # Could not be produced by the cipher, so is not stored
+            continue
+
+    return public_id_filter | Q(public_id__isnull=True, pk__in=object_ids)
@@ -5,7 +5,7 @@ from django.contrib.admin import (
 )
 from django.utils.html import mark_safe
 
-from core.models import Reference
+from core.models import BaseModel, Reference
 
 from .models import (
     ObjectType, Category, Amenity, HouseRule,
@@ -216,6 +216,7 @@ class ReservationAdmin(ModelAdmin):
 
     search_fields = (
         "user__email",
+        BaseModel.Field.public_id
     )
 
 
@@ -7,3 +7,16 @@ ERROR_MSG_NO_START_DATE = _("No start date provided")
 ERROR_MSG_NO_END_DATE = _("No end date provided")
 ERROR_MSG_WRONG_DATE_FORMAT = _("Date must be in YYYY-MM-DD format")
 ERROR_MSG_NO_PRICE = _("No price provided")
+ERROR_MSG_WRONG_DATES_RANGE = _("End date cannot precede start date")
+ERROR_MSG_NO_DATES_RANGE = _("Both from and to dates are required")
+ERROR_MSG_TOO_LONG_RANGE = _("No more than {} days can be requested")
+ERROR_MSG_UNKNOWN_STATUS = _("Unknown status: {}")
+ERROR_MSG_UNKNOWN_RESERVATION = _("Unknown reservation: {}")
+ERROR_MSG_MIXED_CURRENCIES = _(
+    "Prices in different currencies cannot be listed in compact mode"
+)
+
+# Longest compact day rates list
+DAY_RATES_MAX_DAYS = 731
+# Most reservations changed by single transition request
+RESERVATIONS_TRANSITION_MAX = 1000
@@ -0,0 +1,12 @@
+from core.api.paginators import BaseCursorPaginator
+
+from ....models import DayRate
+
+
+class DayRatesCursorPaginator(BaseCursorPaginator):
+    """
+    Day rates are unique per listing and date,
+    so the date itself is a natural cursor position
+    """
+
+    ordering = DayRate.Field.date
@@ -0,0 +1,22 @@
+from csv import DictReader, Error as CSVError
+from io import StringIO
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class CSVParser(BaseParser):
+    """
+    Parses CSV documents (with header row) into the list of dicts
+    """
+
+    media_type = "text/csv"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", "utf-8")
+        try:
+            return list(
+                DictReader(StringIO(stream.read().decode(encoding)))
+            )
+        except (CSVError, UnicodeDecodeError, ValueError) as error:
+            raise ParseError(str(error))
@@ -12,6 +12,7 @@ from rest_framework.status import (
 from tests.data import good_price_tag
 from tests.objects import create_good_listing
 
+from ....constants import ERROR_MSG_OVERLAPPING_DATES
 from ....models import Listing, PriceTag, DayRate
 
 from ..constants import (
@@ -171,6 +172,43 @@ class PriceTags(BaseListingsAPITest):
             good_price_tag.get(PriceTag.Field.description)
         )
 
+    def test_create_overlapping_price_tag(self) -> None:
+        # Working as an admin
+        self.engage_admin()
+        PriceTag.objects.create(
+            listing=self.good_listing_object,
+            start_date=date.today() + relativedelta(days=2),
+            end_date=date.today() + relativedelta(days=3),
+            price=50
+        )
+
+        # Create new listing price tag overlapping existing one
+        response = self.client.post(
+            reverse(
+                "listings:api_listing_price_tags",
+                kwargs={
+                    Listing.Field.slug:
+                        self.good_listing_object.slug
+                }
+            ),
+            good_price_tag,
+            format="json"
+        )
+        # Check results through response code and error message
+        self.assertEqual(
+            response.status_code,
+            HTTP_422_UNPROCESSABLE_ENTITY
+        )
+        self.assertEqual(
+            response.data.get(ERROR_KEY),
+            ERROR_MSG_OVERLAPPING_DATES.format(
+                "{}, {}".format(
+                    date.today() + relativedelta(days=2),
+                    date.today() + relativedelta(days=3)
+                )
+            )
+        )
+
     def test_get_listing_price_tags(self) -> None:
         # Append price tags
         price_tags = list()
@@ -253,3 +291,174 @@ class PriceTags(BaseListingsAPITest):
                 float(current_rate.get(DayRate.Field.price)),
                 100.0
             )
+
+    def test_get_listing_daily_rates_cursor(self) -> None:
+        PriceTag.objects.create(
+            listing=self.good_listing_object,
+            start_date=date.today(),
+            end_date=date.today() + relativedelta(days=14),
+            price=100.0
+        )
+
+        # Opt-in keyset pagination: no total count, opaque cursors
+        response = self.client.get(
+            reverse(
+                "listings:api_listing_daily_rates",
+                kwargs={
+                    Listing.Field.slug: self.good_listing_object.slug
+                }
+            ),
+            {"pagination": "cursor"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("count", response.data)
+        self.assertEqual(len(response.data.get("results")), 10)
+
+        response = self.client.get(response.data.get("next"))
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data.get("next"))
+        self.assertEqual(
+            [
+                current_rate.get(DayRate.Field.date)
+                for current_rate in response.data.get("results")
+            ],
+            [
+                (
+                    date.today() + relativedelta(days=index)
+                ).strftime("%Y-%m-%d")
+                for index in range(10, 15)
+            ]
+        )
+
+    def test_get_listing_daily_rates_range(self) -> None:
+        start_date = date.today()
+        PriceTag.objects.create(
+            listing=self.good_listing_object,
+            start_date=start_date + relativedelta(days=2),
+            end_date=start_date + relativedelta(days=6),
+            price=100.0
+        )
+        url = reverse(
+            "listings:api_listing_daily_rates",
+            kwargs={
+                Listing.Field.slug: self.good_listing_object.slug
+            }
+        )
+
+        # Regular mode is limited by dates range
+        response = self.client.get(
+            url,
+            {
+                "from": start_date + relativedelta(days=3),
+                "to": start_date + relativedelta(days=4)
+            }
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data.get("results")), 2)
+
+        # Compact mode returns single array for the whole range
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                url,
+                {
+                    "from": start_date,
+                    "to": start_date + relativedelta(days=7),
+                    "compact": "true"
+                }
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data.get("from"),
+            start_date.strftime("%Y-%m-%d")
+        )
+        self.assertEqual(
+            response.data.get("prices"),
+            [None, None] + ["100.0000"] * 5 + [None]
+        )
+
+        # And requires explicit dates range
+        response = self.client.get(url, {"compact": "true"})
+        self.assertEqual(
+            response.status_code,
+            HTTP_422_UNPROCESSABLE_ENTITY
+        )
+        self.assertIn("compact", response.data.get(ERROR_KEY))
+
+    def test_import_price_tags(self) -> None:
+        self.engage_admin()
+        second_listing = Listing.objects.create(
+            title="Second listing",
+            slug="second-listing",
+            object_type=self.good_listing_object.object_type
+        )
+        start_date = date.today()
+        rows = [
+            {
+                PriceTag.Field.listing: listing.slug,
+                PriceTag.Field.start_date: (
+                    start_date + relativedelta(months=index)
+                ).strftime("%Y-%m-%d"),
+                PriceTag.Field.end_date: (
+                    start_date + relativedelta(months=index, days=9)
+                ).strftime("%Y-%m-%d"),
+                PriceTag.Field.price: 100 + index
+            }
+            for listing in (self.good_listing_object, second_listing)
+            for index in range(3)
+        ]
+
+        response = self.client.post(
+            reverse("listings:api_price_tags_import"),
+            rows,
+            format="json"
+        )
+        self.assertEqual(response.status_code, HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 6)
+        self.assertEqual(
+            DayRate.objects.filter(listing=second_listing).count(),
+            30
+        )
+
+        # Every failed row is reported and nothing is written
+        response = self.client.post(
+            reverse("listings:api_price_tags_import"),
+            "\r\n".join(
+                (
+                    "listing,start_date,end_date,price,currency",
+                    # Overlaps existing price tag
+                    "{},{},{},100,".format(
+                        second_listing.slug,
+                        start_date + relativedelta(days=5),
+                        start_date + relativedelta(days=15)
+                    ),
+                    # Good one
+                    "{},{},{},100,EUR".format(
+                        second_listing.slug,
+                        start_date + relativedelta(years=1),
+                        start_date + relativedelta(years=1, days=3)
+                    ),
+                    # Overlaps previous row
+                    "{},{},{},100,EUR".format(
+                        second_listing.slug,
+                        start_date + relativedelta(years=1, days=3),
+                        start_date + relativedelta(years=1, days=5)
+                    ),
+                    "unknown,{},{},100,".format(start_date, start_date),
+                    "{},{},{},100,".format(
+                        second_listing.slug,
+                        start_date + relativedelta(years=2),
+                        start_date + relativedelta(years=2, days=-1)
+                    ),
+                )
+            ),
+            content_type="text/csv"
+        )
+        self.assertEqual(
+            response.status_code,
+            HTTP_422_UNPROCESSABLE_ENTITY
+        )
+        self.assertEqual(
+            [error.get("row") for error in response.data.get(ERROR_KEY)],
+            [1, 3, 4, 5]
+        )
+        self.assertEqual(PriceTag.objects.count(), 6)
@@ -1,8 +1,15 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
+from pyngo import QueryDictModel
 
-from ..constants import ERROR_MSG_WRONG_DATE_FORMAT
+from ..constants import (
+    DAY_RATES_MAX_DAYS,
+    ERROR_MSG_WRONG_DATE_FORMAT,
+    ERROR_MSG_WRONG_DATES_RANGE,
+    ERROR_MSG_NO_DATES_RANGE,
+    ERROR_MSG_TOO_LONG_RANGE
+)
 
 from ....models import PriceTag
 
@@ -33,3 +40,38 @@ class PriceTagValidator(BaseModel):
         except ValueError:
             raise ValueError(ERROR_MSG_WRONG_DATE_FORMAT)
         return end_date
+
+
+class DayRatesValidator(QueryDictModel):
+    """
+    Pydantic model for day rates list parameters validation
+    (compact mode needs explicit and limited dates range)
+    """
+
+    start_date: Optional[date] = Field(default=None, alias="from")
+    end_date: Optional[date] = Field(default=None, alias="to")
+    compact: bool = False
+
+    @field_validator("end_date")
+    def validate_dates_range(
+            cls, end_date: Optional[date], info: ValidationInfo
+    ) -> Optional[date]:
+        start_date = info.data.get("start_date")
+        if start_date and end_date and end_date < start_date:
+            raise ValueError(ERROR_MSG_WRONG_DATES_RANGE)
+        return end_date
+
+    @field_validator("compact")
+    def validate_compact_range(
+            cls, compact: bool, info: ValidationInfo
+    ) -> bool:
+        if compact:
+            start_date = info.data.get("start_date")
+            end_date = info.data.get("end_date")
+            if not start_date or not end_date:
+                raise ValueError(ERROR_MSG_NO_DATES_RANGE)
+            if (end_date - start_date).days >= DAY_RATES_MAX_DAYS:
+                raise ValueError(
+                    ERROR_MSG_TOO_LONG_RANGE.format(DAY_RATES_MAX_DAYS)
+                )
+        return compact
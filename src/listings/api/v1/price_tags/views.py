@@ -1,24 +1,36 @@
-from pydantic import ValidationError
+from pydantic import ValidationError as PydanticError
 from pyngo import drf_error_details
 
+from django.conf import settings
+from django.core.exceptions import ValidationError
+
 from rest_framework.exceptions import NotFound
 from rest_framework.generics import ListAPIView, ListCreateAPIView
+from rest_framework.parsers import JSONParser
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import (
     HTTP_201_CREATED,
     HTTP_422_UNPROCESSABLE_ENTITY
 )
+from rest_framework.views import APIView
+
+from core.api.paginators import CursorPaginationMixin
+from core.utils.dates import daterange_generator
 
+from ....constants import ERROR_MSG_NOT_A_LIST
+from ....importers import PriceTagsImporter
 from ....models import Listing, PriceTag, DayRate
 
 from ..constants import (
-    ERROR_KEY, ERROR_MSG_UNKNOWN_LISTING
+    ERROR_KEY, ERROR_MSG_UNKNOWN_LISTING, ERROR_MSG_MIXED_CURRENCIES
 )
 
+from .paginators import DayRatesCursorPaginator
+from .parsers import CSVParser
 from .permissions import PriceTagPermissions
 from .serializers import PriceTagSerializer, DayRateSerializer
-from .validators import PriceTagValidator
+from .validators import DayRatesValidator, PriceTagValidator
 
 
 class PriceTagsList(ListCreateAPIView):
@@ -60,7 +72,7 @@ class PriceTagsList(ListCreateAPIView):
         # First, validate data using pydantic class
         try:
             PriceTagValidator.model_validate(request.data)
-        except ValidationError as error:
+        except PydanticError as error:
             return Response(
                 status=HTTP_422_UNPROCESSABLE_ENTITY,
                 # Leave only first error message for every field
@@ -93,10 +105,21 @@ class PriceTagsList(ListCreateAPIView):
                 }
             )
 
-        price_tag = PriceTag.objects.create(
+        # Check price tag against other listing price tags
+        price_tag = PriceTag(
             listing=listing,
             **serializer.validated_data
         )
+        try:
+            price_tag.clean()
+        except ValidationError as error:
+            return Response(
+                status=HTTP_422_UNPROCESSABLE_ENTITY,
+                data={
+                    ERROR_KEY: error.message
+                }
+            )
+        price_tag.save()
 
         # And return positive response
         return Response(
@@ -105,26 +128,143 @@ class PriceTagsList(ListCreateAPIView):
         )
 
 
-class DayRatesList(ListAPIView):
+class PriceTagsImport(APIView):
+    """
+    Manages bulk price tags import (JSON list or CSV document)
+    across many listings
+    """
+
+    parser_classes = [JSONParser, CSVParser]
+    permission_classes = [PriceTagPermissions]
+
+    def post(self, request: Request) -> Response:
+        """
+        Creates all the price tags and their day rates
+        or none of them, reporting every failed row
+        :param request:
+        :return:
+        """
+
+        if not isinstance(request.data, list):
+            return Response(
+                status=HTTP_422_UNPROCESSABLE_ENTITY,
+                data={
+                    ERROR_KEY: ERROR_MSG_NOT_A_LIST
+                }
+            )
+
+        importer = PriceTagsImporter(request.data)
+        if not importer.validate() or not importer.save():
+            return Response(
+                status=HTTP_422_UNPROCESSABLE_ENTITY,
+                data={
+                    ERROR_KEY: importer.errors
+                }
+            )
+
+        return Response(
+            status=HTTP_201_CREATED,
+            data=PriceTagSerializer(importer.price_tags, many=True).data
+        )
+
+
+class DayRatesList(CursorPaginationMixin, ListAPIView):
     """
-    Manages daily rates listing
+    Manages daily rates listing (optionally limited by dates range)
     """
 
     serializer_class = DayRateSerializer
+    cursor_pagination_class = DayRatesCursorPaginator
 
     def get_queryset(self):
         try:
             listing = Listing.objects.get(
                 slug=self.kwargs.get(Listing.Field.slug)
             )
-            return DayRate.objects.filter(
-                listing=listing
-            ).order_by(
-                DayRate.Field.date
-            )
         except Listing.DoesNotExist:
             raise NotFound(
                 ERROR_MSG_UNKNOWN_LISTING.format(
                     self.kwargs.get(Listing.Field.slug)
                 )
             )
+
+        day_rates = DayRate.objects.filter(
+            listing=listing
+        )
+        if self.params.start_date:
+            day_rates = day_rates.filter(
+                date__gte=self.params.start_date
+            )
+        if self.params.end_date:
+            day_rates = day_rates.filter(
+                date__lte=self.params.end_date
+            )
+        return day_rates.order_by(
+            DayRate.Field.date
+        )
+
+    def list(
+            self,
+            request: Request,
+            *args: list,
+            **kwargs: dict
+    ) -> Response:
+        """
+        Returns either paginated day rates or (in compact mode)
+        all the nightly prices of the dates range as a single array
+        starting from the first date (null means no rate defined)
+        :param request:
+        :param args:
+        :param kwargs:
+        :return:
+        """
+
+        try:
+            self.params = DayRatesValidator.model_validate(
+                request.query_params
+            )
+        except PydanticError as error:
+            return Response(
+                status=HTTP_422_UNPROCESSABLE_ENTITY,
+                data={
+                    ERROR_KEY: drf_error_details(error)
+                }
+            )
+
+        if not self.params.compact:
+            return super().list(request, *args, **kwargs)
+
+        rates = {
+            rate_date: (price, currency)
+            for rate_date, price, currency in self.get_queryset().values_list(
+                DayRate.Field.date,
+                DayRate.Field.price,
+                DayRate.Field.price_currency
+            )
+        }
+        currencies = {currency for _, currency in rates.values()}
+        if len(currencies) > 1:
+            return Response(
+                status=HTTP_422_UNPROCESSABLE_ENTITY,
+                data={
+                    ERROR_KEY: ERROR_MSG_MIXED_CURRENCIES
+                }
+            )
+
+        return Response(
+            {
+                "from": self.params.start_date.strftime("%Y-%m-%d"),
+                "to": self.params.end_date.strftime("%Y-%m-%d"),
+                "currency": (
+                    currencies.pop() if currencies
+                    else settings.BASE_CURRENCY
+                ),
+                "prices": [
+                    str(rates[rate_date][0]) if rate_date in rates else None
+                    for rate_date in daterange_generator(
+                        self.params.start_date,
+                        self.params.end_date
+                    )
+                ]
+            }
+        )
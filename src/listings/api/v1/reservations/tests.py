@@ -1,8 +1,15 @@
 from datetime import date
 from dateutil.relativedelta import relativedelta
+from io import StringIO
+from unittest.mock import patch
+
+from pydantic import ValidationError
 
 from django.conf import settings
+from django.core.management import call_command
+from django.db import IntegrityError
 from django.shortcuts import reverse
+from django.test import override_settings
 
 from rest_framework.status import (
     HTTP_201_CREATED,
@@ -13,13 +20,16 @@ from rest_framework.status import (
 from tests.data import good_reservation
 from tests.objects import create_good_listing
 
-from ....models import Listing, PriceTag, Reservation
+from ....constants import ERROR_MSG_OVERLAPPING_DATES
+from ....models import Listing, PriceTag, Reservation, ReservationStatus
 
 from ..constants import (
     ERROR_KEY, ERROR_MSG_UNKNOWN_LISTING
 )
 from ..tests import BaseListingsAPITest
 
+from .validators import ReservationValidator
+
 
 required_fields = [
     Reservation.Field.check_in,
@@ -160,6 +170,102 @@ class Reservations(BaseListingsAPITest):
             good_reservation.get(Reservation.Field.comment)
         )
 
+    def test_create_overlapping_reservation(self) -> None:
+        user = self.engage_user()
+        Reservation.objects.create(
+            listing=self.listing,
+            user=user,
+            check_in=date.today() + relativedelta(days=2),
+            check_out=date.today() + relativedelta(days=4)
+        )
+
+        # Create new listing reservation overlapping existing one
+        response = self.client.post(
+            reverse(
+                "listings:api_listing_reservations",
+                kwargs={
+                    Listing.Field.slug:
+                        self.listing.slug
+                }
+            ),
+            good_reservation,
+            format="json"
+        )
+        # Check results through response code and error message
+        self.assertEqual(
+            response.status_code,
+            HTTP_422_UNPROCESSABLE_ENTITY
+        )
+        self.assertEqual(
+            response.data.get(ERROR_KEY),
+            ERROR_MSG_OVERLAPPING_DATES.format(
+                "{}, {}".format(
+                    date.today() + relativedelta(days=2),
+                    date.today() + relativedelta(days=3)
+                )
+            )
+        )
+
+    def test_create_reservation_wrong_dates_order(self) -> None:
+        self.engage_user()
+        data = good_reservation.copy()
+        data[Reservation.Field.check_out] = data.get(
+            Reservation.Field.check_in
+        )
+
+        response = self.client.post(
+            reverse(
+                "listings:api_listing_reservations",
+                kwargs={
+                    Listing.Field.slug:
+                        self.listing.slug
+                }
+            ),
+            data,
+            format="json"
+        )
+        self.assertEqual(
+            response.status_code,
+            HTTP_422_UNPROCESSABLE_ENTITY
+        )
+
+    def test_create_reservation_unpadded_dates(self) -> None:
+        # Dates are compared, not their string representations
+        params = ReservationValidator.model_validate(
+            {
+                Reservation.Field.check_in: "2030-1-5",
+                Reservation.Field.check_out: "2030-1-10",
+                Reservation.Field.comment: None
+            }
+        )
+        self.assertEqual(params.check_out, "2030-1-10")
+
+        with self.assertRaises(ValidationError):
+            ReservationValidator.model_validate(
+                {
+                    Reservation.Field.check_in: "2030-1-10",
+                    Reservation.Field.check_out: "2030-01-9",
+                    Reservation.Field.comment: None
+                }
+            )
+
+    def test_create_reservation_other_integrity_error(self) -> None:
+        self.engage_user()
+
+        # Only overlapping dates are reported as such
+        with patch.object(Reservation, "save", side_effect=IntegrityError):
+            with self.assertRaises(IntegrityError):
+                self.client.post(
+                    reverse(
+                        "listings:api_listing_reservations",
+                        kwargs={
+                            Listing.Field.slug: self.listing.slug
+                        }
+                    ),
+                    good_reservation,
+                    format="json"
+                )
+
     def test_get_listing_reservations(self) -> None:
         user = self.engage_user()
 
@@ -213,3 +319,78 @@ class Reservations(BaseListingsAPITest):
                     Reservation.Field.currency
                     )
             )
+
+    @override_settings(PUBLIC_ID_FALLBACK=True)
+    def test_reservations_transition(self) -> None:
+        call_command("load_reservation_statuses", stdout=StringIO())
+        user = self.engage_user()
+        reservations = [
+            Reservation.objects.create(
+                listing=self.listing,
+                user=user,
+                check_in=date.today() + relativedelta(days=index * 2),
+                check_out=date.today() + relativedelta(days=index * 2 + 1)
+            )
+            for index in range(3)
+        ]
+        # Rows without stored public id (until backfill) too
+        Reservation.objects.filter(pk=reservations[2].pk).update(
+            public_id=None
+        )
+        url = reverse("listings:api_reservations_transition")
+        data = {
+            Reservation.Field.status: "Pending",
+            "reservations": [
+                reservation.public_id for reservation in reservations
+            ]
+        }
+
+        # Staff only
+        response = self.client.post(url, data, format="json")
+        self.assertEqual(response.status_code, HTTP_403_FORBIDDEN)
+
+        self.engage_admin()
+        response = self.client.post(url, data, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data.get("updated"), 3)
+
+        # Nothing is changed if any transition is not allowed
+        reservations[0].status = ReservationStatus.objects.get_by_name(
+            "Approved"
+        )
+        reservations[0].save()
+        response = self.client.post(
+            url,
+            {
+                Reservation.Field.status: "Rejected",
+                "reservations": data["reservations"] + ["000000"]
+            },
+            format="json"
+        )
+        self.assertEqual(
+            response.status_code,
+            HTTP_422_UNPROCESSABLE_ENTITY
+        )
+        self.assertEqual(
+            [error.get("reservation") for error in response.data[ERROR_KEY]],
+            [reservations[0].public_id, "000000"]
+        )
+        self.assertEqual(
+            Reservation.objects.filter(status__name="Rejected").count(),
+            0
+        )
+
+        # Unknown status
+        response = self.client.post(
+            url,
+            {
+                Reservation.Field.status: "Unknown",
+                "reservations": data["reservations"]
+            },
+            format="json"
+        )
+        self.assertEqual(
+            response.status_code,
+            HTTP_422_UNPROCESSABLE_ENTITY
+        )
+        self.assertIn(Reservation.Field.status, response.data[ERROR_KEY])
@@ -1,10 +1,13 @@
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
+from ....constants import ERROR_MSG_WRONG_DATES_ORDER
 from ....models import Reservation
 
-from ..constants import ERROR_MSG_WRONG_DATE_FORMAT
+from ..constants import (
+    ERROR_MSG_WRONG_DATE_FORMAT, RESERVATIONS_TRANSITION_MAX
+)
 
 
 class ReservationValidator(BaseModel):
@@ -26,9 +29,26 @@ class ReservationValidator(BaseModel):
         return check_in
 
     @field_validator(Reservation.Field.check_out)
-    def validate_end_date(cls, check_out: str) -> str:
+    def validate_end_date(cls, check_out: str, info: ValidationInfo) -> str:
         try:
-            datetime.strptime(check_out, "%Y-%m-%d")
+            check_out_date = datetime.strptime(check_out, "%Y-%m-%d").date()
         except ValueError:
             raise ValueError(ERROR_MSG_WRONG_DATE_FORMAT)
+        # Dates (not strings) are compared: zero padding is optional
+        check_in = info.data.get(Reservation.Field.check_in)
+        if check_in and check_out_date <= datetime.strptime(
+                check_in, "%Y-%m-%d"
+        ).date():
+            raise ValueError(ERROR_MSG_WRONG_DATES_ORDER)
         return check_out
+
+
+class ReservationsTransitionValidator(BaseModel):
+    """
+    Pydantic model for reservations batch status change validation
+    """
+
+    status: str
+    reservations: list[str] = Field(
+        min_length=1, max_length=RESERVATIONS_TRANSITION_MAX
+    )
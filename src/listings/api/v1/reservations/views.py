@@ -1,24 +1,39 @@
 from pydantic import ValidationError
 from pyngo import drf_error_details
 
+from django.db import IntegrityError, transaction
+from django.utils.timezone import now
+
 from rest_framework.exceptions import NotFound
 from rest_framework.generics import ListCreateAPIView
+from rest_framework.permissions import IsAdminUser
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import (
     HTTP_201_CREATED,
     HTTP_422_UNPROCESSABLE_ENTITY
 )
+from rest_framework.views import APIView
+
+from core.constants import MSG_STATUS_TRANSITION_NOT_ALLOWED
+from core.models import BaseModel
+from core.transitions import transition_graph
+from core.utils.dates import format_dates
+from core.utils.public_ids import get_public_id_filter
 
-from ....models import Listing, Reservation
+from ....constants import ERROR_MSG_OVERLAPPING_DATES
+from ....models import Listing, Reservation, ReservationStatus
 
 from ..constants import (
-    ERROR_KEY, ERROR_MSG_UNKNOWN_LISTING
+    ERROR_KEY, ERROR_MSG_UNKNOWN_LISTING,
+    ERROR_MSG_UNKNOWN_RESERVATION, ERROR_MSG_UNKNOWN_STATUS
 )
 
 from .permissions import ReservationPermissions
 from .serializers import ReservationSerializer
-from .validators import ReservationValidator
+from .validators import (
+    ReservationValidator, ReservationsTransitionValidator
+)
 
 
 class ListingReservations(ListCreateAPIView):
@@ -93,11 +108,29 @@ class ListingReservations(ListCreateAPIView):
                 }
             )
 
-        reservation = Reservation.objects.create(
+        # Overlapping reservations are rejected by database constraint
+        reservation = Reservation(
             listing=listing,
             user=request.user,
             **serializer.validated_data
         )
+        try:
+            with transaction.atomic():
+                reservation.save()
+        except IntegrityError:
+            # Only overlapping reservations are reported to client,
+            # other constraint violations are not
+            overlapping_dates = reservation.get_overlapping_dates()
+            if not overlapping_dates:
+                raise
+            return Response(
+                status=HTTP_422_UNPROCESSABLE_ENTITY,
+                data={
+                    ERROR_KEY: ERROR_MSG_OVERLAPPING_DATES.format(
+                        format_dates(overlapping_dates)
+                    )
+                }
+            )
 
         # And return positive response
         return Response(
@@ -106,3 +139,102 @@ class ListingReservations(ListCreateAPIView):
                 reservation
             ).data
         )
+
+
+class ReservationsTransition(APIView):
+    """
+    Changes status of many reservations at once (staff only)
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def post(self, request: Request) -> Response:
+        """
+        Checks every reservation status change against statuses graph
+        and applies all of them with single update or none at all
+        :param request:
+        :return:
+        """
+
+        try:
+            params = ReservationsTransitionValidator.model_validate(
+                request.data
+            )
+        except ValidationError as error:
+            return Response(
+                status=HTTP_422_UNPROCESSABLE_ENTITY,
+                data={
+                    ERROR_KEY: drf_error_details(error)
+                }
+            )
+
+        try:
+            status = ReservationStatus.objects.get_by_name(params.status)
+        except ReservationStatus.DoesNotExist:
+            return Response(
+                status=HTTP_422_UNPROCESSABLE_ENTITY,
+                data={
+                    ERROR_KEY: {
+                        Reservation.Field.status: [
+                            ERROR_MSG_UNKNOWN_STATUS.format(params.status)
+                        ]
+                    }
+                }
+            )
+
+        errors = list()
+        with transaction.atomic():
+            # Keep statuses checked unchanged until update is done
+            reservations = Reservation.objects.select_for_update().only(
+                BaseModel.Field.public_id,
+                Reservation.Field.status
+            ).filter(
+                get_public_id_filter(*params.reservations)
+            )
+            reservations = {
+                reservation.public_id: reservation
+                for reservation in reservations
+            }
+
+            for public_id in params.reservations:
+                reservation = reservations.get(public_id)
+                if reservation is None:
+                    error = ERROR_MSG_UNKNOWN_RESERVATION.format(public_id)
+                elif not transition_graph.is_allowed(
+                    ReservationStatus, reservation.status_id, status.id
+                ):
+                    error = MSG_STATUS_TRANSITION_NOT_ALLOWED.format(
+                        transition_graph.get_name(
+                            ReservationStatus, reservation.status_id
+                        ),
+                        status.name
+                    )
+                else:
+                    continue
+                errors.append({"reservation": public_id, "error": error})
+
+            if errors:
+                return Response(
+                    status=HTTP_422_UNPROCESSABLE_ENTITY,
+                    data={
+                        ERROR_KEY: errors
+                    }
+                )
+
+            updated = Reservation.objects.filter(
+                id__in=[
+                    reservation.id for reservation in reservations.values()
+                ]
+            ).exclude(
+                status=status
+            ).update(
+                status=status,
+                updated_at=now()
+            )
+
+        return Response(
+            {
+                Reservation.Field.status: status.name,
+                "updated": updated
+            }
+        )
@@ -16,8 +16,9 @@ class GetListingDigest(ModelSerializer):
     cover_photo = SerializerMethodField()
 
     def get_cover_photo(self, object: Listing) -> str:
-        if object.get_cover_photo():
-            return object.get_cover_photo().get_preview()
+        cover_photo = object.get_cover_photo()
+        if cover_photo:
+            return cover_photo.get_preview()
 
     class Meta:
         model = Listing
@@ -8,7 +8,11 @@ from PIL import Image
 
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.shortcuts import reverse
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from djmoney.money import Money
 
 from rest_framework.status import (
     HTTP_201_CREATED,
@@ -18,7 +22,7 @@ from rest_framework.status import (
 
 from core.api.tests import BaseAPITest
 from tests.data import good_listing, TEST_DIR
-from tests.objects import create_good_listing
+from tests.objects import create_good_listing, create_listings_with_covers
 
 from ...constants import ERROR_KEY
 from ...models import (
@@ -442,3 +446,339 @@ class ListingsAPITest(BaseListingsAPITest):
             ),
             False
         )
+
+    @override_settings(MEDIA_ROOT=TEST_DIR)
+    def test_listings_list_queries(self) -> None:
+        listing_object = create_good_listing()
+        url = reverse("listings:api_list")
+
+        # Queries count shouldn't depend on page size
+        with CaptureQueriesContext(connection) as single_listing:
+            self.client.get(url)
+
+        create_listings_with_covers(listing_object, 5)
+        with CaptureQueriesContext(connection) as many_listings:
+            response = self.client.get(url)
+
+        self.assertEqual(len(many_listings), len(single_listing))
+        self.assertEqual(len(response.data.get("results")), 6)
+        for listing in response.data.get("results"):
+            self.assertEqual(
+                listing.get(Listing.Field.cover_photo),
+                listing_object.get_cover_photo().get_preview()
+            )
+
+    @override_settings(MEDIA_ROOT=TEST_DIR)
+    def test_listings_list_cursor(self) -> None:
+        listings = [create_good_listing()]
+        listings += create_listings_with_covers(listings[0], 2)
+
+        # Walk through all the pages one listing per page
+        url = "{}?pagination=cursor&page_size=1".format(
+            reverse("listings:api_list")
+        )
+        slugs = list()
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn("count", response.data)
+            slugs += [
+                listing.get(Listing.Field.slug)
+                for listing in response.data.get("results")
+            ]
+            url = response.data.get("next")
+
+        self.assertEqual(
+            slugs,
+            [listing.slug for listing in listings]
+        )
+
+    @override_settings(MEDIA_ROOT=TEST_DIR)
+    def test_listing_details_queries(self) -> None:
+        listing_object = create_good_listing()
+        url = reverse(
+            "listings:api_listing_details",
+            kwargs={Listing.Field.slug: listing_object.slug}
+        )
+
+        # Queries count shouldn't depend on details graph size
+        with CaptureQueriesContext(connection) as small_graph:
+            self.client.get(url)
+
+        Photo.objects.bulk_create(
+            Photo(
+                index=index,
+                listing=listing_object,
+                file=listing_object.get_cover_photo().file.name
+            )
+            for index in range(1, 4)
+        )
+        PriceTag.objects.create(
+            listing=listing_object,
+            start_date=date.today(),
+            end_date=date.today() + relativedelta(weeks=1),
+            price=100
+        )
+        with CaptureQueriesContext(connection) as large_graph:
+            response = self.client.get(url)
+
+        self.assertEqual(len(large_graph), len(small_graph))
+        self.assertEqual(len(response.data.get("photos")), 4)
+        self.assertEqual(
+            [
+                photo.get(Photo.Field.index)
+                for photo in response.data.get("photos")
+            ],
+            [0, 1, 2, 3]
+        )
+        self.assertEqual(len(response.data.get("price_tags")), 1)
+
+    def test_listing_calendar_range(self) -> None:
+        listing_object = create_good_listing()
+        first_day = date.today().replace(day=1) + relativedelta(months=1)
+        PriceTag.objects.create(
+            listing=listing_object,
+            start_date=first_day + relativedelta(days=2),
+            end_date=first_day + relativedelta(days=5),
+            price=100
+        )
+        Reservation.objects.create(
+            listing=listing_object,
+            user=self.engage_user(),
+            check_in=first_day,
+            check_out=first_day + relativedelta(days=3)
+        )
+        self.client.logout()
+
+        url = reverse(
+            "listings:api_listing_calendar_range",
+            kwargs={Listing.Field.slug: listing_object.slug}
+        )
+
+        # Whole year is loaded with one query per data kind
+        with self.assertNumQueries(3):
+            response = self.client.get(
+                url,
+                {
+                    "from": first_day.strftime("%Y%m"),
+                    "to": (
+                        first_day + relativedelta(months=11)
+                    ).strftime("%Y%m"),
+                    "prices": "true"
+                }
+            )
+        self.assertEqual(response.status_code, 200)
+
+        months = response.data.get("months")
+        self.assertEqual(len(months), 12)
+        self.assertEqual(
+            months[0].get("month"),
+            first_day.strftime("%Y-%m")
+        )
+        self.assertTrue(months[0].get("availability").startswith("0001"))
+        self.assertEqual(months[1].get("availability").count("0"), 0)
+        self.assertEqual(
+            months[0].get("prices")[:2],
+            [[2, None, None], [4, "100.0000", "EUR"]]
+        )
+        self.assertEqual(
+            sum(nights for nights, *_ in months[0].get("prices")),
+            len(months[0].get("availability"))
+        )
+
+        # Too long ranges are rejected
+        response = self.client.get(
+            url,
+            {
+                "from": first_day.strftime("%Y%m"),
+                "to": (
+                    first_day + relativedelta(years=3)
+                ).strftime("%Y%m")
+            }
+        )
+        self.assertEqual(response.status_code, HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertIn("to", response.data.get(ERROR_KEY))
+
+    def test_listing_quote(self) -> None:
+        listing_object = create_good_listing()
+        check_in = date.today() + relativedelta(days=10)
+        price_tag = PriceTag.objects.create(
+            listing=listing_object,
+            start_date=check_in,
+            end_date=check_in + relativedelta(days=1),
+            price=100
+        )
+        self.client.logout()
+
+        url = reverse(
+            "listings:api_listing_quote",
+            kwargs={Listing.Field.slug: listing_object.slug}
+        )
+        params = {
+            "check_in": check_in,
+            "check_out": check_in + relativedelta(days=3)
+        }
+
+        # Listing, reservations and day rates
+        with self.assertNumQueries(3):
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data.get("available"))
+        self.assertEqual(
+            response.data.get("total"),
+            {"amount": "200.0000", "currency": "EUR"}
+        )
+        self.assertEqual(
+            [night.get("price") for night in response.data.get("nights")],
+            ["100.0000", "100.0000", None]
+        )
+        self.assertEqual(
+            response.data.get("missing_rates"),
+            [(check_in + relativedelta(days=2)).strftime("%Y-%m-%d")]
+        )
+
+        # Cached quote needs listing only
+        with self.assertNumQueries(1):
+            cached_response = self.client.get(url, params)
+        self.assertEqual(cached_response.data, response.data)
+
+        # Price tag changes invalidate cached quote
+        price_tag.end_date = check_in + relativedelta(days=2)
+        price_tag.save()
+        response = self.client.get(url, params)
+        self.assertEqual(response.data.get("missing_rates"), [])
+        self.assertEqual(response.data["total"]["amount"], "300.0000")
+
+        # As well as reservation ones
+        Reservation.objects.create(
+            listing=listing_object,
+            user=self.engage_user(),
+            check_in=check_in + relativedelta(days=1),
+            check_out=check_in + relativedelta(days=2)
+        )
+        response = self.client.get(url, params)
+        self.assertFalse(response.data.get("available"))
+        self.assertEqual(
+            response.data.get("unavailable_nights"),
+            [(check_in + relativedelta(days=1)).strftime("%Y-%m-%d")]
+        )
+
+        # Total is labelled with rates own currency...
+        usd_check_in = check_in + relativedelta(days=5)
+        PriceTag.objects.create(
+            listing=listing_object,
+            start_date=usd_check_in,
+            end_date=usd_check_in,
+            price=Money(50, "USD")
+        )
+        response = self.client.get(
+            url,
+            {
+                "check_in": usd_check_in,
+                "check_out": usd_check_in + relativedelta(days=1)
+            }
+        )
+        self.assertEqual(
+            response.data.get("total"),
+            {"amount": "50.0000", "currency": "USD"}
+        )
+
+        # ...and prices in different currencies are not summed up
+        response = self.client.get(
+            url,
+            {
+                "check_in": check_in,
+                "check_out": usd_check_in + relativedelta(days=1)
+            }
+        )
+        self.assertEqual(response.status_code, HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertIn("USD", response.data.get(ERROR_KEY))
+
+        # Check-out must follow check-in
+        response = self.client.get(
+            url, {"check_in": check_in, "check_out": check_in}
+        )
+        self.assertEqual(response.status_code, HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertIn(
+            Reservation.Field.check_out, response.data.get(ERROR_KEY)
+        )
+
+    def test_search_listings(self) -> None:
+        user = self.engage_user()
+        first_listing = create_good_listing()
+        second_listing = Listing.objects.create(
+            title="Second listing",
+            slug="second-listing",
+            object_type=first_listing.object_type,
+            max_guests=4,
+            bedrooms=2
+        )
+        Reservation.objects.create(
+            listing=first_listing,
+            user=user,
+            check_in=date.today() + relativedelta(days=1),
+            check_out=date.today() + relativedelta(days=3),
+        )
+
+        def search(**params) -> list:
+            response = self.client.get(
+                reverse("listings:api_search"),
+                params
+            )
+            self.assertEqual(response.status_code, 200)
+            return [
+                listing.get(Listing.Field.slug)
+                for listing in response.data.get("results")
+            ]
+
+        # Reserved listing is excluded from search results
+        self.assertEqual(
+            search(
+                check_in=date.today(),
+                check_out=date.today() + relativedelta(days=2)
+            ),
+            [second_listing.slug]
+        )
+        # Until its check-out date
+        self.assertEqual(
+            search(
+                check_in=date.today() + relativedelta(days=3),
+                check_out=date.today() + relativedelta(days=5)
+            ),
+            [first_listing.slug, second_listing.slug]
+        )
+        # Capacity filters
+        self.assertEqual(
+            search(
+                check_in=date.today() + relativedelta(days=3),
+                check_out=date.today() + relativedelta(days=5),
+                guests=3,
+                bedrooms=2
+            ),
+            [second_listing.slug]
+        )
+        # Required amenities filter
+        self.assertEqual(
+            search(
+                check_in=date.today() + relativedelta(days=3),
+                check_out=date.today() + relativedelta(days=5),
+                amenities=[
+                    amenity.id for amenity in first_listing.amenities.all()
+                ]
+            ),
+            [first_listing.slug]
+        )
+
+    def test_search_listings_wrong_dates(self) -> None:
+        response = self.client.get(
+            reverse("listings:api_search"),
+            {
+                "check_in": date.today(),
+                "check_out": date.today()
+            }
+        )
+        self.assertEqual(
+            response.status_code,
+            HTTP_422_UNPROCESSABLE_ENTITY
+        )
+        self.assertIn(ERROR_KEY, response.data)
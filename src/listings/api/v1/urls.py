@@ -1,6 +1,10 @@
 from django.urls import path, include
 
-from .views import Listings, ListingDetails, Calendar
+from .price_tags.views import PriceTagsImport
+from .reservations.views import ReservationsTransition
+from .views import (
+    Listings, SearchListings, ListingDetails, Calendar, CalendarRange, Quote
+)
 
 urlpatterns = [
     # Object types module
@@ -24,6 +28,24 @@ urlpatterns = [
             "listings.api.v1.reservations.statuses.urls"
         )
     ),
+    # Status change of many reservations at once
+    path(
+        "reservations/transitions",
+        ReservationsTransition.as_view(),
+        name="api_reservations_transition"
+    ),
+    # Price tags of many listings at once
+    path(
+        "price_tags/import",
+        PriceTagsImport.as_view(),
+        name="api_price_tags_import"
+    ),
+    # Listings available for requested dates
+    path(
+        "search",
+        SearchListings.as_view(),
+        name="api_search"
+    ),
     # Single listing details
     path(
         "<slug:slug>",
@@ -48,6 +70,18 @@ urlpatterns = [
             "listings.api.v1.reservations.urls"
         )
     ),
+    # Single listing availability for months range
+    path(
+        "<slug:slug>/calendar",
+        CalendarRange.as_view(),
+        name="api_listing_calendar_range"
+    ),
+    # Stay price and availability for requested dates
+    path(
+        "<slug:slug>/quote",
+        Quote.as_view(),
+        name="api_listing_quote"
+    ),
     # Single listing details
     path(
         "<slug:slug>/calendar/<str:month>",
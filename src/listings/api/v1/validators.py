@@ -1,11 +1,22 @@
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from datetime import date
+from typing import List, Optional
+from pydantic import (
+    BaseModel, Field, ValidationInfo, field_validator
+)
+from pyngo import QueryDictModel
 
 from ...constants import (
+    CALENDAR_MAX_MONTHS,
     ERROR_MSG_UNKNOWN_AMENITIES,
-    ERROR_MSG_UNKNOWN_HOUSE_RULES
+    ERROR_MSG_UNKNOWN_HOUSE_RULES,
+    ERROR_MSG_WRONG_DATES_ORDER,
+    ERROR_MSG_WRONG_MONTH,
+    ERROR_MSG_WRONG_MONTHS_ORDER,
+    ERROR_MSG_TOO_MANY_MONTHS,
+    ERROR_MSG_TOO_LONG_STAY,
+    QUOTE_MAX_NIGHTS
 )
-from ...models import Amenity, HouseRule, Listing
+from ...models import Amenity, HouseRule, Listing, Reservation
 
 
 class PostListing(BaseModel):
@@ -58,3 +69,83 @@ class PostListing(BaseModel):
                 ERROR_MSG_UNKNOWN_HOUSE_RULES.format(lost_ids)
             )
         return house_rules
+
+
+class StayDatesValidator(QueryDictModel):
+    """
+    Pydantic model for stay dates parameters validation
+    """
+
+    check_in: date
+    check_out: date
+
+    @field_validator(Reservation.Field.check_out)
+    def check_dates_order(cls, check_out: date, info: ValidationInfo) -> date:
+        check_in = info.data.get(Reservation.Field.check_in)
+        if check_in and check_out <= check_in:
+            raise ValueError(ERROR_MSG_WRONG_DATES_ORDER)
+        return check_out
+
+
+class SearchListingsValidator(StayDatesValidator):
+    """
+    Pydantic model for listings search parameters validation
+    """
+
+    guests: int = Field(default=1, ge=1)
+    bedrooms: int = Field(default=0, ge=0)
+    object_type: Optional[int] = None
+    amenities: List[int] = []
+
+
+class QuoteValidator(StayDatesValidator):
+    """
+    Pydantic model for stay quote parameters validation
+    """
+
+    @field_validator(Reservation.Field.check_out)
+    def check_stay_length(
+            cls, check_out: date, info: ValidationInfo
+    ) -> date:
+        check_in = info.data.get(Reservation.Field.check_in)
+        if check_in and (check_out - check_in).days > QUOTE_MAX_NIGHTS:
+            raise ValueError(
+                ERROR_MSG_TOO_LONG_STAY.format(QUOTE_MAX_NIGHTS)
+            )
+        return check_out
+
+
+class CalendarRangeValidator(QueryDictModel):
+    """
+    Pydantic model for calendar range parameters validation
+    (months are passed as YYYYMM and stored as their first days)
+    """
+
+    first_month: date = Field(alias="from")
+    last_month: date = Field(alias="to")
+    prices: bool = False
+
+    @field_validator("first_month", "last_month", mode="before")
+    def parse_month(cls, month: str) -> date:
+        try:
+            return date(int(month[:4]), int(month[4:]), 1)
+        except (TypeError, ValueError):
+            raise ValueError(ERROR_MSG_WRONG_MONTH.format(month))
+
+    @field_validator("last_month")
+    def check_months_range(
+            cls, last_month: date, info: ValidationInfo
+    ) -> date:
+        first_month = info.data.get("first_month")
+        if first_month:
+            if last_month < first_month:
+                raise ValueError(ERROR_MSG_WRONG_MONTHS_ORDER)
+            months = (
+                (last_month.year - first_month.year) * 12
+                + last_month.month - first_month.month + 1
+            )
+            if months > CALENDAR_MAX_MONTHS:
+                raise ValueError(
+                    ERROR_MSG_TOO_MANY_MONTHS.format(CALENDAR_MAX_MONTHS)
+                )
+        return last_month
@@ -1,12 +1,17 @@
-from datetime import date
+from datetime import date, timedelta
+from decimal import Decimal
 from dateutil.relativedelta import relativedelta
+from itertools import groupby
 
 from pydantic import ValidationError
 from pyngo import drf_error_details
 
+from django.conf import settings
+from django.core.cache import cache
 from django.http import Http404
 
 from rest_framework.generics import (
+    ListAPIView,
     ListCreateAPIView,
     RetrieveUpdateDestroyAPIView
 )
@@ -19,23 +24,29 @@ from rest_framework.status import (
 )
 from rest_framework.views import APIView
 
-from core.api.paginators import BasePaginator
+from core.api.paginators import (
+    BasePaginator, BaseCursorPaginator, CursorPaginationMixin
+)
 from core.constants import MSG_WRONG_MONTH_FORMAT
+from core.utils.dates import daterange_generator
 
 from ...constants import (
-    ERROR_KEY, LISTINGS_ORDERING,
-    ERROR_MSG_UNKNOWN_LISTING
+    ERROR_KEY, LISTINGS_ORDERING, QUOTE_CACHE_KEY,
+    ERROR_MSG_UNKNOWN_LISTING, ERROR_MSG_QUOTE_MIXED_CURRENCIES
 )
-from ...models import Listing
+from ...models import DayRate, Listing
 
 from .permissions import ListingPermissions
 from .serializers import (
     GetListingDigest, GetListingDetails, PostListingSerializer
 )
-from .validators import PostListing
+from .validators import (
+    CalendarRangeValidator, PostListing, QuoteValidator,
+    SearchListingsValidator
+)
 
 
-class Listings(ListCreateAPIView):
+class Listings(CursorPaginationMixin, ListCreateAPIView):
     """
     Manages object types listing and new object types creation
     """
@@ -45,7 +56,7 @@ class Listings(ListCreateAPIView):
     permission_classes = [ListingPermissions]
 
     def get_queryset(self):
-        return Listing.objects.all().order_by(
+        return Listing.objects.get_previews().order_by(
             LISTINGS_ORDERING
         )
 
@@ -91,12 +102,56 @@ class Listings(ListCreateAPIView):
         )
 
 
+class SearchListings(ListAPIView):
+    """
+    Manages search of listings available for requested dates and guests
+    """
+
+    serializer_class = GetListingDigest
+    pagination_class = BaseCursorPaginator
+    permission_classes = [ListingPermissions]
+
+    def get_queryset(self):
+        return Listing.objects.search(
+            **self.search_params.model_dump()
+        )
+
+    def list(
+            self,
+            request: Request,
+            *args: list,
+            **kwargs: dict
+    ) -> Response:
+        """
+        Listings search routine
+        :param request:
+        :param args:
+        :param kwargs:
+        :return:
+        """
+
+        # First, validate search parameters using pydantic class
+        try:
+            self.search_params = SearchListingsValidator.model_validate(
+                request.query_params
+            )
+        except ValidationError as error:
+            return Response(
+                status=HTTP_422_UNPROCESSABLE_ENTITY,
+                data={
+                    ERROR_KEY: drf_error_details(error)
+                }
+            )
+
+        return super().list(request, *args, **kwargs)
+
+
 class ListingDetails(RetrieveUpdateDestroyAPIView):
     """
     Manages single object type instance lifecycle
     """
 
-    queryset = Listing.objects.all()
+    queryset = Listing.objects.get_details()
     lookup_field = Listing.Field.slug
     lookup_url_kwarg = Listing.Field.slug
     serializer_class = GetListingDetails
@@ -150,3 +205,230 @@ class Calendar(APIView):
                     ) for current_date in month_data
             }
         )
+
+
+class CalendarRange(APIView):
+    """
+    Retrieves single listing availability (and optionally nightly prices)
+    for the range of months in compact form
+    """
+
+    permission_classes = [ListingPermissions]
+
+    def get(self, request: Request, slug: str) -> Response:
+        """
+        Builds every month availability bitstring ("1" - free night)
+        and nightly prices run-length encoded as [nights, amount, currency]
+        :param request:
+        :param slug:
+        :return:
+        """
+
+        try:
+            # Obtain listing to display calendar for
+            listing = Listing.objects.get(slug=slug)
+        except Listing.DoesNotExist:
+            raise Http404(
+                ERROR_MSG_UNKNOWN_LISTING.format(
+                    slug
+                )
+            )
+
+        try:
+            params = CalendarRangeValidator.model_validate(
+                request.query_params
+            )
+        except ValidationError as error:
+            return Response(
+                status=HTTP_422_UNPROCESSABLE_ENTITY,
+                data={
+                    ERROR_KEY: drf_error_details(error)
+                }
+            )
+
+        # Whole range is loaded at once: one query for reservations
+        # and (if requested) one more for day rates
+        last_day = params.last_month + relativedelta(months=1, days=-1)
+        availability = listing.get_availability(
+            params.first_month, last_day
+        )
+        if params.prices:
+            rates = {
+                rate_date: (str(price), currency)
+                for rate_date, price, currency in DayRate.objects.filter(
+                    listing=listing,
+                    date__range=(params.first_month, last_day)
+                ).values_list(
+                    DayRate.Field.date,
+                    DayRate.Field.price,
+                    DayRate.Field.price_currency
+                )
+            }
+
+        months = list()
+        month = params.first_month
+        while month <= params.last_month:
+            days = list(
+                daterange_generator(
+                    month,
+                    month + relativedelta(months=1, days=-1)
+                )
+            )
+            month_data = {
+                "month": month.strftime("%Y-%m"),
+                "availability": "".join(
+                    "1" if availability.get(day) else "0"
+                    for day in days
+                )
+            }
+            if params.prices:
+                month_data["prices"] = [
+                    [len(list(nights)), *price]
+                    for price, nights in groupby(
+                        days,
+                        key=lambda day: rates.get(day, (None, None))
+                    )
+                ]
+            months.append(month_data)
+            month += relativedelta(months=1)
+
+        return Response(
+            {
+                "from": params.first_month.strftime("%Y-%m-%d"),
+                "to": last_day.strftime("%Y-%m-%d"),
+                "months": months
+            }
+        )
+
+
+class Quote(APIView):
+    """
+    Calculates stay price and availability for requested dates
+    without creating any reservation
+    """
+
+    permission_classes = [ListingPermissions]
+
+    def get(self, request: Request, slug: str) -> Response:
+        """
+        Returns stay quote for [check_in, check_out) nights
+        :param request:
+        :param slug:
+        :return:
+        """
+
+        try:
+            listing = Listing.objects.get(slug=slug)
+        except Listing.DoesNotExist:
+            raise Http404(
+                ERROR_MSG_UNKNOWN_LISTING.format(
+                    slug
+                )
+            )
+
+        try:
+            params = QuoteValidator.model_validate(
+                request.query_params
+            )
+        except ValidationError as error:
+            return Response(
+                status=HTTP_422_UNPROCESSABLE_ENTITY,
+                data={
+                    ERROR_KEY: drf_error_details(error)
+                }
+            )
+
+        try:
+            quote = self.get_quote(listing, params.check_in, params.check_out)
+        except ValueError as error:
+            return Response(
+                status=HTTP_422_UNPROCESSABLE_ENTITY,
+                data={
+                    ERROR_KEY: str(error)
+                }
+            )
+
+        return Response(quote)
+
+    @staticmethod
+    def get_quote(listing: Listing, check_in: date, check_out: date) -> dict:
+        """
+        Builds quote using one availability and one day rates query,
+        quotes are cached until listing reservations or price tags change
+        (both bump corresponding listing versions used in cache key),
+        raises ValueError if nights are priced in different currencies
+        :param listing:
+        :param check_in:
+        :param check_out:
+        :return:
+        """
+
+        cache_key = QUOTE_CACHE_KEY.format(
+            listing.id,
+            listing.availability_version,
+            listing.pricing_version,
+            check_in,
+            check_out
+        )
+        quote = cache.get(cache_key)
+        if quote is not None:
+            return quote
+
+        last_night = check_out - timedelta(days=1)
+        availability = listing.get_availability(check_in, last_night)
+        rates = {
+            rate_date: (price, currency)
+            for rate_date, price, currency in DayRate.objects.filter(
+                listing=listing,
+                date__range=(check_in, last_night)
+            ).values_list(
+                DayRate.Field.date,
+                DayRate.Field.price,
+                DayRate.Field.price_currency
+            )
+        }
+
+        # Prices in different currencies cannot be summed up
+        currencies = sorted({currency for _, currency in rates.values()})
+        if len(currencies) > 1:
+            raise ValueError(
+                ERROR_MSG_QUOTE_MIXED_CURRENCIES.format(
+                    ", ".join(currencies)
+                )
+            )
+
+        nights = list()
+        total = Decimal(0)
+        for night in daterange_generator(check_in, last_night):
+            price, currency = rates.get(night, (None, None))
+            nights.append(
+                {
+                    "date": night.strftime("%Y-%m-%d"),
+                    "available": availability.get(night, False),
+                    "price": None if price is None else str(price),
+                    "currency": currency
+                }
+            )
+            total += price or 0
+
+        quote = {
+            "check_in": check_in.strftime("%Y-%m-%d"),
+            "check_out": check_out.strftime("%Y-%m-%d"),
+            "available": all(night["available"] for night in nights),
+            # Same sum reservation for these dates would cost
+            "total": {
+                "amount": str(total),
+                "currency": (
+                    currencies[0] if currencies else settings.BASE_CURRENCY
+                )
+            },
+            "nights": nights,
+            "unavailable_nights": [
+                night["date"] for night in nights if not night["available"]
+            ],
+            "missing_rates": [
+                night["date"] for night in nights if night["price"] is None
+            ]
+        }
+        cache.set(cache_key, quote, settings.QUOTE_CACHE_TIMEOUT)
+        return quote
@@ -0,0 +1,304 @@
+from contextlib import contextmanager
+from datetime import date, timedelta
+from fcntl import flock, LOCK_EX, LOCK_UN
+from mmap import mmap, ACCESS_READ
+from os import pwrite, replace, stat
+from os.path import exists
+from struct import Struct
+from typing import Callable, Iterable, Optional
+
+from django.conf import settings
+
+
+def build_availability(
+        intervals: Iterable[tuple[date, date]],
+        start_date: date,
+        end_date: date
+) -> dict[date, bool]:
+    """
+    Sweeps reserved intervals into per-day availability flags
+    for the window between start_date and end_date (inclusive).
+    Every interval is a (first busy day, last busy day) pair,
+    so the whole window costs O(days + intervals) in memory
+    instead of one database query per day
+    :param intervals:
+    :param start_date:
+    :param end_date:
+    :return:
+    """
+
+    days_count = (end_date - start_date).days + 1
+    if days_count <= 0:
+        return dict()
+
+    # Mark every interval boundary within the window
+    deltas = [0] * (days_count + 1)
+    for first_day, last_day in intervals:
+        first_index = max((first_day - start_date).days, 0)
+        last_index = min((last_day - start_date).days, days_count - 1)
+        if first_index > last_index:
+            continue
+        deltas[first_index] += 1
+        deltas[last_index + 1] -= 1
+
+    # And collect them into running overlaps counter
+    availability = dict()
+    overlaps = 0
+    for index in range(days_count):
+        overlaps += deltas[index]
+        availability[start_date + timedelta(index)] = overlaps == 0
+
+    return availability
+
+
+class AvailabilityBitmap:
+    """
+    Compact per-listing availability index shared by all the worker
+    processes on a node through mmap-backed file.
+    File starts with a header (origin date ordinal, horizon in days,
+    slots count) followed by fixed-size slot per listing id:
+    one "indexed" byte, listing availability version the slot was
+    built for and one bit per night (set bit - reserved) over the
+    horizon starting at origin date. Slots built for other versions
+    are not used, so listing changes committed but not yet indexed
+    are served by the database
+    """
+
+    MAGIC = b"DWAV"
+    HEADER = Struct("<4sIII")
+    VERSION = Struct("<I")
+    INDEXED = 1
+    # Slot nights area offset
+    NIGHTS = 1 + VERSION.size
+
+    def __init__(self, path=None, horizon=None, slots=None):
+        self._path = path
+        self._horizon = horizon
+        self._slots = slots
+        self._map = None
+        self._inode = None
+
+    @property
+    def path(self) -> Optional[str]:
+        return self._path or settings.AVAILABILITY_BITMAP_PATH
+
+    @property
+    def horizon(self) -> int:
+        return self._horizon or settings.AVAILABILITY_BITMAP_HORIZON
+
+    @property
+    def slots(self) -> int:
+        return self._slots or settings.AVAILABILITY_BITMAP_SLOTS
+
+    @classmethod
+    def get_slot_size(cls, horizon: int) -> int:
+        return cls.NIGHTS + (horizon + 7) // 8
+
+    @staticmethod
+    def mark_reserved(
+            buffer: bytearray,
+            offset: int,
+            first_day: date,
+            last_day: date,
+            origin: date,
+            horizon: int
+    ) -> None:
+        """
+        Sets bits of reserved nights (clipped by horizon)
+        in the slot nights area starting at offset
+        :param buffer:
+        :param offset:
+        :param first_day:
+        :param last_day:
+        :param origin:
+        :param horizon:
+        :return:
+        """
+        first_index = max((first_day - origin).days, 0)
+        last_index = min((last_day - origin).days, horizon - 1)
+        for index in range(first_index, last_index + 1):
+            buffer[offset + (index >> 3)] |= 1 << (index & 7)
+
+    @contextmanager
+    def lock(self):
+        """
+        Serializes writers (signal processors and rebuild command)
+        using advisory lock on companion file
+        :return:
+        """
+        with open("{}.lock".format(self.path), "a") as lock_file:
+            flock(lock_file, LOCK_EX)
+            try:
+                yield
+            finally:
+                flock(lock_file, LOCK_UN)
+
+    def _get_map(self) -> Optional[mmap]:
+        """
+        Returns read-only mapping of the current bitmap file,
+        remapping it after file was replaced by full rebuild
+        :return:
+        """
+        if not self.path:
+            return None
+
+        try:
+            inode = stat(self.path).st_ino
+            if self._map is None or self._inode != inode:
+                with open(self.path, "rb") as source:
+                    bitmap = mmap(source.fileno(), 0, access=ACCESS_READ)
+                if self._map is not None:
+                    self._map.close()
+                self._map, self._inode = bitmap, inode
+        except (OSError, ValueError):
+            return None
+
+        return self._map
+
+    def get_availability(
+            self,
+            listing_id: int,
+            version: int,
+            start_date: date,
+            end_date: date
+    ) -> Optional[dict[date, bool]]:
+        """
+        Returns listing availability for every date between start_date
+        and end_date (inclusive) or None if bitmap cannot answer
+        (not built, listing not indexed for the version yet
+        or dates are out of horizon)
+        :param listing_id:
+        :param version: listing availability version
+        :param start_date:
+        :param end_date:
+        :return:
+        """
+        bitmap = self._get_map()
+        if bitmap is None or len(bitmap) < self.HEADER.size:
+            return None
+
+        magic, origin, horizon, slots = self.HEADER.unpack_from(bitmap)
+        if magic != self.MAGIC or not 0 <= listing_id < slots:
+            return None
+
+        first_index = start_date.toordinal() - origin
+        last_index = end_date.toordinal() - origin
+        if first_index < 0 or last_index >= horizon:
+            return None
+
+        offset = self.HEADER.size + listing_id * self.get_slot_size(horizon)
+        if bitmap[offset] != self.INDEXED or self.VERSION.unpack_from(
+                bitmap, offset + 1
+        )[0] != version:
+            return None
+
+        nights = bitmap[
+            offset + self.NIGHTS:offset + self.NIGHTS + 1 + (last_index >> 3)
+        ]
+        return {
+            start_date + timedelta(index - first_index):
+                not nights[index >> 3] >> (index & 7) & 1
+            for index in range(first_index, last_index + 1)
+        }
+
+    def refresh(
+            self,
+            listing_id: int,
+            get_version: Callable[[], Optional[int]],
+            get_intervals: Callable[[date, date], list[tuple[date, date]]]
+    ) -> None:
+        """
+        Rewrites single listing slot in place using intervals
+        obtained for the bitmap horizon (no-op if bitmap
+        was not built yet or listing doesn't fit into it).
+        Version is obtained before intervals, so slot data
+        is never older than the version it is marked with
+        :param listing_id:
+        :param get_version: listing availability version provider
+        :param get_intervals: (first night, last night) pairs provider
+        :return:
+        """
+        if not self.path or not exists(self.path):
+            return
+
+        with self.lock(), open(self.path, "r+b") as target:
+            header = target.read(self.HEADER.size)
+            if len(header) < self.HEADER.size:
+                return
+            magic, origin, horizon, slots = self.HEADER.unpack(header)
+            if magic != self.MAGIC or not 0 <= listing_id < slots:
+                return
+
+            version = get_version()
+            if version is None:
+                return
+
+            origin = date.fromordinal(origin)
+            slot = bytearray(self.get_slot_size(horizon))
+            slot[0] = self.INDEXED
+            self.VERSION.pack_into(slot, 1, version)
+            for first_day, last_day in get_intervals(
+                origin, origin + timedelta(horizon - 1)
+            ):
+                self.mark_reserved(
+                    slot, self.NIGHTS, first_day, last_day, origin, horizon
+                )
+
+            pwrite(
+                target.fileno(),
+                slot,
+                self.HEADER.size + listing_id * len(slot)
+            )
+
+    def rebuild(
+            self,
+            listing_versions: Iterable[tuple[int, int]],
+            intervals: Iterable[tuple[int, date, date]],
+            origin: date
+    ) -> None:
+        """
+        Writes brand-new bitmap file starting at origin date
+        and atomically replaces existing one
+        :param listing_versions: (listing id, availability version)
+        pairs of all the listings to be marked as indexed (consumed
+        before intervals, so slots data is never older than versions)
+        :param intervals: (listing id, first night, last night) triples,
+        lazy iterables are consumed under the writers lock
+        :param origin:
+        :return:
+        """
+        horizon, slots = self.horizon, self.slots
+        slot_size = self.get_slot_size(horizon)
+        contents = bytearray(self.HEADER.size + slots * slot_size)
+        self.HEADER.pack_into(
+            contents, 0, self.MAGIC, origin.toordinal(), horizon, slots
+        )
+
+        # Keep signal processors waiting while data is being collected
+        with self.lock():
+            for listing_id, version in listing_versions:
+                if 0 <= listing_id < slots:
+                    offset = self.HEADER.size + listing_id * slot_size
+                    contents[offset] = self.INDEXED
+                    self.VERSION.pack_into(contents, offset + 1, version)
+
+            for listing_id, first_day, last_day in intervals:
+                if 0 <= listing_id < slots:
+                    self.mark_reserved(
+                        contents,
+                        self.HEADER.size + listing_id * slot_size
+                        + self.NIGHTS,
+                        first_day,
+                        last_day,
+                        origin,
+                        horizon
+                    )
+
+            temp_path = "{}.tmp".format(self.path)
+            with open(temp_path, "wb") as target:
+                target.write(contents)
+            replace(temp_path, self.path)
+
+
+# Per-process handle, file contents are shared via page cache
+availability_bitmap = AvailabilityBitmap()
@@ -3,15 +3,45 @@ from django.utils.translation import gettext_lazy as _
 from core.models import BaseModel
 
 LISTINGS_ORDERING = "{}".format(BaseModel.Field.created_at)
+# Rendered calendar month: listing id, availability version, first day
+CALENDAR_CACHE_KEY = "listings:calendar:{}:{}:{:%Y%m}"
+# Longest span available via calendar range API
+CALENDAR_MAX_MONTHS = 24
+# Stay quote: listing id, availability and pricing versions, dates
+QUOTE_CACHE_KEY = "listings:quote:{}:{}:{}:{:%Y%m%d}:{:%Y%m%d}"
+# Longest stay available for quoting
+QUOTE_MAX_NIGHTS = 366
 
 ERROR_KEY = "error"
 ERROR_MSG_UNKNOWN_LISTING = _("Unknown listing slug: {}")
+ERROR_MSG_UNKNOWN_STATUS = _("Unknown status: {}")
 ERROR_MSG_UNKNOWN_AMENITIES = _("Unknown amenities ids: {}")
 ERROR_MSG_UNKNOWN_HOUSE_RULES = _("Unknown house rule ids: {}")
 ERROR_MSG_NEGATIVE_DAY_RATE = _("Rent price cannot be below zero: {}")
 ERROR_MSG_OVERLAPPING_DATES = _("Some overlapping dates were found: {}")
+ERROR_MSG_WRONG_DATES_ORDER = _("Check-out date must be after check-in date")
+ERROR_MSG_WRONG_DATES_RANGE = _("End date cannot precede start date")
+ERROR_MSG_TOO_LONG_STAY = _("No more than {} nights can be quoted")
+ERROR_MSG_OVERLAPPING_PRICE_TAG = _(
+    "Dates range overlaps another price tag: {} - {}"
+)
+ERROR_MSG_UNKNOWN_CURRENCY = _("Unknown currency: {}")
+ERROR_MSG_QUOTE_MIXED_CURRENCIES = _(
+    "Nights priced in different currencies cannot be quoted: {}"
+)
+ERROR_MSG_NOT_A_LIST = _("List of price tags is expected")
+ERROR_MSG_WRONG_MONTH = _("Cannot interpret month {} (YYYYMM is needed)")
+ERROR_MSG_WRONG_MONTHS_ORDER = _("Last month cannot precede the first one")
+ERROR_MSG_TOO_MANY_MONTHS = _("No more than {} months can be requested")
 ERROR_MSG_NO_FIXTURE = _("Source file {} doesn't exist")
 ERROR_MSG_JSON_DECODING = _("JSON decode error: {}")
+ERROR_MSG_UNKNOWN_USER = _("Unknown user email: {}")
+ERROR_MSG_ICS_CONFLICT = _(
+    "Reservations changed during import, nothing was imported: {}"
+)
+ERROR_MSG_NO_AVAILABILITY_BITMAP = _(
+    "Availability bitmap path is not configured"
+)
 
 INFO_MSG_RESERVATION_STATUSES_LOADED = _(
     "Reservation statuses data loaded successfully"
@@ -19,3 +49,23 @@ INFO_MSG_RESERVATION_STATUSES_LOADED = _(
 INFO_MSG_AMENITIES_LOADED = _(
     "Amenities data loaded successfully"
 )
+INFO_MSG_AVAILABILITY_BITMAP_REBUILT = _(
+    "Availability bitmap rebuilt: {} listings, {} reservations"
+)
+INFO_MSG_ICS_EVENT_SKIPPED = _("Skipped event {} ({} - {}): {}")
+INFO_MSG_ICS_IMPORTED = _(
+    "Reservations imported: {}, events skipped: {}"
+)
+ICS_SKIP_REASON_WRONG_DATES = _("wrong dates")
+ICS_SKIP_REASON_OVERLAPPING = _("overlapping dates")
+ICS_IMPORT_COMMENT = _("Imported from iCalendar: {} ({})")
+INFO_MSG_PRICE_TAGS_IMPORTED = _("Price tags imported: {}")
+ERROR_MSG_PRICE_TAGS_ROW = _("Row {}: {}")
+ERROR_MSG_PRICE_TAGS_CONFLICT = _(
+    "Price tags changed during import, nothing was imported"
+)
+ERROR_MSG_UNKNOWN_FILE_FORMAT = _("Unsupported file format: {}")
+INFO_MSG_SEARCH_BENCHMARK = _("{}: {:.1f} ms per first page (median of {})")
+INFO_MSG_SEARCH_BENCHMARK_SEEDED = _(
+    "Benchmark data seeded: {} listings, {} reservations"
+)
@@ -0,0 +1,121 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Iterator, NamedTuple
+
+from django.conf import settings
+
+CRLF = "\r\n"
+DATE_FORMAT = "%Y%m%d"
+TIMESTAMP_FORMAT = "%Y%m%dT%H%M%SZ"
+
+
+class Event(NamedTuple):
+    """
+    Single all-day iCalendar event: [start, end) dates
+    """
+
+    uid: str
+    summary: str
+    start: date
+    end: date
+
+
+def escape(text: str) -> str:
+    """Escapes iCalendar TEXT value special characters."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def generate_calendar(
+        name: str, events: Iterable[tuple[str, date, date, datetime]]
+) -> Iterator[str]:
+    """
+    Yields iCalendar document line by line for (uid, start date,
+    end date, last change) tuples, so it can be streamed as is
+    :param name:
+    :param events:
+    :return:
+    """
+
+    yield "BEGIN:VCALENDAR" + CRLF
+    yield "VERSION:2.0" + CRLF
+    yield "PRODID:-//{}//Reservations//EN".format(
+        settings.PROJECT_NAME
+    ) + CRLF
+    yield "CALSCALE:GREGORIAN" + CRLF
+    yield "X-WR-CALNAME:{}".format(escape(name)) + CRLF
+
+    for uid, start, end, changed_at in events:
+        yield CRLF.join(
+            (
+                "BEGIN:VEVENT",
+                "UID:{}".format(uid),
+                "DTSTAMP:{}".format(
+                    changed_at.astimezone(timezone.utc).strftime(
+                        TIMESTAMP_FORMAT
+                    )
+                ),
+                "DTSTART;VALUE=DATE:{}".format(start.strftime(DATE_FORMAT)),
+                "DTEND;VALUE=DATE:{}".format(end.strftime(DATE_FORMAT)),
+                "SUMMARY:Reserved",
+                "TRANSP:OPAQUE",
+                "END:VEVENT",
+            )
+        ) + CRLF
+
+    yield "END:VCALENDAR" + CRLF
+
+
+def parse_date(value: str) -> date:
+    """Reads DATE or DATE-TIME property value as date."""
+    return datetime.strptime(value[:8], DATE_FORMAT).date()
+
+
+def parse_events(lines: Iterable[str]) -> list[Event]:
+    """
+    Extracts all-day events from iCalendar document lines
+    (nights are [DTSTART, DTEND), missing DTEND means single night)
+    :param lines:
+    :return:
+    """
+
+    # Unfold continuation lines first
+    unfolded = list()
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and unfolded:
+            unfolded[-1] += line[1:]
+        elif line:
+            unfolded.append(line)
+
+    events = list()
+    properties = None
+    for line in unfolded:
+        if line == "BEGIN:VEVENT":
+            properties = dict()
+        elif line == "END:VEVENT" and properties is not None:
+            if "DTSTART" in properties:
+                start = parse_date(properties["DTSTART"])
+                end = (
+                    parse_date(properties["DTEND"])
+                    if "DTEND" in properties
+                    else start + timedelta(days=1)
+                )
+                events.append(
+                    Event(
+                        uid=properties.get("UID", ""),
+                        summary=properties.get("SUMMARY", ""),
+                        start=start,
+                        end=end
+                    )
+                )
+            properties = None
+        elif properties is not None and ":" in line:
+            name, value = line.split(":", 1)
+            # Property parameters (e.g. ";VALUE=DATE") are not needed
+            properties[name.split(";", 1)[0].upper()] = value
+
+    return events
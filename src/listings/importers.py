@@ -0,0 +1,220 @@
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import (
+    BaseModel as PydanticModel, Field, ValidationError as PydanticError,
+    ValidationInfo, field_validator
+)
+from pyngo import drf_error_details
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from djmoney.money import Money
+
+from core.utils.dates import daterange_generator
+
+from .constants import (
+    ERROR_MSG_UNKNOWN_LISTING, ERROR_MSG_UNKNOWN_CURRENCY,
+    ERROR_MSG_WRONG_DATES_RANGE, ERROR_MSG_OVERLAPPING_PRICE_TAG,
+    ERROR_MSG_PRICE_TAGS_CONFLICT
+)
+from .models import Listing, PriceTag, DayRate
+
+
+class PriceTagRow(PydanticModel):
+    """
+    Pydantic model for single imported price tag validation
+    (CSV empty cells are treated as missing values)
+    """
+
+    listing: str
+    start_date: date
+    end_date: date
+    price: Decimal = Field(ge=0)
+    currency: Optional[str] = None
+    description: str = ""
+
+    @field_validator("currency", mode="before")
+    def empty_currency(cls, currency: Optional[str]) -> Optional[str]:
+        return currency or None
+
+    @field_validator("currency")
+    def check_currency(cls, currency: Optional[str]) -> Optional[str]:
+        if currency and currency not in settings.CURRENCIES:
+            raise ValueError(ERROR_MSG_UNKNOWN_CURRENCY.format(currency))
+        return currency
+
+    @field_validator(PriceTag.Field.end_date)
+    def check_dates_order(
+            cls, end_date: date, info: ValidationInfo
+    ) -> date:
+        start_date = info.data.get(PriceTag.Field.start_date)
+        if start_date and end_date < start_date:
+            raise ValueError(ERROR_MSG_WRONG_DATES_RANGE)
+        return end_date
+
+
+class PriceTagsImporter:
+    """
+    Validates many price tags (across many listings) in memory
+    and writes them along with their day rates using a few batched
+    statements in one transaction - all or nothing
+    """
+
+    BATCH_SIZE = 1000
+
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        # Row number (starting from 1) - field errors pairs
+        self.errors: list[dict] = list()
+        self.price_tags: list[PriceTag] = list()
+
+    def add_error(self, row_number: int, field: str, message: str) -> None:
+        self.errors.append(
+            {
+                "row": row_number,
+                "errors": {field: [message]}
+            }
+        )
+
+    def validate(self) -> bool:
+        """
+        Checks every row, listings existence and date ranges
+        against each other and existing price tags
+        :return:
+        """
+
+        valid_rows = list()
+        for row_number, row in enumerate(self.rows, start=1):
+            try:
+                valid_rows.append(
+                    (row_number, PriceTagRow.model_validate(row))
+                )
+            except PydanticError as error:
+                self.errors.append(
+                    {
+                        "row": row_number,
+                        "errors": drf_error_details(error)
+                    }
+                )
+
+        # Resolve all the listings at once
+        listings = Listing.objects.in_bulk(
+            {row.listing for _, row in valid_rows},
+            field_name=Listing.Field.slug
+        )
+
+        # Group new ranges by listing
+        new_ranges = defaultdict(list)
+        for row_number, row in valid_rows:
+            listing = listings.get(row.listing)
+            if listing is None:
+                self.add_error(
+                    row_number,
+                    PriceTag.Field.listing,
+                    ERROR_MSG_UNKNOWN_LISTING.format(row.listing)
+                )
+                continue
+            new_ranges[listing.id].append((row.start_date, row, row_number))
+
+        # Load existing ranges of all the listings involved at once
+        existing_ranges = defaultdict(list)
+        for listing_id, start_date, end_date in PriceTag.objects.filter(
+            listing_id__in=new_ranges.keys()
+        ).values_list(
+            "listing_id",
+            PriceTag.Field.start_date,
+            PriceTag.Field.end_date
+        ):
+            existing_ranges[listing_id].append((start_date, end_date))
+
+        for listing_id, ranges in new_ranges.items():
+            existing = sorted(existing_ranges[listing_id])
+            starts = [start_date for start_date, _ in existing]
+            last_range = None
+            for start_date, row, row_number in sorted(
+                ranges, key=lambda item: item[0]
+            ):
+                # Existing price tags never overlap each other,
+                # so checking the latest one starting before end is enough
+                index = bisect_right(starts, row.end_date) - 1
+                if index >= 0 and existing[index][1] >= row.start_date:
+                    conflict = existing[index]
+                elif last_range and last_range[1] >= row.start_date:
+                    conflict = last_range
+                else:
+                    conflict = None
+
+                if conflict:
+                    self.add_error(
+                        row_number,
+                        PriceTag.Field.start_date,
+                        ERROR_MSG_OVERLAPPING_PRICE_TAG.format(*conflict)
+                    )
+                    continue
+
+                last_range = (row.start_date, row.end_date)
+                self.price_tags.append(
+                    PriceTag(
+                        listing=listings[row.listing],
+                        start_date=row.start_date,
+                        end_date=row.end_date,
+                        price=Money(
+                            row.price,
+                            row.currency or settings.BASE_CURRENCY
+                        ),
+                        description=row.description
+                    )
+                )
+
+        self.errors.sort(key=lambda error: error["row"])
+        return not self.errors
+
+    def save(self) -> list[PriceTag]:
+        """
+        Writes validated price tags and their day rates
+        :return:
+        """
+
+        try:
+            with transaction.atomic():
+                PriceTag.objects.bulk_create(
+                    self.price_tags,
+                    batch_size=self.BATCH_SIZE
+                )
+                DayRate.objects.bulk_create(
+                    (
+                        DayRate(
+                            listing=price_tag.listing,
+                            price_tag=price_tag,
+                            date=current_date,
+                            price=price_tag.price
+                        )
+                        for price_tag in self.price_tags
+                        for current_date in daterange_generator(
+                            price_tag.start_date, price_tag.end_date
+                        )
+                    ),
+                    batch_size=self.BATCH_SIZE
+                )
+                # Bulk creation skips signals, so invalidate quotes here
+                Listing.objects.filter(
+                    id__in={
+                        price_tag.listing_id for price_tag in self.price_tags
+                    }
+                ).update(
+                    pricing_version=F(Listing.Field.pricing_version) + 1
+                )
+        except IntegrityError:
+            # Concurrent changes took some of the dates
+            self.add_error(
+                0, PriceTag.Field.start_date, ERROR_MSG_PRICE_TAGS_CONFLICT
+            )
+            return list()
+
+        return self.price_tags
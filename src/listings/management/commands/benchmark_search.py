@@ -0,0 +1,188 @@
+from datetime import timedelta
+from itertools import islice
+from statistics import median
+from timeit import timeit
+from uuid import uuid4
+
+from django.contrib.auth import get_user_model
+from django.core.management import BaseCommand
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from core.api.paginators import BaseCursorPaginator
+
+from ...constants import (
+    INFO_MSG_SEARCH_BENCHMARK, INFO_MSG_SEARCH_BENCHMARK_SEEDED
+)
+from ...models import (
+    Listing, Reservation, get_default_reservation_status
+)
+
+# Benchmark data is written by batches of that many rows
+SEED_BATCH_SIZE = 10000
+
+
+class Command(BaseCommand):
+    """
+    Measures first page time of listings availability search
+    on current database: date range overlap (served by range-first
+    reservation_dates_no_overlap GiST index) vs plain check in /
+    check out comparison (served by btree indexes).
+    Figures quoted for 10k listings / 1M reservations are obtained
+    on scratch database seeded with
+    --seed-listings 10000 --reservations-per-listing 100
+    (seeded rows are kept, so the command can be rerun without it)
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed-listings",
+            type=int,
+            default=0,
+            help="Number of listings to create before measuring"
+        )
+        parser.add_argument(
+            "--reservations-per-listing",
+            type=int,
+            default=100,
+            help="Number of reservations created for every seeded listing"
+        )
+        parser.add_argument(
+            "--days-ahead",
+            type=int,
+            default=30,
+            help="Check in date offset from today"
+        )
+        parser.add_argument(
+            "--nights",
+            type=int,
+            default=7,
+            help="Requested stay length"
+        )
+        parser.add_argument(
+            "--guests",
+            type=int,
+            default=1,
+            help="Requested guests number"
+        )
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=7,
+            help="Number of runs median is taken from"
+        )
+
+    @staticmethod
+    def seed(listings_count: int, reservations_count: int) -> None:
+        """
+        Creates listings of different capacity along with
+        back-to-back two nights reservations (shifted by listing
+        so every requested stay overlaps some of them)
+        :param listings_count:
+        :param reservations_count:
+        :return:
+        """
+
+        prefix = uuid4().hex[:8]
+        user, _ = get_user_model().objects.get_or_create(
+            email="benchmark@example.com"
+        )
+        listings = Listing.objects.bulk_create(
+            (
+                Listing(
+                    title="Benchmark listing {}".format(index),
+                    slug="benchmark-{}-{}".format(prefix, index),
+                    max_guests=index % 6 + 1,
+                    bedrooms=index % 4
+                )
+                for index in range(listings_count)
+            ),
+            batch_size=SEED_BATCH_SIZE
+        )
+
+        origin = timezone.localdate()
+        status_id = get_default_reservation_status()
+        reservations = (
+            Reservation(
+                listing=listing,
+                user=user,
+                status_id=status_id,
+                check_in=origin + timedelta(days=index * 3 + shift % 3),
+                check_out=origin + timedelta(days=index * 3 + shift % 3 + 2)
+            )
+            for shift, listing in enumerate(listings)
+            for index in range(reservations_count)
+        )
+        # Batches are built lazily to keep memory usage flat
+        while batch := list(islice(reservations, SEED_BATCH_SIZE)):
+            Reservation.objects.bulk_create(batch)
+
+    def report(self, title: str, get_queryset, runs: int) -> None:
+        """
+        Prints median time of the first page evaluated the way
+        cursor paginator requests it (new query on every run)
+        :param title:
+        :param get_queryset:
+        :param runs:
+        :return:
+        """
+
+        def get_page() -> list:
+            return list(
+                get_queryset().order_by(
+                    *BaseCursorPaginator.ordering
+                )[:BaseCursorPaginator.page_size + 1]
+            )
+
+        seconds = median(
+            timeit(get_page, number=1) for _ in range(runs)
+        )
+        self.stdout.write(
+            INFO_MSG_SEARCH_BENCHMARK.format(title, seconds * 1000, runs)
+        )
+
+    def handle(self, *args, **options):
+        """
+        Command entry point
+        :param args:
+        :param options:
+        :return:
+        """
+
+        if options["seed_listings"]:
+            self.seed(
+                options["seed_listings"], options["reservations_per_listing"]
+            )
+            self.stdout.write(
+                INFO_MSG_SEARCH_BENCHMARK_SEEDED.format(
+                    Listing.objects.count(), Reservation.objects.count()
+                )
+            )
+
+        check_in = timezone.localdate() + timedelta(
+            days=options["days_ahead"]
+        )
+        check_out = check_in + timedelta(days=options["nights"])
+
+        self.report(
+            "Range overlap (GiST)",
+            lambda: Listing.objects.search(
+                check_in, check_out, guests=options["guests"]
+            ),
+            options["runs"]
+        )
+        self.report(
+            "Plain dates anti-join (btree)",
+            lambda: Listing.objects.get_previews().filter(
+                max_guests__gte=options["guests"]
+            ).exclude(
+                Exists(
+                    Reservation.objects.filter(
+                        listing=OuterRef("pk"),
+                        check_in__lt=check_out,
+                        check_out__gt=check_in
+                    )
+                )
+            ),
+            options["runs"]
+        )
@@ -0,0 +1,166 @@
+from bisect import bisect_left
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+
+from djmoney.money import Money
+
+from core.models import BaseModel
+from core.utils.public_ids import encode_public_id
+
+from ...constants import (
+    ERROR_MSG_NO_FIXTURE, ERROR_MSG_UNKNOWN_LISTING, ERROR_MSG_UNKNOWN_USER,
+    ERROR_MSG_ICS_CONFLICT, INFO_MSG_ICS_EVENT_SKIPPED, INFO_MSG_ICS_IMPORTED,
+    ICS_SKIP_REASON_WRONG_DATES, ICS_SKIP_REASON_OVERLAPPING,
+    ICS_IMPORT_COMMENT
+)
+from ...ical import parse_events
+from ...models import (
+    Listing, Reservation, get_default_reservation_status
+)
+
+
+class Command(BaseCommand):
+    """
+    Imports iCalendar events as blocking reservations of single listing
+    """
+
+    BATCH_SIZE = 500
+
+    def add_arguments(self, parser):
+        parser.add_argument("slug", help="Listing slug")
+        parser.add_argument("path", help="iCalendar (.ics) file")
+        parser.add_argument(
+            "--user",
+            required=True,
+            help="Email of the user to create reservations for"
+        )
+
+    def handle(self, *args, **options):
+        """
+        Command entry point
+        :param args:
+        :param options:
+        :return:
+        """
+
+        try:
+            listing = Listing.objects.get(slug=options["slug"])
+        except Listing.DoesNotExist:
+            raise CommandError(
+                ERROR_MSG_UNKNOWN_LISTING.format(options["slug"])
+            )
+
+        try:
+            user = get_user_model().objects.get(email=options["user"])
+        except get_user_model().DoesNotExist:
+            raise CommandError(
+                ERROR_MSG_UNKNOWN_USER.format(options["user"])
+            )
+
+        try:
+            with open(options["path"], encoding="utf-8") as source:
+                events = sorted(
+                    parse_events(source),
+                    key=lambda event: event.start
+                )
+        except OSError:
+            raise CommandError(
+                ERROR_MSG_NO_FIXTURE.format(options["path"])
+            )
+
+        skipped = list()
+        valid_events = list()
+        for event in events:
+            if event.end > event.start:
+                valid_events.append(event)
+            else:
+                skipped.append((event, ICS_SKIP_REASON_WRONG_DATES))
+
+        reservations = list()
+        if valid_events:
+            # Resolved once instead of per-instance default call
+            status_id = get_default_reservation_status()
+
+            # Load all the reservations intersecting imported period
+            # at once (they never overlap, so both ends are sorted)
+            existing = list(
+                Reservation.objects.filter(
+                    listing=listing,
+                    check_in__lt=max(event.end for event in valid_events),
+                    check_out__gt=valid_events[0].start
+                ).order_by(
+                    Reservation.Field.check_in
+                ).values_list(
+                    Reservation.Field.check_in,
+                    Reservation.Field.check_out
+                )
+            )
+            check_ins = [check_in for check_in, _ in existing]
+
+            last_check_out = None
+            for event in valid_events:
+                # Latest existing reservation starting before event end
+                index = bisect_left(check_ins, event.end) - 1
+                if (
+                    index >= 0 and existing[index][1] > event.start
+                ) or (
+                    last_check_out and last_check_out > event.start
+                ):
+                    skipped.append((event, ICS_SKIP_REASON_OVERLAPPING))
+                    continue
+
+                reservations.append(
+                    Reservation(
+                        listing=listing,
+                        user=user,
+                        check_in=event.start,
+                        check_out=event.end,
+                        comment=ICS_IMPORT_COMMENT.format(
+                            event.summary, event.uid
+                        ),
+                        total_cost=Money(0, settings.BASE_CURRENCY),
+                        status_id=status_id
+                    )
+                )
+                last_check_out = event.end
+
+        for event, reason in skipped:
+            self.stdout.write(
+                INFO_MSG_ICS_EVENT_SKIPPED.format(
+                    event.uid, event.start, event.end, reason
+                )
+            )
+
+        if reservations:
+            # Exclusion constraint still guards against concurrent changes
+            try:
+                with transaction.atomic():
+                    Reservation.objects.bulk_create(
+                        reservations,
+                        batch_size=self.BATCH_SIZE
+                    )
+                    # Bulk inserts skip save(), so public ids
+                    # are stored here to keep reservations addressable
+                    for reservation in reservations:
+                        reservation.public_id = encode_public_id(
+                            reservation.id
+                        )
+                    Reservation.objects.bulk_update(
+                        reservations,
+                        [BaseModel.Field.public_id],
+                        batch_size=self.BATCH_SIZE
+                    )
+                    listing.availability_changed()
+            except IntegrityError as error:
+                raise CommandError(ERROR_MSG_ICS_CONFLICT.format(error))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                INFO_MSG_ICS_IMPORTED.format(
+                    len(reservations), len(skipped)
+                )
+            )
+        )
@@ -0,0 +1,71 @@
+from csv import DictReader
+from json import load
+from json.decoder import JSONDecodeError
+from os.path import splitext
+
+from django.core.management import BaseCommand, CommandError
+
+from ...constants import (
+    ERROR_MSG_NO_FIXTURE, ERROR_MSG_JSON_DECODING,
+    ERROR_MSG_UNKNOWN_FILE_FORMAT, ERROR_MSG_PRICE_TAGS_ROW,
+    ERROR_MSG_NOT_A_LIST,
+    INFO_MSG_PRICE_TAGS_IMPORTED
+)
+from ...importers import PriceTagsImporter
+
+
+class Command(BaseCommand):
+    """
+    Imports many listings price tags from JSON (list of objects)
+    or CSV (with header row) file - all or nothing
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="JSON or CSV file")
+
+    def handle(self, *args, **options):
+        """
+        Command entry point
+        :param args:
+        :param options:
+        :return:
+        """
+
+        path = options["path"]
+        extension = splitext(path)[1].lower()
+        if extension not in (".json", ".csv"):
+            raise CommandError(ERROR_MSG_UNKNOWN_FILE_FORMAT.format(path))
+
+        try:
+            with open(path, encoding="utf-8", newline="") as source:
+                if extension == ".json":
+                    rows = load(source)
+                else:
+                    rows = list(DictReader(source))
+        except OSError:
+            raise CommandError(ERROR_MSG_NO_FIXTURE.format(path))
+        except JSONDecodeError as e:
+            raise CommandError(ERROR_MSG_JSON_DECODING.format(e))
+
+        if not isinstance(rows, list):
+            raise CommandError(ERROR_MSG_NOT_A_LIST)
+
+        importer = PriceTagsImporter(rows)
+        if not importer.validate() or not importer.save():
+            for error in importer.errors:
+                self.stderr.write(
+                    ERROR_MSG_PRICE_TAGS_ROW.format(
+                        error["row"], error["errors"]
+                    )
+                )
+            raise CommandError(
+                INFO_MSG_PRICE_TAGS_IMPORTED.format(0)
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                INFO_MSG_PRICE_TAGS_IMPORTED.format(
+                    len(importer.price_tags)
+                )
+            )
+        )
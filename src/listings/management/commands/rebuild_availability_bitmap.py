@@ -0,0 +1,63 @@
+from datetime import timedelta
+
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from core.models import BaseModel
+
+from ...availability import availability_bitmap
+from ...constants import (
+    ERROR_MSG_NO_AVAILABILITY_BITMAP, INFO_MSG_AVAILABILITY_BITMAP_REBUILT
+)
+from ...models import Listing, Reservation
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds shared availability bitmap from scratch
+    starting from today (schedule it daily to roll the horizon)
+    """
+
+    def handle(self, *args, **options):
+        """
+        Command entry point
+        :param args:
+        :param options:
+        :return:
+        """
+
+        if not availability_bitmap.path:
+            self.stdout.write(ERROR_MSG_NO_AVAILABILITY_BITMAP)
+            return
+
+        origin = timezone.localdate()
+        reservations = Reservation.objects.filter(
+            check_in__lt=origin + timedelta(availability_bitmap.horizon),
+            check_out__gt=origin
+        )
+
+        # Both querysets are streamed while bitmap is being built
+        availability_bitmap.rebuild(
+            Listing.objects.values_list(
+                BaseModel.Field.id, Listing.Field.availability_version
+            ).iterator(),
+            (
+                (listing_id, check_in, check_out - timedelta(days=1))
+                for listing_id, check_in, check_out
+                in reservations.values_list(
+                    "listing_id",
+                    Reservation.Field.check_in,
+                    Reservation.Field.check_out
+                ).iterator(chunk_size=10000)
+            ),
+            origin
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                INFO_MSG_AVAILABILITY_BITMAP_REBUILT.format(
+                    Listing.objects.count(),
+                    reservations.count()
+                )
+            )
+        )
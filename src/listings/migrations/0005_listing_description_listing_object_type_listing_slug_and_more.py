@@ -1,7 +1,6 @@
 # Generated by Django 5.2.4 on 2025-08-08 09:27
 
 import django.db.models.deletion
-import listings.models
 from django.db import migrations, models
 
 
@@ -20,7 +19,7 @@ class Migration(migrations.Migration):
         migrations.AddField(
             model_name='listing',
             name='object_type',
-            field=models.ForeignKey(default=listings.models.get_default_object_type, on_delete=django.db.models.deletion.PROTECT, related_name='listings', to='listings.objecttype', verbose_name='Object type'),
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='listings', to='listings.objecttype', verbose_name='Object type'),
         ),
         migrations.AddField(
             model_name='listing',
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:33
+
+import django.contrib.postgres.constraints
+from django.contrib.postgres.operations import BtreeGistExtension
+import listings.models
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Exists, F, OuterRef
+
+
+def check_reservations(apps, schema_editor):
+    """
+    Reports reservations violating new constraints (reservations
+    were not checked for overlaps before), so they could be
+    fixed (cancelled, moved or removed) before migration
+    """
+    Reservation = apps.get_model("listings", "Reservation")
+
+    inverted = list(
+        Reservation.objects.filter(
+            check_out__lte=F("check_in")
+        ).values_list("id", flat=True)
+    )
+    overlapping = list(
+        Reservation.objects.filter(
+            Exists(
+                Reservation.objects.filter(
+                    listing=OuterRef("listing"),
+                    check_in__lt=OuterRef("check_out"),
+                    check_out__gt=OuterRef("check_in")
+                ).exclude(
+                    id=OuterRef("id")
+                )
+            )
+        ).values_list("id", flat=True)
+    )
+
+    if inverted or overlapping:
+        raise RuntimeError(
+            "Reservations with check out not after check in: {}; "
+            "reservations overlapping other ones of the same "
+            "listing: {}. Fix them and run migration again.".format(
+                inverted or "none", overlapping or "none"
+            )
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0017_reservationstatus_next_statuses_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        BtreeGistExtension(),
+        migrations.RunPython(
+            check_reservations, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name='reservation',
+            constraint=models.CheckConstraint(condition=models.Q(('check_out__gt', models.F('check_in'))), name='reservation_check_out_after_check_in'),
+        ),
+        migrations.AddConstraint(
+            model_name='reservation',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(expressions=[(listings.models.DateRange('check_in', 'check_out', models.Value('[)')), '&&'), ('listing', '=')], name='reservation_dates_no_overlap'),
+        ),
+    ]
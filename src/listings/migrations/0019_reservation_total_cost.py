@@ -0,0 +1,53 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:38
+
+from decimal import Decimal
+
+import djmoney.models.fields
+from django.conf import settings
+from django.db import migrations
+from django.db.models import OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_total_cost(apps, schema_editor):
+    """
+    Captures cost snapshot for already existing reservations
+    """
+    Reservation = apps.get_model("listings", "Reservation")
+    DayRate = apps.get_model("listings", "DayRate")
+
+    nights_cost = DayRate.objects.filter(
+        listing=OuterRef("listing"),
+        date__gte=OuterRef("check_in"),
+        date__lt=OuterRef("check_out")
+    ).values("listing").annotate(
+        total=Sum("price")
+    ).values("total")
+
+    Reservation.objects.update(
+        total_cost=Coalesce(Subquery(nights_cost), Value(Decimal(0))),
+        total_cost_currency=settings.BASE_CURRENCY
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0018_reservation_constraints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reservation',
+            name='total_cost',
+            field=djmoney.models.fields.MoneyField(blank=True, decimal_places=4, default_currency='EUR', max_digits=19, null=True, verbose_name='Total cost'),
+        ),
+        migrations.AddField(
+            model_name='reservation',
+            name='total_cost_currency',
+            field=djmoney.models.fields.CurrencyField(choices=[('CNY', 'Chinese Yuan'), ('EUR', 'Euro'), ('USD', 'US Dollar')], default='EUR', editable=False, max_length=3, null=True),
+        ),
+        migrations.RunPython(
+            fill_total_cost, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0019_reservation_total_cost'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='dayrate',
+            constraint=models.UniqueConstraint(fields=('listing', 'date'), name='dayrate_unique_listing_date'),
+        ),
+    ]
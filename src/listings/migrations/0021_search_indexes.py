@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0020_dayrate_unique_listing_date'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='listing',
+            index=models.Index(fields=['max_guests', 'bedrooms', 'object_type'], name='listing_capacity_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['listing', 'check_in', 'check_out'], name='reservation_listing_dates_idx'),
+        ),
+    ]
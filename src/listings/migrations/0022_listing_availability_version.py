@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0021_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='listing',
+            name='availability_version',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Availability version'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0023_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='listing',
+            name='pricing_version',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Pricing version'),
+        ),
+    ]
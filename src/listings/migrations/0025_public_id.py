@@ -0,0 +1,84 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:41
+
+from django.db import migrations, models
+
+from core.utils.public_ids import encode_public_id
+
+
+def create_default_references(apps, schema_editor):
+    """
+    Seeds default object type and reservation status (earlier
+    migrations add their foreign keys to empty tables without them)
+    """
+    for model_name, lookup in (
+        ("ObjectType", {"name": "Apartment"}),
+        ("ReservationStatus", {"name": "Draft", "is_initial": True}),
+    ):
+        model = apps.get_model("listings", model_name)
+        reference, _ = model.objects.get_or_create(**lookup)
+        if reference.public_id is None:
+            reference.public_id = encode_public_id(reference.id)
+            reference.save(update_fields=["public_id"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0024_listing_pricing_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='amenity',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+        migrations.AddField(
+            model_name='dayrate',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+        migrations.AddField(
+            model_name='houserule',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+        migrations.AddField(
+            model_name='listing',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+        migrations.AddField(
+            model_name='objecttype',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+        migrations.AddField(
+            model_name='photo',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+        migrations.AddField(
+            model_name='pricetag',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+        migrations.AddField(
+            model_name='reservation',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+        migrations.AddField(
+            model_name='reservationstatus',
+            name='public_id',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name='Public ID'),
+        ),
+        migrations.RunPython(
+            create_default_references, migrations.RunPython.noop
+        ),
+    ]
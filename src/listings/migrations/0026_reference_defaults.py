@@ -0,0 +1,25 @@
+# Generated by Django 5.2.4 on 2026-10-18 14:38
+
+import django.db.models.deletion
+import listings.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0025_public_id'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='listing',
+            name='object_type',
+            field=models.ForeignKey(default=listings.models.get_default_object_type, on_delete=django.db.models.deletion.PROTECT, related_name='listings', to='listings.objecttype', verbose_name='Object type'),
+        ),
+        migrations.AlterField(
+            model_name='reservation',
+            name='status',
+            field=models.ForeignKey(default=listings.models.get_default_reservation_status, on_delete=django.db.models.deletion.PROTECT, related_name='listings', to='listings.reservationstatus', verbose_name='Status'),
+        ),
+    ]
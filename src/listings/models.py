@@ -1,15 +1,19 @@
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 
 from django.core.exceptions import ValidationError
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import DateRangeField, RangeOperators
+from django.db import transaction
 from django.db.models import (
     QuerySet, CharField, SlugField, TextField,
-    BooleanField, PositiveSmallIntegerField,
+    BooleanField, PositiveIntegerField, PositiveSmallIntegerField,
     DateField, TimeField, ImageField,
     ForeignKey, PROTECT, CASCADE, ManyToManyField,
-    Manager
+    Manager, CheckConstraint, UniqueConstraint, Index,
+    Func, F, Q, Count, Exists, OuterRef, Prefetch, Subquery, Sum, Value
 )
 from django.urls import reverse
 from django.utils.timezone import now
@@ -18,13 +22,18 @@ from django.utils.translation import gettext_lazy as _
 from djmoney.money import Money
 from djmoney.models.fields import MoneyField
 
-from core.models import BaseModel, Reference, BaseStatus
-from core.utils.dates import daterange_generator
-from core.utils.images import convert_image, create_thumbnails
+from core.models import (
+    BaseModel, Reference, BaseStatus, StatusTransitionsMixin
+)
+from core.references import reference_cache
+from core.utils.dates import daterange_generator, format_dates
+from core.utils.images import process_image
 
+from .availability import availability_bitmap, build_availability
 from .constants import (
     ERROR_MSG_NEGATIVE_DAY_RATE,
-    ERROR_MSG_OVERLAPPING_DATES
+    ERROR_MSG_OVERLAPPING_DATES,
+    ERROR_MSG_WRONG_DATES_ORDER
 )
 
 User = get_user_model()
@@ -83,11 +92,143 @@ class HouseRule(Reference):
         verbose_name = "House rule"
 
 
+def get_default_reference_id(model: type, **lookup) -> int:
+    """
+    Returns id of reference object used as field default
+    (creating it if necessary)
+    :param model:
+    :param lookup:
+    :return:
+    """
+    reference_id = reference_cache.get_id(model, **lookup)
+    if reference_id is None:
+        reference_id = model.objects.get_or_create(**lookup)[0].id
+    return reference_id
+
+
 def get_default_object_type() -> int:
-    object_type, _ = ObjectType.objects.get_or_create(
-        name=ObjectType.DEFAULT_NAME
+    return get_default_reference_id(
+        ObjectType, name=ObjectType.DEFAULT_NAME
     )
-    return object_type.id
+
+
+class ListingManager(Manager):
+    """
+    Listing management fine-tune class
+    """
+
+    # Prefetched cover photo container (list of at most one photo)
+    COVER_PHOTOS = "cover_photos"
+    # Prefetched (and already ordered) listing details containers
+    PHOTOS = "ordered_photos"
+    PRICE_TAGS = "ordered_price_tags"
+
+    def get_previews(self) -> QuerySet:
+        """
+        Returns listings along with all the data needed to display
+        their previews (object type and cover photo) loaded
+        using constant number of queries per page
+        :return:
+        """
+        return self.select_related(
+            Listing.Field.object_type
+        ).prefetch_related(
+            Prefetch(
+                "photos",
+                queryset=Photo.objects.filter(is_cover=True),
+                to_attr=self.COVER_PHOTOS
+            )
+        )
+
+    def get_details(self) -> QuerySet:
+        """
+        Returns listings along with the whole details graph (object type,
+        photos, price tags, amenities and house rules) loaded using
+        fixed number of queries - shared by API and HTML details views
+        :return:
+        """
+        return self.select_related(
+            Listing.Field.object_type
+        ).prefetch_related(
+            Prefetch(
+                "photos",
+                queryset=Photo.objects.order_by(Photo.Field.index),
+                to_attr=self.PHOTOS
+            ),
+            Prefetch(
+                "price_tags",
+                queryset=PriceTag.objects.order_by(PriceTag.Field.start_date),
+                to_attr=self.PRICE_TAGS
+            ),
+            Listing.Field.amenities,
+            Listing.Field.house_rules
+        )
+
+    def search(
+            self,
+            check_in: date,
+            check_out: date,
+            guests: int = 1,
+            bedrooms: int = 0,
+            object_type: int = None,
+            amenities: list[int] = None
+    ) -> QuerySet:
+        """
+        Returns listings matching capacity requirements and free
+        for the whole [check_in, check_out) period using single
+        (anti-join) query
+        :param check_in:
+        :param check_out:
+        :param guests:
+        :param bedrooms:
+        :param object_type:
+        :param amenities:
+        :return:
+        """
+        listings = self.get_previews().filter(
+            max_guests__gte=guests,
+            bedrooms__gte=bedrooms
+        )
+
+        if object_type:
+            listings = listings.filter(
+                object_type_id=object_type
+            )
+
+        # Every required amenity should be present
+        if amenities:
+            amenities = set(amenities)
+            listings = listings.annotate(
+                required_amenities=Subquery(
+                    Listing.amenities.through.objects.filter(
+                        listing=OuterRef("pk"),
+                        amenity_id__in=amenities
+                    ).values(
+                        "listing"
+                    ).annotate(
+                        total=Count("*")
+                    ).values("total")
+                )
+            ).filter(
+                required_amenities=len(amenities)
+            )
+
+        # And no reservation should overlap requested dates
+        # (matches reservation_dates_no_overlap GiST index expression)
+        return listings.exclude(
+            Exists(
+                Reservation.objects.annotate(
+                    stay=DateRange(
+                        Reservation.Field.check_in,
+                        Reservation.Field.check_out,
+                        Value("[)")
+                    )
+                ).filter(
+                    listing=OuterRef("pk"),
+                    stay__overlap=(check_in, check_out)
+                )
+            )
+        )
 
 
 class Listing(BaseModel):
@@ -95,6 +236,19 @@ class Listing(BaseModel):
     Rooms, apartments etc.
     """
 
+    class Meta:
+        indexes = [
+            Index(
+                fields=["max_guests", "bedrooms", "object_type"],
+                name="listing_capacity_idx"
+            ),
+            # Keyset pagination position
+            Index(
+                fields=["created_at", "id"],
+                name="listing_created_idx"
+            ),
+        ]
+
     class Field:
         # Base info
         object_type: str = "object_type"
@@ -113,12 +267,16 @@ class Listing(BaseModel):
         check_in_time: str = "check_in_time"
         check_out_time: str = "check_out_time"
         instant_booking: str = "instant_booking"
+        availability_version: str = "availability_version"
+        pricing_version: str = "pricing_version"
         # Other data
         absolute_url: str = "absolute_url"
         cover_photo: str = "cover_photo"
 
     LOOKUP_KEY = "slug"
 
+    objects = ListingManager()
+
     # Base info
     object_type: ForeignKey = ForeignKey(
         ObjectType,
@@ -213,6 +371,22 @@ class Listing(BaseModel):
         verbose_name=_("Instant booking")
     )
 
+    # Bumped on every reservation change to invalidate cached calendars
+    availability_version: PositiveIntegerField = PositiveIntegerField(
+        null=False,
+        default=0,
+        editable=False,
+        verbose_name=_("Availability version")
+    )
+
+    # Bumped on every price tag change to invalidate cached quotes
+    pricing_version: PositiveIntegerField = PositiveIntegerField(
+        null=False,
+        default=0,
+        editable=False,
+        verbose_name=_("Pricing version")
+    )
+
     def __str__(self) -> str:
         return "{} {}".format(
             self.object_type.name,
@@ -222,7 +396,78 @@ class Listing(BaseModel):
     def get_absolute_url(self) -> str:
         return reverse("listings:listing_details", args=[self.slug])
 
+    def save(self, *args: list, **kwargs: dict) -> None:
+        """
+        Saves listing data leaving version counters intact (they are
+        bumped atomically in database, so loaded values may be stale)
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        if not self._state.adding and not kwargs.get("force_insert"):
+            update_fields = kwargs.get("update_fields")
+            if update_fields is None:
+                deferred_fields = self.get_deferred_fields()
+                update_fields = [
+                    field.name for field in self._meta.concrete_fields
+                    if not field.primary_key
+                    and field.attname not in deferred_fields
+                ]
+            kwargs["update_fields"] = [
+                field for field in update_fields
+                if field not in (
+                    Listing.Field.availability_version,
+                    Listing.Field.pricing_version
+                )
+            ]
+
+        super().save(*args, **kwargs)
+
+    def bump_availability_version(self) -> None:
+        """
+        Atomically increments availability version
+        (without touching any other listing data)
+        :return:
+        """
+        Listing.objects.filter(pk=self.pk).update(
+            availability_version=F(Listing.Field.availability_version) + 1
+        )
+
+    def bump_pricing_version(self) -> None:
+        """
+        Atomically increments pricing version
+        (without touching any other listing data)
+        :return:
+        """
+        Listing.objects.filter(pk=self.pk).update(
+            pricing_version=F(Listing.Field.pricing_version) + 1
+        )
+
+    def availability_changed(self) -> None:
+        """
+        Invalidates cached calendars and re-indexes listing
+        availability bitmap once changes become visible
+        (until then slot built for previous version is not used)
+        :return:
+        """
+        self.bump_availability_version()
+        transaction.on_commit(
+            lambda: availability_bitmap.refresh(
+                self.id,
+                lambda: Listing.objects.filter(
+                    pk=self.pk
+                ).values_list(
+                    Listing.Field.availability_version, flat=True
+                ).first(),
+                self.get_reserved_intervals
+            )
+        )
+
     def get_cover_photo(self) -> "Photo":
+        # Cover photo could be prefetched with listings page
+        if hasattr(self, ListingManager.COVER_PHOTOS):
+            return next(iter(getattr(self, ListingManager.COVER_PHOTOS)), None)
+
         if self.photos:
             try:
                 return self.photos.get(
@@ -232,12 +477,18 @@ class Listing(BaseModel):
                 pass
 
     def get_photos(self) -> "QuerySet[Photo]":
+        if hasattr(self, ListingManager.PHOTOS):
+            return getattr(self, ListingManager.PHOTOS)
+
         if self.photos:
             return self.photos.order_by(
                 Photo.Field.index
             )
 
     def get_price_tags(self) -> "QuerySet[PriceTag]":
+        if hasattr(self, ListingManager.PRICE_TAGS):
+            return getattr(self, ListingManager.PRICE_TAGS)
+
         if self.price_tags:
             return self.price_tags.order_by(
                 PriceTag.Field.start_date
@@ -258,9 +509,9 @@ class Listing(BaseModel):
 
         try:
             return Reservation.objects.get(
-                listing=self.listing,
+                listing=self,
                 check_in__lte=selected_date,
-                check_out__gte=selected_date
+                check_out__gt=selected_date
             )
         except Reservation.DoesNotExist:
             pass
@@ -271,20 +522,63 @@ class Listing(BaseModel):
         :param selected_date:
         :return:
         """
+        availability = availability_bitmap.get_availability(
+            self.id, self.availability_version, selected_date, selected_date
+        )
+        if availability is not None:
+            return availability[selected_date]
+
         return not Reservation.objects.filter(
             listing=self,
             check_in__lte=selected_date,
-            check_out__gte=selected_date
+            check_out__gt=selected_date
             ).exists()
 
+    def get_reserved_intervals(
+            self, start_date: date, end_date: date
+    ) -> list[tuple[date, date]]:
+        """
+        Returns (first night, last night) pairs of all the reservations
+        overlapping designated dates window using single query
+        (check-out date itself is free for the next guests)
+        :param start_date:
+        :param end_date:
+        :return:
+        """
+        return [
+            (check_in, check_out - timedelta(days=1))
+            for check_in, check_out in Reservation.objects.filter(
+                listing=self,
+                check_in__lte=end_date,
+                check_out__gt=start_date
+            ).values_list(
+                Reservation.Field.check_in,
+                Reservation.Field.check_out
+            )
+        ]
+
     def get_availability(
             self, start_date: date, end_date: date
     ) -> dict[date, bool]:
-        return {
-            current_date: self.is_date_available(current_date)
-            for current_date
-            in daterange_generator(start_date, end_date)
-        }
+        """
+        Returns listing availability for every date between
+        start_date and end_date (inclusive), served by shared
+        availability bitmap when it covers requested dates
+        :param start_date:
+        :param end_date:
+        :return:
+        """
+        availability = availability_bitmap.get_availability(
+            self.id, self.availability_version, start_date, end_date
+        )
+        if availability is not None:
+            return availability
+
+        return build_availability(
+            self.get_reserved_intervals(start_date, end_date),
+            start_date,
+            end_date
+        )
 
 
 def upload_path(instance: Listing, filename: str) -> str:
@@ -348,22 +642,17 @@ class Photo(BaseModel):
         # Save original to database and obtain it's storage name
         super().save(*args, **kwargs)
 
-        if self.file:
-            # Build image previews if necessary
-            if settings.IMAGE_SIZES:
-                for size in settings.IMAGE_SIZES:
-                    create_thumbnails.delay(
-                        self.file.path,
-                        size[0],
-                        size[1],
-                        settings.IMAGE_FORMAT
-                    )
-            # Convert image format if necessary
-            if settings.IMAGE_CONVERT_ORIGINAL:
-                convert_image.delay(
-                    self.file.path,
-                    settings.IMAGE_FORMAT
-                )
+        if self.file and (
+                settings.IMAGE_SIZES or settings.IMAGE_CONVERT_ORIGINAL
+        ):
+            # Build image previews and convert image format (if
+            # necessary) decoding original only once
+            process_image.delay(
+                self.file.path,
+                sorted(settings.IMAGE_SIZES),
+                settings.IMAGE_FORMAT,
+                settings.IMAGE_CONVERT_ORIGINAL
+            )
 
     def get_preview(self) -> str:
         dot: int = self.file.url.rfind(".")
@@ -434,30 +723,33 @@ class PriceTag(BaseModel):
         verbose_name=_("Description")
     )
 
-    def clean(self):
-        overlapping_dates = list()
+    def get_overlapping_dates(self) -> list[date]:
+        """
+        Returns the dates already covered by other listing price tags
+        using single query
+        :return:
+        """
+        return list(
+            DayRate.objects.filter(
+                listing=self.listing,
+                date__range=(self.start_date, self.end_date)
+            ).exclude(
+                price_tag_id=self.id
+            ).order_by(
+                DayRate.Field.date
+            ).values_list(
+                DayRate.Field.date, flat=True
+            )
+        )
 
+    def clean(self):
         # First we have to look for potential conflicts
-        for current_date in daterange_generator(
-                self.start_date, self.end_date
-        ):
-            try:
-                day_rate = DayRate.objects.get(
-                    listing=self.listing,
-                    date=current_date,
-                )
-            except DayRate.DoesNotExist:
-                pass
-            else:
-                if day_rate.price_tag != self:
-                    overlapping_dates.append(
-                        current_date.strftime("%Y-%m-%d")
-                    )
+        overlapping_dates = self.get_overlapping_dates()
 
         if overlapping_dates:
             raise ValidationError(
                 ERROR_MSG_OVERLAPPING_DATES.format(
-                    ", ".join(overlapping_dates)
+                    format_dates(overlapping_dates)
                 )
             )
 
@@ -474,6 +766,63 @@ class PriceTag(BaseModel):
             self.price
         )
 
+    def update_day_rates(self) -> None:
+        """
+        Materializes price tag into day rates using a fixed number
+        of set-based statements regardless of price tag length
+        :return:
+        """
+
+        # First we have to look for rates of other price tags
+        overlapping_dates = self.get_overlapping_dates()
+        if overlapping_dates:
+            raise ValueError(
+                "There is a day rate for date(s) {}".format(
+                    format_dates(overlapping_dates)
+                )
+            )
+
+        with transaction.atomic():
+            # Drop rates left outside of (changed) price tag range
+            DayRate.objects.filter(
+                price_tag=self
+            ).exclude(
+                date__range=(self.start_date, self.end_date)
+            ).delete()
+
+            # Rates already materialized get new price
+            DayRate.objects.filter(
+                price_tag=self
+            ).update(
+                price=self.price,
+                updated_at=now()
+            )
+
+            # Missing rates are created at once, the dates taken
+            # meanwhile by other price tags are left to them...
+            days = DayRate.objects.bulk_create(
+                [
+                    DayRate(
+                        listing=self.listing,
+                        price_tag=self,
+                        date=current_date,
+                        price=self.price
+                    )
+                    for current_date in daterange_generator(
+                        self.start_date, self.end_date
+                    )
+                ],
+                ignore_conflicts=True
+            )
+
+            # ...and are reported (rolling all the changes back)
+            if DayRate.objects.filter(price_tag=self).count() < len(days):
+                raise ValueError(
+                    "There is a day rate for date(s) {}".format(
+                        format_dates(self.get_overlapping_dates())
+                    )
+                )
+
 
 class DayRate(BaseModel):
     """
@@ -485,8 +834,17 @@ class DayRate(BaseModel):
         price_tag: str = "price_tag"
         date: str = "date"
         price: str = "price"
+        price_currency: str = "price_currency"
         description: str = "description"
 
+    class Meta:
+        constraints = [
+            UniqueConstraint(
+                fields=["listing", "date"],
+                name="dayrate_unique_listing_date"
+            ),
+        ]
+
     listing: ForeignKey = ForeignKey(
         Listing,
         related_name="day_rates",
@@ -536,7 +894,7 @@ class ReservationStatusManager(Manager):
     """
 
     def get_by_name(self, name: str) -> "ReservationStatus":
-        return self.get(name=name)
+        return reference_cache.get(self.model, name=name)
 
 
 class ReservationStatus(BaseStatus):
@@ -546,19 +904,58 @@ class ReservationStatus(BaseStatus):
     objects = ReservationStatusManager()
 
 
-def get_default_reservation_status():
-    default_status, _ = ReservationStatus.objects.get_or_create(
-        name="Draft",
-        is_initial=True
+def get_default_reservation_status() -> int:
+    return get_default_reference_id(
+        ReservationStatus, name="Draft", is_initial=True
     )
-    return default_status.id
 
 
-class Reservation(BaseModel):
+class DateRange(Func):
+    """
+    PostgreSQL daterange constructor
+    """
+
+    function = "DATERANGE"
+    output_field = DateRangeField()
+
+
+class Reservation(StatusTransitionsMixin, BaseModel):
     """
     Class for listing reservations made by users
     """
 
+    class Meta:
+        indexes = [
+            Index(
+                fields=["listing", "check_in", "check_out"],
+                name="reservation_listing_dates_idx"
+            ),
+        ]
+        constraints = [
+            CheckConstraint(
+                condition=Q(check_out__gt=F("check_in")),
+                name="reservation_check_out_after_check_in"
+            ),
+            # Reserved nights [check_in, check_out) cannot intersect
+            # for the same listing (needs btree_gist extension).
+            # Dates range goes first, so the same GiST index serves
+            # dates-only lookups across all the listings
+            ExclusionConstraint(
+                name="reservation_dates_no_overlap",
+                expressions=[
+                    (
+                        DateRange(
+                            "check_in",
+                            "check_out",
+                            Value("[)")
+                        ),
+                        RangeOperators.OVERLAPS
+                    ),
+                    ("listing", RangeOperators.EQUAL),
+                ]
+            ),
+        ]
+
     class Field:
         user: str = "user"
         listing: str = "listing"
@@ -567,9 +964,13 @@ class Reservation(BaseModel):
         in_progress: str = "in_progress"
         comment: str = "comment"
         cost: str = "cost"
+        total_cost: str = "total_cost"
         currency: str = "currency"
         status: str = "status"
 
+    # Changes of these fields affect listing availability
+    STAY_FIELDS: tuple = ("listing_id", Field.check_in, Field.check_out)
+
     user: ForeignKey = ForeignKey(
         User,
         null=False,
@@ -605,6 +1006,15 @@ class Reservation(BaseModel):
         verbose_name=_("Comment")
     )
 
+    total_cost: MoneyField = MoneyField(
+        null=True,
+        blank=True,
+        max_digits=19,
+        decimal_places=4,
+        default_currency=settings.BASE_CURRENCY,
+        verbose_name=_("Total cost")
+    )
+
     status: ForeignKey = ForeignKey(
         ReservationStatus,
         null=False,
@@ -615,31 +1025,51 @@ class Reservation(BaseModel):
         verbose_name=_("Status")
     )
 
+    def get_overlapping_dates(self) -> list[date]:
+        """
+        Returns the dates (nights) this reservation shares
+        with other reservations of the same listing
+        using single range intersection query
+        :return:
+        """
+        overlapping_dates = set()
+        for check_in, check_out in Reservation.objects.filter(
+                listing=self.listing,
+                check_in__lt=self.check_out,
+                check_out__gt=self.check_in
+        ).exclude(
+            id=self.id
+        ).values_list(
+            Reservation.Field.check_in,
+            Reservation.Field.check_out
+        ):
+            overlapping_dates.update(
+                daterange_generator(
+                    max(check_in, self.check_in),
+                    min(check_out, self.check_out) - timedelta(days=1)
+                )
+            )
+
+        return sorted(overlapping_dates)
+
     def clean(self):
-        overlapping_dates = list()
+        self.clean_status_transition()
+
+        if self.check_in is None or self.check_out is None:
+            return
+
+        if self.check_out <= self.check_in:
+            raise ValidationError(
+                ERROR_MSG_WRONG_DATES_ORDER
+            )
 
         # First we have to look for potential conflicts
-        for current_date in daterange_generator(
-                self.check_in, self.check_out
-        ):
-            try:
-                reservation = Reservation.objects.get(
-                    listing=self.listing,
-                    check_in__lte=current_date,
-                    check_out__gte=current_date
-                )
-            except Reservation.DoesNotExist:
-                pass
-            else:
-                if reservation != self:
-                    overlapping_dates.append(
-                        current_date.strftime("%Y-%m-%d")
-                        )
+        overlapping_dates = self.get_overlapping_dates()
 
         if overlapping_dates:
             raise ValidationError(
                 ERROR_MSG_OVERLAPPING_DATES.format(
-                    ", ".join(overlapping_dates)
+                    format_dates(overlapping_dates)
                 )
             )
 
@@ -655,24 +1085,104 @@ class Reservation(BaseModel):
 
     in_progress.boolean = True
 
+    def calculate_cost(self) -> Money:
+        """
+        Sums listing day rates of all the reserved nights
+        using single aggregate query (nights without rates cost nothing)
+        :return:
+        """
+        total_cost = DayRate.objects.filter(
+            listing=self.listing,
+            date__gte=self.check_in,
+            date__lt=self.check_out
+        ).aggregate(
+            total=Sum(DayRate.Field.price)
+        ).get("total")
+
+        return Money(
+            total_cost or Decimal(0), settings.BASE_CURRENCY
+        )
+
+    def update_cost(self) -> None:
+        """
+        Captures current reservation cost snapshot
+        :return:
+        """
+        self.total_cost = self.calculate_cost()
+
     @property
-    def cost(self):
-        total_cost = Decimal(0.0)
+    def cost(self) -> Money:
+        if self.total_cost is None:
+            return self.calculate_cost()
+        return self.total_cost
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.track_stay()
+        return instance
+
+    def get_stay(self) -> dict:
+        # Deferred fields are not loaded (and so not compared) here
+        return {
+            field_name: self.__dict__[field_name]
+            for field_name in self.STAY_FIELDS
+            if field_name in self.__dict__
+        }
 
-        # First we have to look for potential conflicts
-        for current_date in daterange_generator(
-                self.check_in, self.check_out
-        ):
-            try:
-                day_rate = DayRate.objects.get(
-                    listing=self.listing,
-                    date=current_date
-                )
-            except Reservation.DoesNotExist:
-                pass
-            else:
-                total_cost += day_rate.price.amount
+    def track_stay(self) -> None:
+        self._loaded_stay = self.get_stay()
 
-        return Money(
-            total_cost, settings.BASE_CURRENCY
+    def stay_changed(self) -> bool:
+        """
+        Returns if reserved listing or dates differ from the loaded
+        (or last saved) ones, new reservations are always changed
+        :return:
+        """
+        loaded_stay = getattr(self, "_loaded_stay", None)
+        if loaded_stay is None:
+            return True
+
+        return any(
+            loaded_stay.get(field_name, value) != value
+            for field_name, value in self.get_stay().items()
         )
+
+    def availability_changed(self) -> None:
+        """
+        Invalidates availability of reserved listing
+        (and of the previous one if reservation was moved)
+        :return:
+        """
+        self.listing.availability_changed()
+
+        loaded_listing_id = getattr(self, "_loaded_stay", {}).get(
+            "listing_id"
+        )
+        if loaded_listing_id not in (None, self.listing_id):
+            Listing(pk=loaded_listing_id).availability_changed()
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs) -> None:
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        # Other fields loading must keep the stay being changed
+        if fields is None:
+            self.track_stay()
+        else:
+            self._loaded_stay = {
+                **getattr(self, "_loaded_stay", {}),
+                **{
+                    field_name: value
+                    for field_name, value in self.get_stay().items()
+                    if field_name in fields
+                    or field_name.removesuffix("_id") in fields
+                }
+            }
+
+    def save(self, *args: list, **kwargs: dict) -> None:
+        # New reservation cost is fixed on submission
+        if self._state.adding and self.total_cost is None:
+            self.update_cost()
+
+        super().save(*args, **kwargs)
+        # Further changes are compared with the saved stay
+        self.track_stay()
@@ -1,18 +1,43 @@
 from datetime import date
+from io import StringIO
+from json import dumps
+from os import makedirs
 from dateutil.relativedelta import relativedelta
 from shutil import rmtree
+from time import monotonic
+from unittest.mock import patch
 
+from django.conf import settings
+from django.core.cache import cache
 from django.contrib.auth import get_user_model
+from django.contrib.messages import get_messages
+from django.core.management import call_command
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection, transaction
+from django.http import HttpResponse
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from djmoney.money import Money
+
+from core.constants import MSG_STATUS_TRANSITION_NOT_ALLOWED
 from core.models import Reference
+from core.references import reference_cache
+from core.transitions import transition_graph
+from core.utils.dates import daterange_generator
 from tests.objects import (
     object_type, amenities_list, house_rules_list,
-    good_listing, create_good_listing, TEST_DIR
+    good_listing, create_good_listing, create_good_user,
+    create_listings_with_covers, TEST_DIR
 )
 
-from .models import PriceTag, DayRate, Reservation
+from .availability import build_availability
+from .constants import ERROR_MSG_PRICE_TAGS_CONFLICT
+from .importers import PriceTagsImporter
+from .models import (
+    Listing, PriceTag, DayRate, Photo, Reservation, ReservationStatus
+)
 
 
 class ListingTests(TestCase):
@@ -48,6 +73,22 @@ class ListingTests(TestCase):
             self.listing.get_cover_photo().get_preview()
         )
 
+    def test_listings_list_queries(self) -> None:
+        # Queries count shouldn't depend on listings number
+        with CaptureQueriesContext(connection) as single_listing:
+            self.client.get(reverse("listings:list"))
+
+        create_listings_with_covers(self.listing, 5)
+        with CaptureQueriesContext(connection) as many_listings:
+            response = self.client.get(reverse("listings:list"))
+
+        self.assertEqual(len(many_listings), len(single_listing))
+        self.assertContains(
+            response,
+            self.listing.get_cover_photo().get_preview(),
+            count=6
+        )
+
     def test_unknown_listing_details(self) -> None:
         # Checking for non-existing listing details
         no_response = self.client.get("/listing/wrong")
@@ -87,6 +128,62 @@ class ListingTests(TestCase):
             self.listing.get_cover_photo().get_details()
         )
 
+    def test_listing_details_queries(self) -> None:
+        # Queries count shouldn't depend on details graph size
+        with CaptureQueriesContext(connection) as small_graph:
+            self.client.get(self.listing.get_absolute_url())
+
+        cover_photo = self.listing.get_cover_photo()
+        Photo.objects.bulk_create(
+            Photo(
+                index=index,
+                listing=self.listing,
+                file=cover_photo.file.name
+            )
+            for index in range(1, 4)
+        )
+        for index in range(3):
+            PriceTag.objects.create(
+                listing=self.listing,
+                start_date=date.today() + relativedelta(months=index),
+                end_date=date.today() + relativedelta(months=index, days=7),
+                price=100 + index
+            )
+
+        with CaptureQueriesContext(connection) as large_graph:
+            response = self.client.get(self.listing.get_absolute_url())
+        self.assertEqual(len(large_graph), len(small_graph))
+        self.assertContains(response, cover_photo.get_details(), count=4)
+
+        # Form errors page is assembled the same way
+        self.client.force_login(create_good_user())
+        with CaptureQueriesContext(connection) as form_errors:
+            response = self.client.post(
+                self.listing.get_absolute_url(),
+                {
+                    Reservation.Field.check_in: date.today(),
+                    Reservation.Field.check_out: date.today()
+                }
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, cover_photo.get_details(), count=4)
+        for amenity in amenities_list:
+            self.assertContains(
+                response,
+                amenity.get(Reference.Field.name)
+            )
+        for table in (
+            "listings_photo", "listings_pricetag",
+            "listings_amenity", "listings_houserule"
+        ):
+            self.assertEqual(
+                sum(
+                    table in query["sql"]
+                    for query in form_errors.captured_queries
+                ),
+                1
+            )
+
     def test_reservation_form_anonymous_user(self) -> None:
         # Checking existing listing details
         response = self.client.get(self.listing.get_absolute_url())
@@ -135,6 +232,208 @@ class ListingTests(TestCase):
             "Some overlapping dates were found"
         )
 
+    def test_reservation_overlapping_dates_list(self) -> None:
+        user = create_good_user()
+        Reservation.objects.create(
+            listing=self.listing,
+            check_in=date.today(),
+            check_out=date.today() + relativedelta(days=3),
+            user=user
+        )
+        Reservation.objects.create(
+            listing=self.listing,
+            check_in=date.today() + relativedelta(days=5),
+            check_out=date.today() + relativedelta(days=7),
+            user=user
+        )
+        reservation = Reservation(
+            listing=self.listing,
+            check_in=date.today() + relativedelta(days=2),
+            check_out=date.today() + relativedelta(days=6),
+            user=user
+        )
+
+        # All the conflicts should be found using single query
+        with self.assertNumQueries(1):
+            overlapping_dates = reservation.get_overlapping_dates()
+        self.assertEqual(
+            overlapping_dates,
+            [
+                date.today() + relativedelta(days=2),
+                date.today() + relativedelta(days=5)
+            ]
+        )
+        with self.assertRaises(ValidationError):
+            reservation.clean()
+
+    def test_reservation_overlap_constraint(self) -> None:
+        user = create_good_user()
+        Reservation.objects.create(
+            listing=self.listing,
+            check_in=date.today(),
+            check_out=date.today() + relativedelta(days=7),
+            user=user
+        )
+
+        # Check-out date can be used as next check-in date
+        Reservation.objects.create(
+            listing=self.listing,
+            check_in=date.today() + relativedelta(days=7),
+            check_out=date.today() + relativedelta(days=9),
+            user=user
+        )
+
+        # But overlapping reservation is rejected by database itself
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                Reservation.objects.create(
+                    listing=self.listing,
+                    check_in=date.today() + relativedelta(days=6),
+                    check_out=date.today() + relativedelta(days=8),
+                    user=user
+                )
+
+        # As well as reservation with wrong dates order
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                Reservation.objects.create(
+                    listing=self.listing,
+                    check_in=date.today() + relativedelta(days=12),
+                    check_out=date.today() + relativedelta(days=10),
+                    user=user
+                )
+
+    def test_reservation_cost(self) -> None:
+        PriceTag.objects.create(
+            listing=self.listing,
+            start_date=date.today(),
+            end_date=date.today() + relativedelta(days=2),
+            price=100
+        )
+
+        # Nights without day rates shouldn't break cost calculation
+        reservation = Reservation(
+            listing=self.listing,
+            check_in=date.today(),
+            check_out=date.today() + relativedelta(days=5),
+            user=create_good_user()
+        )
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                reservation.calculate_cost(),
+                Money(300, settings.BASE_CURRENCY)
+            )
+
+        # Cost snapshot is captured on reservation creation
+        reservation.save()
+        reservation.refresh_from_db()
+        DayRate.objects.filter(listing=self.listing).update(price=50)
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                reservation.cost,
+                Money(300, settings.BASE_CURRENCY)
+            )
+
+        # And can be updated later
+        reservation.update_cost()
+        self.assertEqual(
+            reservation.cost,
+            Money(150, settings.BASE_CURRENCY)
+        )
+
+    @override_settings(PUBLIC_ID_FALLBACK=True)
+    def test_reservation_status_transitions(self) -> None:
+        user = create_good_user()
+        self.client.force_login(user)
+        reservation = Reservation.objects.create(
+            listing=self.listing,
+            check_in=date.today(),
+            check_out=date.today() + relativedelta(days=2),
+            user=user
+        )
+
+        def change_status(action: str) -> HttpResponse:
+            return self.client.get(
+                reverse(
+                    "listings:{}_reservation".format(action),
+                    args=[reservation.public_id]
+                )
+            )
+
+        # Reservation is found without stored public id as well
+        # (until backfill_public_ids is run)
+        Reservation.objects.filter(pk=reservation.pk).update(public_id=None)
+
+        # Statuses are not created on the fly
+        self.assertEqual(change_status("submit").status_code, 404)
+        self.assertFalse(
+            ReservationStatus.objects.filter(name="Pending").exists()
+        )
+
+        # Draft reservation has to be submitted first
+        call_command("load_reservation_statuses", stdout=StringIO())
+        response = change_status("approve")
+        self.assertRedirects(
+            response,
+            reverse("user_display_profile"),
+            fetch_redirect_response=False
+        )
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)],
+            [MSG_STATUS_TRANSITION_NOT_ALLOWED.format("Draft", "Approved")]
+        )
+        reservation.refresh_from_db()
+        self.assertEqual(reservation.status.name, "Draft")
+
+        self.assertEqual(change_status("submit").status_code, 302)
+        reservation.refresh_from_db()
+        self.assertEqual(reservation.status.name, "Pending")
+
+        # Status changes are validated by model as well (e.g. in admin)
+        reservation.status = ReservationStatus.objects.get_by_name(
+            "Completed"
+        )
+        with self.assertRaises(ValidationError):
+            reservation.clean()
+        reservation.status = ReservationStatus.objects.get_by_name(
+            "Approved"
+        )
+        reservation.clean()
+
+    def test_reservation_status_transitions_graph(self) -> None:
+        # Compiled data is rolled back along with the test
+        self.addCleanup(transition_graph.clear)
+        self.addCleanup(reference_cache.clear)
+        call_command("load_reservation_statuses", stdout=StringIO())
+        draft, pending, approved = (
+            ReservationStatus.objects.get_by_name(name)
+            for name in ("Draft", "Pending", "Approved")
+        )
+
+        # Graph is compiled once and checked without queries
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(draft.can_change_to(pending))
+        with self.assertNumQueries(0):
+            self.assertFalse(draft.can_change_to(approved))
+            self.assertTrue(pending.can_change_to(approved))
+            self.assertTrue(approved.can_change_to(approved))
+
+        # And recompiled after any transitions change
+        with self.captureOnCommitCallbacks(execute=True):
+            draft.next_statuses.add(approved)
+            self.assertTrue(draft.can_change_to(approved))
+
+        # Changes made by other processes are picked up on expiration
+        ReservationStatus.next_statuses.through.objects.filter(
+            from_reservationstatus=draft, to_reservationstatus=approved
+        ).delete()
+        self.assertTrue(draft.can_change_to(approved))
+        with patch(
+            "core.transitions.monotonic",
+            return_value=monotonic() + settings.REFERENCE_CACHE_TIMEOUT
+        ):
+            self.assertFalse(draft.can_change_to(approved))
+
     def test_day_rates_created(self) -> None:
         """
 
@@ -161,3 +460,544 @@ class ListingTests(TestCase):
                 day_rate.price.amount,
                 100-index*20
             )
+
+    def test_listing_availability(self) -> None:
+        user = create_good_user()
+        start_date = date.today()
+        for index in range(3):
+            Reservation.objects.create(
+                listing=self.listing,
+                user=user,
+                check_in=start_date + relativedelta(weeks=index * 2),
+                check_out=start_date + relativedelta(
+                    weeks=index * 2, days=3
+                )
+            )
+
+        # Availability window size shouldn't affect queries count
+        for months in (1, 12):
+            end_date = start_date + relativedelta(months=months)
+            with self.assertNumQueries(1):
+                availability = self.listing.get_availability(
+                    start_date, end_date
+                )
+            self.assertEqual(
+                len(availability),
+                (end_date - start_date).days + 1
+            )
+
+        for index in range(3):
+            check_in = start_date + relativedelta(weeks=index * 2)
+            self.assertFalse(availability.get(check_in))
+            self.assertFalse(
+                availability.get(check_in + relativedelta(days=2))
+            )
+            # Check-out date is available for the next guests
+            self.assertTrue(
+                availability.get(check_in + relativedelta(days=3))
+            )
+
+    def test_benchmark_search_command(self) -> None:
+        output = StringIO()
+        with CaptureQueriesContext(connection) as queries:
+            call_command(
+                "benchmark_search",
+                seed_listings=3,
+                reservations_per_listing=20,
+                runs=3,
+                stdout=output
+            )
+        self.assertIn(
+            "seeded: 4 listings, 60 reservations", output.getvalue()
+        )
+
+        # Every run queries database (no results cache reuse)
+        search_queries = [
+            query for query in queries.captured_queries
+            if query["sql"].startswith('SELECT "listings_listing"')
+            and "LIMIT" in query["sql"]
+        ]
+        self.assertEqual(len(search_queries), 6)
+
+        for title in ("Range overlap (GiST)", "Plain dates anti-join (btree)"):
+            line = next(
+                line for line in output.getvalue().splitlines()
+                if line.startswith(title)
+            )
+            self.assertGreater(float(line.split(": ")[1].split()[0]), 0)
+
+    def test_listing_availability_bitmap(self) -> None:
+        user = create_good_user()
+        start_date = date.today()
+        end_date = start_date + relativedelta(months=2)
+        Reservation.objects.create(
+            listing=self.listing,
+            user=user,
+            check_in=start_date,
+            check_out=start_date + relativedelta(days=3)
+        )
+
+        makedirs(TEST_DIR, exist_ok=True)
+        with override_settings(
+            AVAILABILITY_BITMAP_PATH=str(TEST_DIR / "availability.bin")
+        ):
+            call_command("rebuild_availability_bitmap", stdout=StringIO())
+            self.listing.refresh_from_db()
+
+            # Bitmap answers without touching the database
+            with self.assertNumQueries(0):
+                availability = self.listing.get_availability(
+                    start_date, end_date
+                )
+            self.assertEqual(
+                availability,
+                build_availability(
+                    self.listing.get_reserved_intervals(
+                        start_date, end_date
+                    ),
+                    start_date,
+                    end_date
+                )
+            )
+
+            # Slot is not used for new version until it is refreshed
+            check_in = start_date + relativedelta(weeks=2)
+            with self.captureOnCommitCallbacks() as callbacks:
+                reservation = Reservation.objects.create(
+                    listing=self.listing,
+                    user=user,
+                    check_in=check_in,
+                    check_out=check_in + relativedelta(days=2)
+                )
+            self.listing.refresh_from_db()
+            with self.assertNumQueries(1):
+                self.assertFalse(self.listing.is_date_available(check_in))
+
+            # And follows reservation changes incrementally
+            for callback in callbacks:
+                callback()
+            with self.assertNumQueries(0):
+                self.assertFalse(self.listing.is_date_available(check_in))
+            self.assertTrue(
+                self.listing.is_date_available(
+                    reservation.check_out
+                )
+            )
+
+            with self.captureOnCommitCallbacks(execute=True):
+                reservation.delete()
+            self.listing.refresh_from_db()
+            with self.assertNumQueries(0):
+                self.assertTrue(self.listing.is_date_available(check_in))
+
+            # Dates beyond horizon are served by the database
+            far_date = start_date + relativedelta(years=5)
+            with self.assertNumQueries(1):
+                self.assertTrue(self.listing.is_date_available(far_date))
+
+    def test_listing_calendar(self) -> None:
+        # Both calendar months should be built from a single query
+        cache.clear()
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse(
+                    "listings:listing_calendar",
+                    args=[
+                        self.listing.slug,
+                        date.today().strftime("%Y%m")
+                    ]
+                )
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(
+            response,
+            "listings/includes/_calendar.html"
+        )
+
+    def test_listing_calendar_cache(self) -> None:
+        cache.clear()
+        url = reverse(
+            "listings:listing_calendar",
+            args=[self.listing.slug, date.today().strftime("%Y%m")]
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("no-cache", response.headers["Cache-Control"])
+        etag = response.headers["ETag"]
+
+        # Rendered months are served from cache
+        with self.assertNumQueries(1):
+            cached_response = self.client.get(url)
+        self.assertEqual(cached_response.content, response.content)
+
+        # And unchanged calendar is not transferred at all
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["ETag"], etag)
+
+        # Reservation changes calendar version
+        Reservation.objects.create(
+            listing=self.listing,
+            user=create_good_user(),
+            check_in=date.today(),
+            check_out=date.today() + relativedelta(days=2)
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.assertContains(response, " busy'>")
+
+    def test_listing_save_keeps_versions(self) -> None:
+        # Versions are bumped while listing instance is held...
+        Reservation.objects.create(
+            listing=self.listing,
+            user=create_good_user(),
+            check_in=date.today(),
+            check_out=date.today() + relativedelta(days=2)
+        )
+        PriceTag.objects.create(
+            listing=self.listing,
+            start_date=date.today(),
+            end_date=date.today() + relativedelta(days=6),
+            price=100
+        )
+
+        # ...so its ordinary save must not write stale values back
+        self.listing.title = "Renamed listing"
+        self.listing.save()
+        self.listing.refresh_from_db()
+        self.assertEqual(self.listing.title, "Renamed listing")
+        self.assertEqual(self.listing.availability_version, 1)
+        self.assertEqual(self.listing.pricing_version, 1)
+
+        self.listing.pricing_version = 0
+        self.listing.save(update_fields=["title", "pricing_version"])
+        self.listing.refresh_from_db()
+        self.assertEqual(self.listing.pricing_version, 1)
+
+    def test_reservation_changes_availability_version(self) -> None:
+        reservation = Reservation.objects.create(
+            listing=self.listing,
+            user=create_good_user(),
+            check_in=date.today(),
+            check_out=date.today() + relativedelta(days=2)
+        )
+        self.listing.refresh_from_db()
+        self.assertEqual(self.listing.availability_version, 1)
+
+        # Status or comment changes keep reserved nights intact...
+        call_command("load_reservation_statuses", stdout=StringIO())
+        reservation = Reservation.objects.get(pk=reservation.pk)
+        reservation.status = ReservationStatus.objects.get_by_name("Pending")
+        reservation.comment = "Late arrival"
+        reservation.save()
+        self.listing.refresh_from_db()
+        self.assertEqual(self.listing.availability_version, 1)
+
+        # ...unlike dates changes
+        reservation.check_out += relativedelta(days=1)
+        reservation.save()
+        self.listing.refresh_from_db()
+        self.assertEqual(self.listing.availability_version, 2)
+
+        # Moved reservation changes both listings
+        other_listing = Listing.objects.create(
+            title="Other listing", slug="other-listing"
+        )
+        reservation.listing = other_listing
+        reservation.save()
+        self.listing.refresh_from_db()
+        other_listing.refresh_from_db()
+        self.assertEqual(self.listing.availability_version, 3)
+        self.assertEqual(other_listing.availability_version, 1)
+
+        reservation.delete()
+        other_listing.refresh_from_db()
+        self.assertEqual(other_listing.availability_version, 2)
+
+    def test_listing_ical_feed(self) -> None:
+        user = create_good_user()
+        check_in = date.today() + relativedelta(days=1)
+        reservation = Reservation.objects.create(
+            listing=self.listing,
+            user=user,
+            check_in=check_in,
+            check_out=check_in + relativedelta(days=2)
+        )
+        url = reverse(
+            "listings:listing_ical_feed",
+            args=[self.listing.slug]
+        )
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        content = b"".join(response.streaming_content).decode()
+        self.assertIn("UID:{}".format(reservation.uuid), content)
+        self.assertIn(
+            "DTSTART;VALUE=DATE:{}".format(check_in.strftime("%Y%m%d")),
+            content
+        )
+        etag = response.headers["ETag"]
+
+        # Unchanged feed is not sent again
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # Deleted reservations change the feed as well
+        reservation.delete()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(
+            "BEGIN:VEVENT",
+            b"".join(response.streaming_content).decode()
+        )
+
+    def test_listing_ical_import(self) -> None:
+        user = create_good_user()
+        start_date = date.today()
+        Reservation.objects.create(
+            listing=self.listing,
+            user=user,
+            check_in=start_date + relativedelta(days=10),
+            check_out=start_date + relativedelta(days=12)
+        )
+
+        def event(uid: str, start: int, end: int) -> str:
+            return (
+                "BEGIN:VEVENT\r\nUID:{}\r\n"
+                "DTSTART;VALUE=DATE:{:%Y%m%d}\r\n"
+                "DTEND;VALUE=DATE:{:%Y%m%d}\r\n"
+                "SUMMARY:Blocked\r\nEND:VEVENT\r\n"
+            ).format(
+                uid,
+                start_date + relativedelta(days=start),
+                start_date + relativedelta(days=end)
+            )
+
+        makedirs(TEST_DIR, exist_ok=True)
+        source = TEST_DIR / "import.ics"
+        source.write_text(
+            "BEGIN:VCALENDAR\r\n"
+            + event("first", 1, 3)
+            # Overlaps the first event
+            + event("second", 2, 4)
+            # Overlaps existing reservation
+            + event("third", 11, 13)
+            + event("wrong", 20, 20)
+            + event("fourth", 12, 14)
+            + "END:VCALENDAR\r\n"
+        )
+
+        output = StringIO()
+        call_command(
+            "import_ics",
+            self.listing.slug,
+            str(source),
+            user=user.email,
+            stdout=output
+        )
+        self.assertIn(
+            "Reservations imported: 2, events skipped: 3",
+            output.getvalue()
+        )
+        self.assertEqual(
+            list(
+                Reservation.objects.filter(
+                    listing=self.listing
+                ).order_by(
+                    Reservation.Field.check_in
+                ).values_list(
+                    Reservation.Field.check_in,
+                    flat=True
+                )
+            ),
+            [
+                start_date + relativedelta(days=1),
+                start_date + relativedelta(days=10),
+                start_date + relativedelta(days=12)
+            ]
+        )
+        # Imported reservations are addressable by public ids
+        self.assertFalse(
+            Reservation.objects.filter(public_id__isnull=True).exists()
+        )
+
+    def test_import_price_tags_command(self) -> None:
+        makedirs(TEST_DIR, exist_ok=True)
+        source = TEST_DIR / "price_tags.json"
+        source.write_text(
+            dumps(
+                [
+                    {
+                        PriceTag.Field.listing: self.listing.slug,
+                        PriceTag.Field.start_date: "2030-01-01",
+                        PriceTag.Field.end_date: "2030-01-31",
+                        PriceTag.Field.price: "80.5",
+                        "currency": "USD"
+                    }
+                ]
+            )
+        )
+
+        output = StringIO()
+        call_command("import_price_tags", str(source), stdout=output)
+        self.assertIn("Price tags imported: 1", output.getvalue())
+
+        day_rates = DayRate.objects.filter(
+            listing=self.listing,
+            date__year=2030
+        )
+        self.assertEqual(day_rates.count(), 31)
+        self.assertEqual(day_rates.first().price, Money(80.5, "USD"))
+
+    def test_import_price_tags_conflict(self) -> None:
+        start_date = date.today() + relativedelta(years=1)
+        importer = PriceTagsImporter(
+            [
+                {
+                    PriceTag.Field.listing: self.listing.slug,
+                    PriceTag.Field.start_date: start_date,
+                    PriceTag.Field.end_date: start_date + relativedelta(
+                        days=9
+                    ),
+                    PriceTag.Field.price: 100
+                }
+            ]
+        )
+        self.assertTrue(importer.validate())
+
+        # Dates are taken between validation and saving
+        PriceTag.objects.create(
+            listing=self.listing,
+            start_date=start_date + relativedelta(days=5),
+            end_date=start_date + relativedelta(days=15),
+            price=100
+        )
+        self.assertEqual(importer.save(), [])
+        self.assertEqual(
+            importer.errors,
+            [
+                {
+                    "row": 0,
+                    "errors": {
+                        PriceTag.Field.start_date: [
+                            ERROR_MSG_PRICE_TAGS_CONFLICT
+                        ]
+                    }
+                }
+            ]
+        )
+        self.assertEqual(PriceTag.objects.count(), 1)
+
+    def test_day_rates_bulk_update(self) -> None:
+        # Price tag length shouldn't affect queries count
+        queries_count = list()
+        for index, days in enumerate((7, 365)):
+            start_date = date.today() + relativedelta(years=index)
+            with CaptureQueriesContext(connection) as queries:
+                PriceTag.objects.create(
+                    listing=self.listing,
+                    start_date=start_date,
+                    end_date=start_date + relativedelta(days=days - 1),
+                    price=100
+                )
+            queries_count.append(len(queries))
+            self.assertEqual(
+                DayRate.objects.filter(
+                    listing=self.listing,
+                    date__gte=start_date
+                ).count(),
+                days
+            )
+        self.assertEqual(queries_count[0], queries_count[1])
+
+        # Changed price tag range and price are applied to day rates
+        price_tag = PriceTag.objects.get(
+            listing=self.listing,
+            start_date=date.today()
+        )
+        price_tag.start_date = date.today() + relativedelta(days=2)
+        price_tag.end_date = date.today() + relativedelta(days=9)
+        price_tag.price = Money(80, settings.BASE_CURRENCY)
+        price_tag.save()
+
+        day_rates = price_tag.day_rates.order_by(DayRate.Field.date)
+        self.assertEqual(
+            [day_rate.date for day_rate in day_rates],
+            list(
+                daterange_generator(
+                    price_tag.start_date, price_tag.end_date
+                )
+            )
+        )
+        for day_rate in day_rates:
+            self.assertEqual(
+                day_rate.price,
+                Money(80, settings.BASE_CURRENCY)
+            )
+
+    def test_day_rates_taken_by_other_price_tag(self) -> None:
+        price_tag = PriceTag.objects.create(
+            listing=self.listing,
+            start_date=date.today(),
+            end_date=date.today() + relativedelta(days=9),
+            price=100
+        )
+
+        # Dates taken after the overlapping check keep their prices
+        new_price_tag = PriceTag(
+            listing=self.listing,
+            start_date=price_tag.end_date - relativedelta(days=1),
+            end_date=price_tag.end_date + relativedelta(days=9),
+            price=200
+        )
+        with patch.object(
+                PriceTag, "get_overlapping_dates", side_effect=[[], []]
+        ):
+            with self.assertRaises(ValueError):
+                with transaction.atomic():
+                    new_price_tag.save()
+        self.assertFalse(
+            DayRate.objects.filter(
+                listing=self.listing,
+                date__gt=price_tag.end_date
+            ).exists()
+        )
+        for day_rate in DayRate.objects.filter(listing=self.listing):
+            self.assertEqual(day_rate.price_tag_id, price_tag.id)
+            self.assertEqual(
+                day_rate.price,
+                Money(100, settings.BASE_CURRENCY)
+            )
+
+    def test_price_tag_overlapping_dates(self) -> None:
+        price_tag = PriceTag.objects.create(
+            listing=self.listing,
+            start_date=date.today(),
+            end_date=date.today() + relativedelta(months=6),
+            price=100
+        )
+
+        # Price tag shouldn't conflict with its own day rates
+        with self.assertNumQueries(1):
+            price_tag.clean()
+
+        # But conflicts with other price tags are found at once
+        new_price_tag = PriceTag(
+            listing=self.listing,
+            start_date=price_tag.end_date - relativedelta(days=1),
+            end_date=price_tag.end_date + relativedelta(months=6),
+            price=100
+        )
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                new_price_tag.get_overlapping_dates(),
+                [
+                    price_tag.end_date - relativedelta(days=1),
+                    price_tag.end_date
+                ]
+            )
+        with self.assertRaises(ValidationError):
+            new_price_tag.clean()
@@ -1,7 +1,7 @@
 from django.urls import path, include
 
 from .views import (
-    List, Details, Calendar,
+    List, Details, Calendar, ICalendarFeed,
     SubmitReservation, ApproveReservation, CancelReservation
 )
 
@@ -31,6 +31,11 @@ urlpatterns = [
         Calendar.as_view(),
         name="listing_calendar"
     ),
+    path(
+        "<slug:slug>/calendar.ics",
+        ICalendarFeed.as_view(),
+        name="listing_ical_feed"
+    ),
     path(
         "<slug:slug>",
         Details.as_view(),
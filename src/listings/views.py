@@ -3,20 +3,34 @@ from datetime import date
 from dateutil.relativedelta import relativedelta
 
 from django.conf import settings
+from django.contrib import messages
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Max, QuerySet
 from django.http import (
-    HttpRequest, HttpResponse,
+    HttpRequest, HttpResponse, StreamingHttpResponse,
     HttpResponseForbidden, Http404, HttpResponseRedirect
 )
 from django.shortcuts import render, redirect
 from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
 from django.views.generic import View, ListView
 
-from core.constants import MSG_WRONG_MONTH_FORMAT
-from core.utils.dates import AvailabilityCalendar
+from core.constants import (
+    MSG_STATUS_TRANSITION_NOT_ALLOWED, MSG_WRONG_MONTH_FORMAT
+)
+from core.utils.dates import AvailabilityCalendar, format_dates
 from core.models import BaseModel
+from core.utils.public_ids import get_public_id_filter
 
-from .constants import ERROR_MSG_UNKNOWN_LISTING
+from .constants import (
+    CALENDAR_CACHE_KEY,
+    ERROR_MSG_UNKNOWN_LISTING, ERROR_MSG_OVERLAPPING_DATES,
+    ERROR_MSG_UNKNOWN_STATUS
+)
 from .forms import ReservationForm
+from .ical import generate_calendar
 from .models import Listing, Reservation, ReservationStatus
 
 
@@ -31,6 +45,11 @@ class List(ListView):
     template_name = "listings/list.html"
     context_object_name = "listings"
 
+    def get_queryset(self) -> QuerySet:
+        return Listing.objects.get_previews().order_by(
+            BaseModel.Field.created_at
+        )
+
 
 class Details(View):
     """
@@ -40,34 +59,41 @@ class Details(View):
     model = Listing
     template_name = "listings/details.html"
 
-    def get(self, request: HttpRequest, slug: str) -> HttpResponse:
+    def get_listing(self, **lookup) -> Listing:
         """
-        Displays selected listing details in common with reservation form
-        :param request:
-        :param slug:
+        Loads listing with all the details displayed
+        :param lookup:
         :return:
         """
 
         try:
-            context: dict = {
-                "listing": self.model.objects.get(
-                    slug=slug
-                ),
-                "reservation_form": ReservationForm(),
-                "current_month": date.today().strftime("%Y%m")
-            }
-            return render(
-                request,
-                self.template_name,
-                context
-            )
+            return self.model.objects.get_details().get(**lookup)
         except Listing.DoesNotExist:
             raise Http404(
                 ERROR_MSG_UNKNOWN_LISTING.format(
-                    slug
+                    lookup.get(Listing.Field.slug)
                 )
             )
 
+    def get(self, request: HttpRequest, slug: str) -> HttpResponse:
+        """
+        Displays selected listing details in common with reservation form
+        :param request:
+        :param slug:
+        :return:
+        """
+
+        context: dict = {
+            "listing": self.get_listing(slug=slug),
+            "reservation_form": ReservationForm(),
+            "current_month": date.today().strftime("%Y%m")
+        }
+        return render(
+            request,
+            self.template_name,
+            context
+        )
+
     def post(self, request: HttpRequest, slug: str) -> HttpResponse:
         """
         Processing new listing reservation
@@ -77,7 +103,14 @@ class Details(View):
         :return:
         """
 
-        current_listing = self.model.objects.get(slug=slug)
+        try:
+            current_listing = self.model.objects.get(slug=slug)
+        except Listing.DoesNotExist:
+            raise Http404(
+                ERROR_MSG_UNKNOWN_LISTING.format(
+                    slug
+                )
+            )
         reservation_form = ReservationForm(
             request.POST
         )
@@ -86,19 +119,32 @@ class Details(View):
 
         # if form valid - save it and return to post page
         if reservation_form.is_valid():
-            reservation_form.save()
-            return HttpResponseRedirect(
-                reverse(
-                    "listings:listing_details",
-                    args=[
-                        slug
-                    ]
+            try:
+                with transaction.atomic():
+                    reservation_form.save()
+            except IntegrityError:
+                # Concurrent reservation took (some of) these dates
+                reservation_form.add_error(
+                    None,
+                    ERROR_MSG_OVERLAPPING_DATES.format(
+                        format_dates(
+                            reservation_form.instance.get_overlapping_dates()
+                        )
+                    )
+                )
+            else:
+                return HttpResponseRedirect(
+                    reverse(
+                        "listings:listing_details",
+                        args=[
+                            slug
+                        ]
+                    )
                 )
-            )
 
         # if form isn't valid - reload post page with form errors included
         context = {
-            "listing": current_listing,
+            "listing": self.get_listing(pk=current_listing.pk),
             "reservation_form": reservation_form,
             "current_month": date.today().strftime("%Y%m")
         }
@@ -137,7 +183,7 @@ class Calendar(View):
             )
 
         try:
-            base_year, base_month = int(month[:4]), int(month[4:])
+            first_day = date(int(month[:4]), int(month[4:]), 1)
         except ValueError:
             return render(
                 request,
@@ -147,41 +193,144 @@ class Calendar(View):
                  }
                 )
 
-        cal = AvailabilityCalendar(
-            firstweekday=MONDAY,
-            availability_data=listing.get_availability(
-                date(base_year, base_month, 1),
-                date(base_year, base_month, 1) + relativedelta(months=1)
-            ),
-            use_bootstrap=True
+        # Unchanged calendar can be revalidated without rendering
+        etag = quote_etag(
+            "{}-{}-{}".format(
+                listing.id, listing.availability_version, month
+            )
         )
-        current_data = cal.formatmonth(base_year, base_month)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = render(
+                request,
+                self.template_name,
+                self.get_calendars(listing, first_day)
+            )
+        response.headers["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
 
-        if base_month == 12:
-            base_year += 1
-            base_month = 1
-        else:
-            base_month += 1
+    @staticmethod
+    def get_calendars(listing: Listing, first_day: date) -> dict:
+        """
+        Returns both displayed months HTML, rendered months are cached
+        until listing availability version changes
+        :param listing:
+        :param first_day:
+        :return:
+        """
 
+        next_month = first_day + relativedelta(months=1)
+        keys: dict = {
+            "current_calendar": CALENDAR_CACHE_KEY.format(
+                listing.id, listing.availability_version, first_day
+            ),
+            "next_calendar": CALENDAR_CACHE_KEY.format(
+                listing.id, listing.availability_version, next_month
+            )
+        }
+        cached = cache.get_many(keys.values())
+        if len(cached) == len(keys):
+            return {
+                name: cached[key]
+                for name, key in keys.items()
+            }
+
+        # Load availability for both months displayed at once
         cal = AvailabilityCalendar(
             firstweekday=MONDAY,
             availability_data=listing.get_availability(
-                date(base_year, base_month, 1),
-                date(base_year, base_month, 1) + relativedelta(months=1)
+                first_day,
+                first_day + relativedelta(months=2)
             ),
             use_bootstrap=True
         )
-        next_data = cal.formatmonth(base_year, base_month)
-
         context: dict = {
-            "current_calendar": current_data,
-            "next_calendar": next_data
+            "current_calendar": cal.formatmonth(
+                first_day.year, first_day.month
+            ),
+            "next_calendar": cal.formatmonth(
+                next_month.year, next_month.month
+            )
         }
-        return render(
-            request,
-            self.template_name,
-            context
+        cache.set_many(
+            {
+                keys[name]: calendar_html
+                for name, calendar_html in context.items()
+            },
+            settings.CALENDAR_CACHE_TIMEOUT
         )
+        return context
+
+
+class ICalendarFeed(View):
+    """
+    Streams single listing reservations as iCalendar feed
+    for external channels synchronization
+    """
+
+    model = Listing
+
+    def get(self, request: HttpRequest, slug: str) -> HttpResponse:
+        """
+        Sends current and upcoming reservations (unless feed
+        didn't change since the previous request)
+        :param request:
+        :param slug:
+        :return:
+        """
+
+        try:
+            listing = self.model.objects.get(slug=slug)
+        except Listing.DoesNotExist:
+            raise Http404(
+                ERROR_MSG_UNKNOWN_LISTING.format(
+                    slug
+                )
+            )
+
+        today = date.today()
+        reservations = Reservation.objects.filter(
+            listing=listing,
+            check_out__gt=today
+        )
+
+        # Any reservation change either touches its updated_at
+        # or (on deletion) bumps listing availability version
+        last_change = reservations.aggregate(
+            last_change=Max(BaseModel.Field.updated_at)
+        ).get("last_change")
+        etag = quote_etag(
+            "{}-{}-{}-{}".format(
+                listing.id,
+                listing.availability_version,
+                last_change.timestamp() if last_change else 0,
+                today.strftime("%Y%m%d")
+            )
+        )
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = StreamingHttpResponse(
+                generate_calendar(
+                    listing.title,
+                    reservations.order_by(
+                        Reservation.Field.check_in
+                    ).values_list(
+                        BaseModel.Field.uuid,
+                        Reservation.Field.check_in,
+                        Reservation.Field.check_out,
+                        BaseModel.Field.updated_at
+                    ).iterator()
+                ),
+                content_type="text/calendar; charset=utf-8"
+            )
+            response.headers["Content-Disposition"] = (
+                'inline; filename="{}.ics"'.format(listing.slug)
+            )
+        response.headers["ETag"] = etag
+        patch_cache_control(response, no_cache=True)
+        return response
 
 
 class UpdateReservation(View):
@@ -189,6 +338,7 @@ class UpdateReservation(View):
     Performs operations with single reservation object defined by its public ID
     """
     ACTION = ""
+    STATUS = ""
 
     def get(self, request: HttpRequest, public_id: str) -> HttpResponse:
         """
@@ -199,27 +349,38 @@ class UpdateReservation(View):
         """
 
         try:
-            reservation = Reservation.objects.get(
-                        id=settings.FF3_CIPHER.decrypt(public_id)
-                )
+            reservation = Reservation.objects.select_related(
+                Reservation.Field.status
+            ).get(
+                get_public_id_filter(public_id)
+            )
         except Reservation.DoesNotExist:
             raise Http404
 
         if not reservation.user == self.request.user:
             return HttpResponseForbidden()
 
-        if self.ACTION == "submit":
-            reservation.status, _ = ReservationStatus.objects.get_or_create(
-                name="Pending"
-            )
-        elif self.ACTION == "approve":
-            reservation.status, _ = ReservationStatus.objects.get_or_create(
-                name="Approved"
-            )
-        elif self.ACTION == "cancel":
-            reservation.status, _ = ReservationStatus.objects.get_or_create(
-                name="Cancelled"
+        # Statuses (and transitions between them) are loaded
+        # by load_reservation_statuses command
+        try:
+            status = ReservationStatus.objects.get_by_name(self.STATUS)
+        except ReservationStatus.DoesNotExist:
+            raise Http404(ERROR_MSG_UNKNOWN_STATUS.format(self.STATUS))
+
+        # Only transitions defined by statuses graph are allowed
+        if not reservation.status.can_change_to(status):
+            messages.error(
+                request,
+                MSG_STATUS_TRANSITION_NOT_ALLOWED.format(
+                    reservation.status, status
+                )
             )
+            return redirect("user_display_profile")
+
+        reservation.status = status
+        if self.ACTION == "submit":
+            # Fix the cost guest is submitting for
+            reservation.update_cost()
 
         reservation.save()
 
@@ -231,6 +392,7 @@ class SubmitReservation(UpdateReservation):
     Performs operations with single reservation object defined by its public ID
     """
     ACTION = "submit"
+    STATUS = "Pending"
 
 
 class ApproveReservation(UpdateReservation):
@@ -238,6 +400,7 @@ class ApproveReservation(UpdateReservation):
     Performs operations with single reservation object defined by its public ID
     """
     ACTION = "approve"
+    STATUS = "Approved"
 
 
 class CancelReservation(UpdateReservation):
@@ -245,3 +408,4 @@ class CancelReservation(UpdateReservation):
     Performs operations with single reservation object defined by its public ID
     """
     ACTION = "cancel"
+    STATUS = "Cancelled"
@@ -126,3 +126,28 @@ def create_good_reservation(listing: Listing, user: User) -> Reservation:
         user=user,
         **good_reservation
     )
+
+
+def create_listings_with_covers(
+        listing: Listing, count: int
+) -> list[Listing]:
+    # Clone listing (sharing its cover photo file) in bulk
+    cover_photo = listing.photos.get(is_cover=True)
+    listings = Listing.objects.bulk_create(
+        Listing(
+            title="{} {}".format(listing.title, index),
+            slug="{}-{}".format(listing.slug, index),
+            object_type=listing.object_type
+        )
+        for index in range(count)
+    )
+    Photo.objects.bulk_create(
+        Photo(
+            index=0,
+            listing=clone,
+            file=cover_photo.file.name,
+            is_cover=True
+        )
+        for clone in listings
+    )
+    return listings
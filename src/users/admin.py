@@ -62,6 +62,7 @@ class UsersAdmin(UserAdmin):
                 "fields": (
                     User.Field.email,
                     User.Field.password,
+                    User.Field.public_id
                 )
             }
         ),
@@ -92,9 +93,15 @@ class UsersAdmin(UserAdmin):
     )
 
     readonly_fields = [
+        User.Field.public_id,
         User.Field.date_joined,
         User.Field.last_login
     ]
 
+    search_fields = (
+        User.Field.email,
+        User.Field.public_id
+    )
+
 
 site.register(User, UsersAdmin)
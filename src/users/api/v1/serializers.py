@@ -1,7 +1,4 @@
-from os.path import splitext, exists
-
 from django.contrib.auth import get_user_model
-from django.conf import settings
 from django.core.exceptions import ValidationError as DjangoValidationError
 
 from rest_framework.request import Request
@@ -15,8 +12,7 @@ from rest_framework.serializers import (
 from ...constants import (
     ERROR_MSG_DUPLICATE_MAIL,
     ERROR_MSG_DIFFERENT_PASSWORDS,
-    ERROR_ALLAUTH_NOT_INSTALLED,
-    AVATAR_DIMENSIONS
+    ERROR_ALLAUTH_NOT_INSTALLED
 )
 
 from ...models import Profile
@@ -178,22 +174,7 @@ class ProfilesList(ModelSerializer):
     photo: SerializerMethodField = SerializerMethodField("get_photo")
 
     def get_photo(self, obj: Profile) -> dict:
-        sizes = dict()
-        file_name, file_extension = splitext(str(obj.photo))
-        if file_name:
-            for size in AVATAR_DIMENSIONS:
-                dimensions = "{}x{}".format(*AVATAR_DIMENSIONS.get(size))
-                full_path = settings.MEDIA_ROOT.joinpath(
-                    "{}_{}{}".format(file_name, dimensions, file_extension)
-                )
-                if exists(full_path):
-                    sizes[size] = "{}{}_{}{}".format(
-                        settings.MEDIA_URL,
-                        file_name,
-                        dimensions,
-                        file_extension
-                    )
-        return sizes
+        return obj.get_avatar_urls()
 
     class Meta:
         """
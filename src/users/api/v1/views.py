@@ -1,5 +1,4 @@
 from django.contrib.auth import get_user_model
-from django.conf import settings
 from django.http import Http404
 
 from rest_framework.exceptions import MethodNotAllowed
@@ -17,6 +16,8 @@ from rest_framework.status import (
     HTTP_422_UNPROCESSABLE_ENTITY
 )
 
+from core.utils.public_ids import get_public_id_filter
+
 from ...constants import USERS_ORDERING
 from ...models import Profile
 
@@ -74,7 +75,9 @@ class Profiles(ListAPIView):
     permission_classes = [IsAdminUser]
 
     def get_queryset(self):
-        return Profile.objects.all().order_by(
+        return Profile.objects.select_related(
+            Profile.Field.user
+        ).order_by(
             USERS_ORDERING
         )
 
@@ -107,12 +110,9 @@ class DisplayProfile(ProfileDetails):
             User.Field.public_id
         )
         if public_id:
-            user_id = settings.FF3_CIPHER.decrypt(
-                public_id
-            )
             try:
                 profile = User.objects.get(
-                    id=user_id
+                    get_public_id_filter(public_id)
                 ).profile
             except User.DoesNotExist:
                 raise Http404
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 13:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_public_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='photo_hash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64, verbose_name='Photo hash'),
+        ),
+    ]
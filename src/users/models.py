@@ -1,3 +1,5 @@
+from hashlib import sha256
+
 from django.conf import settings
 from django.contrib.auth.models import (
     AbstractBaseUser, PermissionsMixin
@@ -14,7 +16,7 @@ from django.utils.translation import gettext_lazy as _
 from phonenumber_field.modelfields import PhoneNumberField
 
 from core.models import BaseModel
-from core.utils.images import create_thumbnails
+from core.utils.images import get_thumbnail_name, process_image
 
 from .constants import AVATAR_DIMENSIONS
 from .managers import UserManager
@@ -118,6 +120,7 @@ class Profile(BaseModel):
         phone: str = "phone"
         bio: str = "bio"
         photo: str = "photo"
+        photo_hash: str = "photo_hash"
         reservations_count: str = "reservations_count"
 
     user: OneToOneField = OneToOneField(
@@ -163,6 +166,63 @@ class Profile(BaseModel):
         upload_to=upload_path
     )
 
+    # Uploaded photo content digest (same photo is never processed twice)
+    photo_hash: CharField = CharField(
+        null=False,
+        blank=True,
+        default="",
+        max_length=64,
+        editable=False,
+        verbose_name=_("Photo hash")
+    )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.track_photo()
+        return instance
+
+    def track_photo(self) -> None:
+        # Stored photo name (deferred photo is never tracked)
+        if Profile.Field.photo in self.__dict__:
+            self._stored_photo_name = self.photo.name
+
+    def get_photo_hash(self) -> str:
+        photo_hash = sha256()
+        for chunk in self.photo.chunks():
+            photo_hash.update(chunk)
+        return photo_hash.hexdigest()
+
+    def get_avatar_url(self, size: str) -> str:
+        """
+        Returns avatar thumbnail url for one of AVATAR_DIMENSIONS
+        (original photo one until thumbnail is created)
+        :param size:
+        :return:
+        """
+
+        thumbnail_name = get_thumbnail_name(
+            self.photo.name,
+            *AVATAR_DIMENSIONS.get(size),
+            settings.IMAGE_FORMAT
+        )
+        if self.photo.storage.exists(thumbnail_name):
+            return self.photo.storage.url(thumbnail_name)
+        return self.photo.url
+
+    def get_avatar_urls(self) -> dict:
+        if not self.photo:
+            return dict()
+        return {
+            size: self.get_avatar_url(size) for size in AVATAR_DIMENSIONS
+        }
+
+    def avatar_small(self) -> str:
+        return self.get_avatar_url("small")
+
+    def avatar_medium(self) -> str:
+        return self.get_avatar_url("medium")
+
     def full_name(self) -> str:
         """
         Return the first_name plus the last_name, with a space in between.
@@ -189,19 +249,31 @@ class Profile(BaseModel):
              *args: list,
              **kwargs: dict
              ) -> None:
+        process_photo = False
+        if not self.photo:
+            self.photo_hash = ""
+        elif not self.photo._committed:
+            # New photo uploaded: compare it with stored one
+            photo_hash = self.get_photo_hash()
+            stored_photo_name = getattr(self, "_stored_photo_name", None)
+            if photo_hash == self.photo_hash and stored_photo_name:
+                # Same picture: keep stored file along with its thumbnails
+                self.photo = stored_photo_name
+            else:
+                self.photo_hash = photo_hash
+                process_photo = True
+
         # Save original to database and obtain it's storage name
         super().save(*args, **kwargs)
-
-        if self.photo:
-            # Perform necessary routines (resize)
-            for size in AVATAR_DIMENSIONS:
-                create_thumbnails(
-                    settings.MEDIA_ROOT.joinpath(
-                        self.photo.name
-                    ),
-                    *AVATAR_DIMENSIONS.get(size),
-                    settings.IMAGE_FORMAT
-                )
+        self.track_photo()
+
+        if process_photo:
+            # Build avatar thumbnails out of request
+            process_image.delay(
+                self.photo.path,
+                list(AVATAR_DIMENSIONS.values()),
+                settings.IMAGE_FORMAT
+            )
 
     def reservations_count(self):
         return self.user.reservations.count()
@@ -1,9 +1,11 @@
 from os import mkdir
 from os.path import exists
 from shutil import rmtree
+from unittest.mock import patch
 
 from PIL import Image
 
+from django.conf import settings
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase, override_settings
 from django.urls import reverse
@@ -14,6 +16,9 @@ from tests.objects import (
     create_good_reservation
 )
 
+from core.utils.images import process_image
+
+from ..constants import AVATAR_DIMENSIONS
 from ..models import Profile
 from ..tests import email
 
@@ -23,12 +28,16 @@ class ProfileTest(TestCase):
     Test user signup process
     """
 
-    def upload_photo(self, profile: Profile) -> None:
+    def upload_photo(
+            self,
+            profile: Profile,
+            color: tuple = (155, 0, 0)
+    ) -> None:
         # prepare test image to upload
         image = Image.new(
             "RGB",
             size=(2000, 2000),
-            color=(155, 0, 0)
+            color=color
         )
 
         if not exists(TEST_DIR):
@@ -96,6 +105,69 @@ class ProfileTest(TestCase):
 
         self.assertIsNotNone(profile.photo)
 
+    @override_settings(MEDIA_ROOT=TEST_DIR)
+    @patch("users.models.process_image.delay")
+    def test_profile_photo_processing(self, patched_delay) -> None:
+        """
+        Check avatar thumbnails are built for new photos only
+        :return:
+        """
+
+        profile = create_good_user().profile
+        self.upload_photo(profile)
+        profile.save()
+
+        patched_delay.assert_called_once_with(
+            profile.photo.path,
+            list(AVATAR_DIMENSIONS.values()),
+            settings.IMAGE_FORMAT
+        )
+        self.assertEqual(len(profile.photo_hash), 64)
+
+        # Other profile data changes
+        profile = Profile.objects.get(id=profile.id)
+        profile.bio = "New bio"
+        profile.save()
+        self.assertEqual(patched_delay.call_count, 1)
+
+        # The same photo uploaded once again keeps stored one
+        photo_name = profile.photo.name
+        self.upload_photo(profile)
+        profile.save()
+        self.assertEqual(profile.photo.name, photo_name)
+        self.assertEqual(patched_delay.call_count, 1)
+
+        # Another photo
+        self.upload_photo(profile, color=(0, 155, 0))
+        profile.save()
+        self.assertNotEqual(profile.photo.name, photo_name)
+        self.assertEqual(patched_delay.call_count, 2)
+
+    @override_settings(MEDIA_ROOT=TEST_DIR)
+    @patch("users.models.process_image.delay")
+    def test_profile_avatar_urls(self, patched_delay) -> None:
+        """
+        Check sized avatar urls
+        :return:
+        """
+
+        profile = create_good_user().profile
+        self.assertEqual(profile.get_avatar_urls(), {})
+
+        self.upload_photo(profile)
+        profile.save()
+
+        # Original photo is served until thumbnails are ready
+        self.assertEqual(profile.avatar_small(), profile.photo.url)
+
+        process_image(*patched_delay.call_args.args)
+        for size, (width, height) in AVATAR_DIMENSIONS.items():
+            self.assertTrue(
+                profile.get_avatar_urls().get(size).endswith(
+                    "_{}x{}.{}".format(width, height, settings.IMAGE_FORMAT)
+                )
+            )
+
     @override_settings(MEDIA_ROOT=TEST_DIR)
     def test_display_profile(self) -> None:
         """